@@ -9,6 +9,7 @@ import json
 import typing as t
 from base64 import b64decode, b64encode
 
+from ellar.common.helper.json_decoder import decode_json
 from ellar.core import Config
 from ellar.di import injectable
 from itsdangerous import BadSignature
@@ -74,7 +75,9 @@ class SessionClientStrategy(ISessionStrategy):
             data = session_data.encode("utf-8")
             try:
                 data = self._signer.unsign(data, max_age=self._session_config.MAX_AGE)
-                return SessionCookieObject(json.loads(b64decode(data)))
+                return SessionCookieObject(
+                    decode_json(b64decode(data), self.config.JSON_DECODER)
+                )
             except BadSignature:
                 pass
 
@@ -1,13 +1,14 @@
 import typing as t
 
 from .commands import EllarTyper, command
-from .datastructures import UploadFile
+from .datastructures import UploadFile, UploadFileChunks
 from .decorators import (
     Controller,
     Module,
     UseGuards,
     UseInterceptors,
     Version,
+    etag,
     exception_handler,
     extra_args,
     file,
@@ -71,6 +72,7 @@ from .params.decorators import (
 from .params.params import ParamFieldInfo as Param
 from .params.params import ParamTypes
 from .responses import (
+    FastJSONResponse,
     FileResponse,
     HTMLResponse,
     JSONResponse,
@@ -150,14 +152,17 @@ __all__ = [
     "middleware",
     "exception_handler",
     "serializer_filter",
+    "etag",
     "template_filter",
     "template_global",
     "UploadFile",
+    "UploadFileChunks",
     "file",
     "extra_args",
     "JSONResponse",
     "UJSONResponse",
     "ORJSONResponse",
+    "FastJSONResponse",
     "StreamingResponse",
     "HTMLResponse",
     "FileResponse",
@@ -32,6 +32,7 @@ ELLAR_CONFIG_MODULE = "ELLAR_CONFIG_MODULE"
 
 
 SERIALIZER_FILTER_KEY = "SERIALIZER_FILTER"
+ETAG_OPTIONS_KEY = "ETAG_OPTIONS"
 VERSIONING_KEY = "ROUTE_VERSIONING"
 GUARDS_KEY = "ROUTE_GUARDS"
 EXTRA_ROUTE_ARGS_KEY = "EXTRA_ROUTE_ARGS"
@@ -32,6 +32,7 @@ __all__ = [
     "Headers",
     "QueryParams",
     "UploadFile",
+    "UploadFileChunks",
     "URLPath",
     "State",
 ]
@@ -49,3 +50,46 @@ class UploadFile(StarletteUploadFile):
         if not isinstance(v, StarletteUploadFile):
             raise ValueError(f"Expected UploadFile, received: {type(v)}")
         return v
+
+
+class UploadFileChunks(t.AsyncIterator[bytes]):
+    """
+    Async iterator over an uploaded file content, read `chunk_size` bytes at a time.
+    Annotate a `File()` parameter with it to consume an upload without loading it in memory.
+    """
+
+    chunk_size: int = 64 * 1024
+
+    def __init__(self, upload_file: StarletteUploadFile) -> None:
+        self.upload_file = upload_file
+
+    @property
+    def filename(self) -> t.Optional[str]:
+        return self.upload_file.filename
+
+    @property
+    def content_type(self) -> t.Optional[str]:
+        return self.upload_file.content_type
+
+    def __aiter__(self) -> "UploadFileChunks":
+        return self
+
+    async def __anext__(self) -> bytes:
+        chunk = await self.upload_file.read(self.chunk_size)
+        if not chunk:
+            raise StopAsyncIteration
+        return chunk
+
+    @classmethod
+    def __get_validators__(
+        cls: t.Type["UploadFileChunks"],
+    ) -> t.Iterable[t.Callable[..., t.Any]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls: t.Type["UploadFileChunks"], v: t.Any) -> t.Any:
+        if isinstance(v, cls):
+            return v
+        if not isinstance(v, StarletteUploadFile):
+            raise ValueError(f"Expected UploadFile, received: {type(v)}")
+        return cls(v)
@@ -2,6 +2,7 @@ import typing as t
 
 from .base import set_metadata
 from .controller import Controller
+from .etag import etag
 from .exception import exception_handler
 from .extra_args import extra_args
 from .file import file
@@ -15,6 +16,7 @@ from .versioning import Version
 
 __all__ = [
     "serializer_filter",
+    "etag",
     "Controller",
     "Version",
     "UseGuards",
@@ -0,0 +1,33 @@
+import typing as t
+from datetime import datetime
+
+from ellar.common.constants import ETAG_OPTIONS_KEY
+from ellar.common.interfaces import IExecutionContext
+from ellar.common.responses.models.conditional import ETagOptions
+
+from .base import set_metadata as set_meta
+
+
+def etag(
+    version: t.Optional[t.Callable[[IExecutionContext, t.Any], t.Any]] = None,
+    *,
+    last_modified: t.Optional[
+        t.Callable[[IExecutionContext, t.Any], t.Optional[datetime]]
+    ] = None,
+    weak: bool = False,
+) -> t.Callable:
+    """
+    ========= ROUTE FUNCTION DECORATOR ==============
+
+    sets `ETag` and `Last-Modified` headers on JSON responses
+    and answers `If-None-Match` and `If-Modified-Since` requests with `304 Not Modified`
+    :param version: returns the version of the handler output, hashed to an ETag.
+    When None, the ETag is a hash of the response body, computed after serialization
+    :param last_modified: returns the last modification datetime of the handler output
+    :param weak: makes the ETag weak
+    :return:
+    """
+    return set_meta(
+        ETAG_OPTIONS_KEY,
+        ETagOptions(version=version, last_modified=last_modified, weak=weak),
+    )
@@ -0,0 +1,163 @@
+import tempfile
+import typing as t
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import FormData, Headers, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from starlette.requests import Request
+
+__all__ = [
+    "MultiPartLimits",
+    "MultiPartSizeError",
+    "StreamingMultiPartParser",
+    "parse_multipart_form",
+    "get_upload_file_path",
+]
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class MultiPartLimits(t.NamedTuple):
+    """
+    Size limits, in bytes, applied while a multipart body is parsed. `None` disables a limit.
+    """
+
+    # whole request body
+    max_request_size: t.Optional[int] = None
+    # each uploaded file
+    max_file_size: t.Optional[int] = None
+    # each non-file field
+    max_field_size: t.Optional[int] = None
+    # size above which uploaded files are written to disk instead of kept in memory
+    spool_max_size: int = 1024 * 1024
+
+
+class MultiPartSizeError(MultiPartException):
+    pass
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    """
+    `MultiPartParser` that enforces `MultiPartLimits` while the body is received,
+    so oversized requests are rejected without reading the rest of the body.
+    """
+
+    def __init__(
+        self,
+        headers: Headers,
+        stream: t.AsyncGenerator[bytes, None],
+        *,
+        limits: MultiPartLimits,
+        max_files: t.Union[int, float] = 1000,
+        max_fields: t.Union[int, float] = 1000,
+    ) -> None:
+        self.limits = limits
+        self._received_size = 0
+        self._current_part_size = 0
+        super().__init__(
+            headers,
+            self._limit_stream(stream),
+            max_files=max_files,
+            max_fields=max_fields,
+        )
+        # `MultiPartParser.max_file_size` is the spool size of uploaded files
+        self.max_file_size = limits.spool_max_size
+
+    @classmethod
+    def check_content_length(cls, headers: Headers, limits: MultiPartLimits) -> None:
+        """Rejects a request declaring a body larger than `limits.max_request_size`"""
+        content_length = headers.get("content-length")
+        if (
+            limits.max_request_size is not None
+            and content_length
+            and content_length.isdigit()
+            and int(content_length) > limits.max_request_size
+        ):
+            raise MultiPartSizeError(
+                f"Request body exceeds the maximum size of {limits.max_request_size} bytes."
+            )
+
+    async def _limit_stream(
+        self, stream: t.AsyncGenerator[bytes, None]
+    ) -> t.AsyncGenerator[bytes, None]:
+        max_request_size = self.limits.max_request_size
+        async for chunk in stream:
+            self._received_size += len(chunk)
+            if max_request_size is not None and self._received_size > max_request_size:
+                raise MultiPartSizeError(
+                    f"Request body exceeds the maximum size of {max_request_size} bytes."
+                )
+            yield chunk
+
+    def on_part_begin(self) -> None:
+        super().on_part_begin()
+        self._current_part_size = 0
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        self._current_part_size += end - start
+        if self._current_part.file is None:
+            max_size, kind = self.limits.max_field_size, "Field"
+        else:
+            max_size, kind = self.limits.max_file_size, "File"
+
+        if max_size is not None and self._current_part_size > max_size:
+            raise MultiPartSizeError(
+                f"{kind} '{self._current_part.field_name}' exceeds "
+                f"the maximum size of {max_size} bytes."
+            )
+        super().on_part_data(data, start, end)
+
+
+async def parse_multipart_form(
+    request: "Request",
+    limits: MultiPartLimits,
+    *,
+    max_files: t.Union[int, float] = 1000,
+    max_fields: t.Union[int, float] = 1000,
+) -> FormData:
+    """
+    Parses a `multipart/form-data` request body with `StreamingMultiPartParser`.
+    The form is kept on the request, like `request.form()` does, so it is parsed once
+    and closed with the request.
+    """
+    form = getattr(request, "_form", None)
+    if form is None:
+        StreamingMultiPartParser.check_content_length(request.headers, limits)
+        parser = StreamingMultiPartParser(
+            request.headers,
+            request.stream(),
+            limits=limits,
+            max_files=max_files,
+            max_fields=max_fields,
+        )
+        form = await parser.parse()
+        request._form = form
+    return t.cast(FormData, form)
+
+
+def _copy_to_named_temporary_file(upload_file: UploadFile) -> t.BinaryIO:
+    named_file = t.cast(t.BinaryIO, tempfile.NamedTemporaryFile())
+    upload_file.file.seek(0)
+    chunk = upload_file.file.read(_COPY_CHUNK_SIZE)
+    while chunk:
+        named_file.write(chunk)
+        chunk = upload_file.file.read(_COPY_CHUNK_SIZE)
+    named_file.flush()
+    named_file.seek(0)
+    return named_file
+
+
+async def get_upload_file_path(upload_file: UploadFile) -> str:
+    """
+    Returns a path to the uploaded file content on disk.
+    The content is moved to a named temporary file that is deleted when the upload file is closed.
+    """
+    name = getattr(upload_file.file, "name", None)
+    if not isinstance(name, str):
+        named_file = await run_in_threadpool(_copy_to_named_temporary_file, upload_file)
+        await upload_file.close()
+        upload_file.file = named_file
+        name = named_file.name
+    return name
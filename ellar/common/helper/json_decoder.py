@@ -0,0 +1,33 @@
+import json
+import typing as t
+
+__all__ = ["JSONDecoder", "decode_json"]
+
+# `orjson.loads`, `ujson.loads` or `json.loads` style callable
+JSONDecoder = t.Callable[[t.Union[str, bytes]], t.Any]
+
+
+def decode_json(
+    data: t.Union[str, bytes], decoder: t.Optional[JSONDecoder] = None
+) -> t.Any:
+    """
+    Decodes `data` with `decoder`, `json.loads` when not set.
+
+    Decoders raising `ValueError`s without a position, like ujson,
+    are reported as `json.JSONDecodeError` with the position found by `json.loads`.
+    """
+    if decoder is None or decoder is json.loads:
+        return json.loads(data)
+
+    try:
+        return decoder(data)
+    except json.JSONDecodeError:
+        raise
+    except ValueError as ex:
+        try:
+            json.loads(data)
+        except json.JSONDecodeError as json_ex:
+            raise json_ex from ex
+
+        document = data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+        raise json.JSONDecodeError(str(ex), document, 0) from ex
@@ -0,0 +1,60 @@
+import functools
+import re
+import typing as t
+
+__all__ = ["MediaType", "parse_media_type"]
+
+_PARAM_REGEX = re.compile(
+    r';\s*([^\s;=]+)\s*(?:=\s*("(?:[^"\\]|\\.)*"|[^;]*))?', re.ASCII
+)
+_ESCAPE_REGEX = re.compile(r"\\(.)")
+
+
+class MediaType(t.NamedTuple):
+    """
+    Parsed media type header value, like `Content-Type` or `Accept`.
+    Follows `email.message.Message` parsing:
+    types and parameter names are lower cased and an invalid type is read as `text/plain`.
+    """
+
+    maintype: str
+    subtype: str
+    params: t.Tuple[t.Tuple[str, str], ...]
+
+    @property
+    def content_type(self) -> str:
+        return f"{self.maintype}/{self.subtype}"
+
+    def get_param(self, name: str, default: t.Optional[str] = None) -> t.Optional[str]:
+        for key, value in self.params:
+            if key == name:
+                return value
+        return default
+
+    def is_json(self) -> bool:
+        return self.maintype == "application" and (
+            self.subtype == "json" or self.subtype.endswith("+json")
+        )
+
+
+@functools.lru_cache(maxsize=512)
+def parse_media_type(value: str) -> MediaType:
+    """Parses a media type header value. Results are cached by raw value."""
+    content_type = value.partition(";")[0].strip().lower()
+    maintype, subtype = "text", "plain"
+    if content_type.count("/") == 1:
+        maintype, subtype = content_type.split("/")
+
+    params = []
+    for idx, match in enumerate(_PARAM_REGEX.finditer(";" + value)):
+        name, param_value = match.group(1), match.group(2)
+        if param_value is None:
+            if idx > 0:
+                params.append((name, ""))
+            continue
+
+        param_value = param_value.strip()
+        if len(param_value) > 1 and param_value[0] == param_value[-1] == '"':
+            param_value = _ESCAPE_REGEX.sub(r"\1", param_value[1:-1])
+        params.append((name.lower(), param_value))
+    return MediaType(maintype, subtype, tuple(params))
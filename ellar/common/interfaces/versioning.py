@@ -9,6 +9,13 @@ class IAPIVersioningResolver(ABC):
     def can_activate(self, route_versions: t.Set[t.Union[int, float, str]]) -> bool:
         """Validate Version routes"""
 
+    def get_route_table_key(self) -> t.Optional[t.Hashable]:
+        """
+        Key of the version route table a request should be matched against.
+        `None` matches the request against all routes.
+        """
+        return None
+
 
 class IAPIVersioning(ABC):
     @abstractmethod
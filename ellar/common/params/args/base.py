@@ -9,8 +9,9 @@ from ellar.common.constants import (
     sequence_types,
 )
 from ellar.common.exceptions import ImproperConfiguration
+from ellar.common.helper.modelfield import create_model_field
 from ellar.common.interfaces import IExecutionContext
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 from pydantic.error_wrappers import ErrorWrapper
 from pydantic.fields import FieldInfo, ModelField
 from pydantic.typing import ForwardRef, evaluate_forwardref  # type:ignore
@@ -23,11 +24,15 @@ from ..decorators import get_default_resolver
 from ..helpers import is_scalar_field, is_scalar_sequence_field
 from ..resolvers import (
     BaseRouteParameterResolver,
+    GroupedParameterResolver,
+    HeaderParameterResolver,
     IRouteParameterResolver,
+    QueryParameterResolver,
     SystemParameterResolver,
 )
 from .extra_args import ExtraEndpointArg
 from .factory import get_parameter_field
+from .resolution_plan import ParameterResolutionPlan
 from .resolver_generators import (
     BulkArgsResolverGenerator,
     FormArgsResolverGenerator,
@@ -44,6 +49,12 @@ class EndpointArgsModel:
         str(params.HeaderFieldInfo): QueryHeaderResolverGenerator,
     }
 
+    _grouped_locations = (
+        params.HeaderFieldInfo.in_.value,
+        params.QueryFieldInfo.in_.value,
+    )
+    _groupable_resolvers = (HeaderParameterResolver, QueryParameterResolver)
+
     _provider_skip = primitive_types + sequence_types + (Representation,)
 
     __slots__ = (
@@ -55,6 +66,7 @@ class EndpointArgsModel:
         "_route_models",
         "param_converters",
         "_extra_endpoint_args",
+        "_resolution_plan",
     )
 
     def __init__(
@@ -76,6 +88,7 @@ class EndpointArgsModel:
             t.Union[t.Any, BaseRouteParameterResolver]
         ] = None
         self._route_models: t.List[IRouteParameterResolver] = []
+        self._resolution_plan = ParameterResolutionPlan(self._route_models)
         self._extra_endpoint_args: t.List[ExtraEndpointArg] = (
             list(extra_endpoint_args) if extra_endpoint_args else []
         )
@@ -150,6 +163,70 @@ class EndpointArgsModel:
             + self._computation_models[params.CookieFieldInfo.in_.value]
             + self._computation_models[SystemParameterResolver.in_]
         )
+        self._resolution_plan = ParameterResolutionPlan(
+            self.compute_resolution_models()
+        )
+
+    def compute_resolution_models(self) -> t.List[IRouteParameterResolver]:
+        """
+        Returns route models where scalar parameters of each location in `_grouped_locations`
+        are replaced with one `GroupedParameterResolver`, placed where the first of them was.
+        Route models used for documentation are left untouched.
+        :return: List[IRouteParameterResolver]
+        """
+        grouped: t.DefaultDict[str, t.List[HeaderParameterResolver]] = defaultdict(list)
+        for resolver in self._route_models:
+            if type(resolver) in self._groupable_resolvers:
+                resolver = t.cast(HeaderParameterResolver, resolver)
+                in_ = resolver.model_field.field_info.in_.value
+                if in_ in self._grouped_locations:
+                    grouped[in_].append(resolver)
+
+        members: t.Dict[int, t.Optional[GroupedParameterResolver]] = {}
+        for in_, resolvers in grouped.items():
+            if len(resolvers) > 1:
+                members.update({id(resolver): None for resolver in resolvers})
+                members[id(resolvers[0])] = self.create_grouped_resolver(in_, resolvers)
+
+        resolution_models: t.List[IRouteParameterResolver] = []
+        for resolver in self._route_models:
+            if id(resolver) not in members:
+                resolution_models.append(resolver)
+            elif members[id(resolver)] is not None:
+                resolution_models.append(
+                    t.cast(GroupedParameterResolver, members[id(resolver)])
+                )
+        return resolution_models
+
+    @classmethod
+    def create_grouped_resolver(
+        cls, location: str, resolvers: t.List[HeaderParameterResolver]
+    ) -> GroupedParameterResolver:
+        """
+        Creates a model made of `resolvers` model fields, like `build_body_field` does for bodies,
+        so the location is validated at once.
+        """
+        location_model: t.Type[BaseModel] = create_model(
+            f"{location.capitalize()}Parameters"
+        )
+        for resolver in resolvers:
+            location_model.__fields__[resolver.model_field.name] = resolver.model_field
+
+        field_info = type(resolvers[0].model_field.field_info)(default=None)
+        model_field = create_model_field(
+            name=location,
+            type_=location_model,
+            alias=location,
+            field_info=field_info,
+        )
+        return GroupedParameterResolver(model_field, resolvers=resolvers)
+
+    def get_resolution_plan(self) -> ParameterResolutionPlan:
+        """
+        Returns the resolution plan of route models computed by `build_model`
+        :return: ParameterResolutionPlan
+        """
+        return self._resolution_plan
 
     def compute_route_parameter_list(
         self, body_field_class: t.Type[FieldInfo] = params.BodyFieldInfo
@@ -292,23 +369,28 @@ class EndpointArgsModel:
         values: t.Dict[str, t.Any] = {}
         errors: t.List[ErrorWrapper] = []
 
-        if self.body_resolver:
-            await self.resolve_body(ctx, values, errors)
+        if not self.body_resolver:
+            await self._resolution_plan.resolve(ctx, values, errors)
+            return values, errors
+
+        if self.should_resolve_body_last(ctx):
+            # fails fast on invalid path, query, header and cookie parameters
+            # before the request body is read and decoded
+            await self._resolution_plan.resolve(ctx, values, errors)
+            if not errors:
+                await self.resolve_body(ctx, values, errors)
+            return values, errors
 
+        await self.resolve_body(ctx, values, errors)
         if not errors:
-            for parameter_resolver in self._route_models:
-                value_, value_errors = await parameter_resolver.resolve(ctx=ctx)
-                if value_:
-                    values.update(value_)
-                if value_errors:
-                    _errors = (
-                        value_errors
-                        if isinstance(value_errors, list)
-                        else [value_errors]
-                    )
-                    errors += _errors
+            await self._resolution_plan.resolve(ctx, values, errors)
         return values, errors
 
+    @classmethod
+    def should_resolve_body_last(cls, ctx: IExecutionContext) -> bool:
+        """Checks if the request body is resolved after the other parameters"""
+        return bool(ctx.get_app().config.RESOLVE_BODY_LAST)
+
     def compute_extra_route_args(self) -> None:
         self._add_extra_route_args(*self._extra_endpoint_args)
 
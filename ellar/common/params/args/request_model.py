@@ -23,6 +23,7 @@ class RequestEndpointArgsModel(EndpointArgsModel):
         "_route_models",
         "param_converters",
         "_extra_endpoint_args",
+        "_resolution_plan",
     )
 
     def __init__(
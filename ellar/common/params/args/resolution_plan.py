@@ -0,0 +1,165 @@
+import typing as t
+
+import anyio
+from ellar.common.interfaces import IExecutionContext
+from pydantic.error_wrappers import ErrorWrapper
+
+from ..resolvers import IRouteParameterResolver, ReceivedParameterResolver
+
+__all__ = ["ParameterResolutionPlan"]
+
+
+class ParameterResolutionPlan:
+    """
+    Resolution steps of an endpoint's route models, computed once by `EndpointArgsModel.build_model`.
+
+    Resolvers that support `resolve_received`, like query, header, path and cookie resolvers,
+    are resolved synchronously from connection mappings fetched once per request
+    and shared by every resolver reading the same location.
+    Only the remaining resolvers, like system parameters, are awaited.
+    When more than one resolver is `io_bound`, they run concurrently in a task group
+    while the other resolvers run inline.
+    Errors keep the order of resolvers in the route models.
+    """
+
+    __slots__ = (
+        "_connection_getters",
+        "_steps",
+        "_resolve_received_count",
+        "_io_bound_count",
+    )
+
+    def __init__(self, resolvers: t.Sequence[IRouteParameterResolver]) -> None:
+        self._connection_getters: t.List[t.Callable[[t.Any], t.Any]] = []
+        self._steps: t.List[t.Tuple[t.Optional[int], IRouteParameterResolver]] = []
+
+        for resolver in resolvers:
+            if (
+                isinstance(resolver, ReceivedParameterResolver)
+                and resolver.supports_resolve_received()
+            ):
+                getter = resolver.get_connection_parameter
+                if getter not in self._connection_getters:
+                    self._connection_getters.append(getter)
+                self._steps.append((self._connection_getters.index(getter), resolver))
+            else:
+                self._steps.append((None, resolver))
+
+        self._resolve_received_count = sum(
+            1 for getter_index, _ in self._steps if getter_index is not None
+        )
+        self._io_bound_count = sum(
+            1
+            for getter_index, resolver in self._steps
+            if getter_index is None and resolver.io_bound
+        )
+
+    @property
+    def resolve_received_count(self) -> int:
+        """Number of resolvers resolved synchronously"""
+        return self._resolve_received_count
+
+    @property
+    def concurrent(self) -> bool:
+        """Checks if I/O bound resolvers are resolved concurrently"""
+        return self._io_bound_count > 1
+
+    def _get_received_params(self, ctx: IExecutionContext) -> t.List[t.Any]:
+        if not self._connection_getters:
+            return []
+        connection = ctx.switch_to_http_connection().get_client()
+        return [getter(connection) for getter in self._connection_getters]
+
+    @classmethod
+    async def _await_resolver(
+        cls,
+        parameter_resolver: IRouteParameterResolver,
+        ctx: IExecutionContext,
+        values: t.Dict[str, t.Any],
+        errors: t.List,
+    ) -> None:
+        value_, value_errors = await parameter_resolver.resolve(ctx=ctx)
+        if value_:
+            values.update(value_)
+        if value_errors:
+            errors += t.cast(
+                t.List[ErrorWrapper],
+                value_errors if isinstance(value_errors, list) else [value_errors],
+            )
+
+    async def resolve(
+        self, ctx: IExecutionContext, values: t.Dict[str, t.Any], errors: t.List
+    ) -> None:
+        if self.concurrent:
+            await self._resolve_concurrently(ctx, values, errors)
+            return
+
+        received_params = self._get_received_params(ctx)
+        for getter_index, parameter_resolver in self._steps:
+            if getter_index is not None:
+                t.cast(ReceivedParameterResolver, parameter_resolver).resolve_received(
+                    received_params[getter_index], values, errors
+                )
+                continue
+            await self._await_resolver(parameter_resolver, ctx, values, errors)
+
+    @classmethod
+    async def _await_step(
+        cls,
+        parameter_resolver: IRouteParameterResolver,
+        ctx: IExecutionContext,
+        values: t.Dict[str, t.Any],
+        errors: t.List,
+        exceptions: t.List[t.Optional[Exception]],
+        idx: int,
+    ) -> None:
+        try:
+            await cls._await_resolver(parameter_resolver, ctx, values, errors)
+        except Exception as ex:
+            # kept so the task group does not wrap it in an exception group
+            exceptions[idx] = ex
+
+    async def _resolve_concurrently(
+        self, ctx: IExecutionContext, values: t.Dict[str, t.Any], errors: t.List
+    ) -> None:
+        # errors and exceptions are collected per step and merged in order afterwards
+        steps_errors: t.List[t.List] = [[] for _ in self._steps]
+        steps_exceptions: t.List[t.Optional[Exception]] = [None for _ in self._steps]
+        received_params = self._get_received_params(ctx)
+
+        async with anyio.create_task_group() as tg:
+            for idx, (getter_index, parameter_resolver) in enumerate(self._steps):
+                if getter_index is None and parameter_resolver.io_bound:
+                    tg.start_soon(
+                        self._await_step,
+                        parameter_resolver,
+                        ctx,
+                        values,
+                        steps_errors[idx],
+                        steps_exceptions,
+                        idx,
+                    )
+
+            for idx, (getter_index, parameter_resolver) in enumerate(self._steps):
+                try:
+                    if getter_index is not None:
+                        t.cast(
+                            ReceivedParameterResolver, parameter_resolver
+                        ).resolve_received(
+                            received_params[getter_index], values, steps_errors[idx]
+                        )
+                    elif not parameter_resolver.io_bound:
+                        await self._await_resolver(
+                            parameter_resolver, ctx, values, steps_errors[idx]
+                        )
+                except Exception as ex:
+                    steps_exceptions[idx] = ex
+                    break
+
+        for step_exception in steps_exceptions:
+            if step_exception is not None:
+                # raised as the sequential resolution would, first in resolvers order
+                raise step_exception
+
+        for step_errors in steps_errors:
+            errors += step_errors
@@ -1,5 +1,10 @@
+import copy
+import dataclasses
+import typing as t
+from enum import Enum
+
 from pydantic import BaseModel
-from pydantic.fields import SHAPE_SINGLETON, ModelField
+from pydantic.fields import SHAPE_SINGLETON, ModelField, UndefinedType
 from pydantic.utils import lenient_issubclass
 
 from ..constants import sequence_shapes, sequence_types
@@ -35,3 +40,66 @@ def is_scalar_field(field: ModelField) -> bool:
         if not all(is_scalar_field(f) for f in field.sub_fields):
             return False
     return True
+
+
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+    type(Ellipsis),
+    UndefinedType,
+    Enum,
+)
+_SHALLOW_COPY_TYPES: t.Dict[t.Type, t.Callable[[t.Any], t.Any]] = {
+    list: list.copy,
+    dict: dict.copy,
+    set: set.copy,
+}
+
+
+def is_immutable_value(value: t.Any) -> bool:
+    """
+    Checks if `value` can be shared between requests without being copied:
+    scalars, enums, frozen pydantic models and dataclasses,
+    and tuples or frozensets made of such values.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable_value(item) for item in value)
+    if isinstance(value, BaseModel):
+        config = value.__config__
+        return (config.frozen or not config.allow_mutation) and all(
+            is_immutable_value(item) for item in value.__dict__.values()
+        )
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return value.__dataclass_params__.frozen and all(
+            is_immutable_value(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        )
+    return False
+
+
+def get_default_value_factory(default: t.Any) -> t.Callable[[], t.Any]:
+    """
+    Returns a callable giving a fresh copy of a parameter `default`, classified once.
+    Immutable defaults are returned as-is,
+    lists, dicts and sets of immutable values are shallow copied and anything else is deep copied.
+    """
+    if is_immutable_value(default):
+        return lambda: default
+
+    shallow_copy = _SHALLOW_COPY_TYPES.get(type(default))
+    if shallow_copy is not None and all(
+        is_immutable_value(item)
+        for item in (
+            (*default.keys(), *default.values()) if type(default) is dict else default
+        )
+    ):
+        return lambda: shallow_copy(default)  # type:ignore[misc]
+    return lambda: copy.deepcopy(default)
@@ -1,12 +1,14 @@
 from .base import (
     BaseRouteParameterResolver,
     IRouteParameterResolver,
+    ReceivedParameterResolver,
     RouteParameterModelField,
 )
 from .bulk_parameter import (
     BulkBodyParameterResolver,
     BulkFormParameterResolver,
     BulkParameterResolver,
+    GroupedParameterResolver,
 )
 from .parameter import (
     BodyParameterResolver,
@@ -27,6 +29,7 @@ __all__ = [
     "IRouteParameterResolver",
     "RouteParameterModelField",
     "BaseRouteParameterResolver",
+    "ReceivedParameterResolver",
     "BodyParameterResolver",
     "WsBodyParameterResolver",
     "FormParameterResolver",
@@ -36,6 +39,7 @@ __all__ = [
     "BulkParameterResolver",
     "BulkBodyParameterResolver",
     "BulkFormParameterResolver",
+    "GroupedParameterResolver",
     "QueryParameterResolver",
     "FileParameterResolver",
     "SystemParameterResolver",
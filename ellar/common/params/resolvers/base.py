@@ -5,7 +5,11 @@ from pydantic.error_wrappers import ErrorWrapper
 from pydantic.errors import MissingError
 from pydantic.fields import ModelField
 
+from ..helpers import get_default_value_factory
+
 if t.TYPE_CHECKING:  # pragma: no cover
+    from starlette.requests import HTTPConnection
+
     from ..params import ParamFieldInfo
 
 
@@ -14,6 +18,9 @@ class RouteParameterModelField(ModelField):
 
 
 class IRouteParameterResolver(ABC, metaclass=ABCMeta):
+    # I/O bound resolvers of an endpoint are resolved concurrently
+    io_bound: bool = False
+
     @abstractmethod
     @t.no_type_check
     async def resolve(self, *args: t.Any, **kwargs: t.Any) -> t.Tuple:
@@ -25,6 +32,11 @@ class BaseRouteParameterResolver(IRouteParameterResolver, ABC):
         self.model_field: RouteParameterModelField = t.cast(
             RouteParameterModelField, model_field
         )
+        self._default_factory = get_default_value_factory(model_field.default)
+
+    def get_default_value(self) -> t.Any:
+        """Returns the field default, copied only when it is mutable"""
+        return self._default_factory()
 
     def assert_field_info(self) -> None:
         from .. import params
@@ -47,7 +59,42 @@ class BaseRouteParameterResolver(IRouteParameterResolver, ABC):
         value_ = await self.resolve_handle(*args, **kwargs)
         return value_
 
+    @classmethod
+    def overrides(cls, base: t.Type, *names: str) -> bool:
+        """Checks if any of `names` is redefined by a subclass of `base`"""
+        for name in names:
+            for klass in cls.__mro__:
+                if name in vars(klass):
+                    if klass not in base.__mro__:
+                        return True
+                    break
+        return False
+
     @abstractmethod
     @t.no_type_check
     async def resolve_handle(self, *args: t.Any, **kwargs: t.Any) -> t.Tuple:
         """resolver action"""
+
+
+class ReceivedParameterResolver(BaseRouteParameterResolver, ABC):
+    """
+    Resolves a parameter synchronously from a connection mapping, like headers,
+    query parameters, path parameters or cookies.
+    """
+
+    def supports_resolve_received(self) -> bool:
+        """
+        Checks if the resolver can be resolved synchronously with `resolve_received`
+        from a mapping returned by `get_connection_parameter`.
+        """
+        return True
+
+    @abstractmethod
+    def get_connection_parameter(self, connection: "HTTPConnection") -> t.Any:
+        """Returns the connection mapping the parameter is read from"""
+
+    @abstractmethod
+    def resolve_received(
+        self, received_params: t.Any, values: t.Dict, errors: t.List
+    ) -> None:
+        """Resolves the parameter from `received_params` into `values` and `errors`"""
@@ -2,14 +2,22 @@ import typing as t
 
 from ellar.common.interfaces import IExecutionContext
 from ellar.common.logger import request_logger
+from pydantic import BaseModel, validate_model
 from pydantic.error_wrappers import ErrorWrapper
 from pydantic.fields import ModelField
 
-from .base import BaseRouteParameterResolver
-from .parameter import BodyParameterResolver, FormParameterResolver
+from .base import BaseRouteParameterResolver, ReceivedParameterResolver
+from .parameter import (
+    BodyParameterResolver,
+    FormParameterResolver,
+    HeaderParameterResolver,
+)
 
+if t.TYPE_CHECKING:  # pragma: no cover
+    from starlette.requests import HTTPConnection
 
-class BulkParameterResolver(BaseRouteParameterResolver):
+
+class BulkParameterResolver(ReceivedParameterResolver):
     def __init__(
         self,
         *args: t.Any,
@@ -26,6 +34,60 @@ class BulkParameterResolver(BaseRouteParameterResolver):
     def get_model_fields(self) -> t.List[ModelField]:
         return [resolver.model_field for resolver in self._resolvers]
 
+    def supports_resolve_received(self) -> bool:
+        if not self._resolvers or self.overrides(
+            BulkParameterResolver, "resolve", "resolve_handle", "resolve_received"
+        ):
+            return False
+
+        if not all(
+            isinstance(resolver, ReceivedParameterResolver)
+            and resolver.supports_resolve_received()
+            for resolver in self._resolvers
+        ):
+            return False
+
+        get_connection_parameter = self._received_resolvers[0].get_connection_parameter
+        return all(
+            resolver.get_connection_parameter == get_connection_parameter
+            for resolver in self._received_resolvers
+        )
+
+    @property
+    def _received_resolvers(self) -> t.List[ReceivedParameterResolver]:
+        # only used once `supports_resolve_received` has checked the resolvers types
+        return t.cast(t.List[ReceivedParameterResolver], self._resolvers)
+
+    def get_connection_parameter(self, connection: "HTTPConnection") -> t.Any:
+        return self._received_resolvers[0].get_connection_parameter(connection)
+
+    def resolve_received(
+        self, received_params: t.Any, values: t.Dict, errors: t.List
+    ) -> None:
+        _values: t.Dict[str, t.Any] = {}
+        _errors: t.List[ErrorWrapper] = []
+        for parameter_resolver in self._received_resolvers:
+            parameter_resolver.resolve_received(received_params, _values, _errors)
+        values_, errors_ = self._validate_values(_values, _errors)
+        values.update(values_)
+        errors.extend(errors_)
+
+    def _validate_values(
+        self, values: t.Dict[str, t.Any], errors: t.List[ErrorWrapper]
+    ) -> t.Tuple:
+        if errors:
+            return values, errors
+
+        v_, errors_ = self.model_field.validate(
+            values,
+            {},
+            loc=(self.model_field.field_info.in_.value, self.model_field.alias),
+        )
+        if errors_:
+            errors += self.validate_error_sequence(errors_)
+            return values, errors
+        return {self.model_field.name: v_}, []
+
     async def resolve_handle(
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> t.Tuple:
@@ -41,18 +103,7 @@ class BulkParameterResolver(BaseRouteParameterResolver):
                 values.update(value_)
             if errors_:
                 errors += self.validate_error_sequence(errors_)
-        if errors:
-            return values, errors
-
-        v_, errors_ = self.model_field.validate(
-            values,
-            {},
-            loc=(self.model_field.field_info.in_.value, self.model_field.alias),
-        )
-        if errors_:
-            errors += self.validate_error_sequence(errors_)
-            return values, errors
-        return {self.model_field.name: v_}, []
+        return self._validate_values(values, errors)
 
 
 class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
@@ -131,3 +182,69 @@ class BulkBodyParameterResolver(BodyParameterResolver, BulkParameterResolver):
             _, body_value = values.popitem()
             return body_value.dict(), []
         return values, self.validate_error_sequence(errors)
+
+
+class GroupedParameterResolver(ReceivedParameterResolver):
+    """
+    Resolves scalar query or header parameters of one location together.
+
+    `model_field` type is a model made of the parameters' model fields, so all received values
+    are validated by a single `pydantic.validate_model` call.
+    Error locations are prefixed with the parameter location, as with individual resolvers.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        resolvers: t.List[HeaderParameterResolver],
+        **kwargs: t.Any,
+    ):
+        super().__init__(*args, **kwargs)
+        assert resolvers, "GroupedParameterResolver requires at least one resolver"
+        self._resolvers = resolvers
+        self._model = t.cast(t.Type[BaseModel], self.model_field.type_)
+        self._loc = (self.model_field.field_info.in_.value,)
+
+    @property
+    def resolvers(self) -> t.List[HeaderParameterResolver]:
+        return self._resolvers
+
+    def supports_resolve_received(self) -> bool:
+        return True
+
+    def get_connection_parameter(self, connection: "HTTPConnection") -> t.Any:
+        return self._resolvers[0].get_connection_parameter(connection)
+
+    def resolve_received(
+        self, received_params: t.Any, values: t.Dict, errors: t.List
+    ) -> None:
+        input_data: t.Dict[str, t.Any] = {}
+        for parameter_resolver in self._resolvers:
+            value = parameter_resolver.get_received_value(received_params)
+            if value is not None:
+                input_data[parameter_resolver.model_field.alias] = value
+
+        values_, _, validation_error = validate_model(self._model, input_data)
+        values.update(values_)
+        if validation_error:
+            errors.extend(self._prefix_errors(validation_error.raw_errors))
+
+    def _prefix_errors(self, errors: t.Sequence[t.Any]) -> t.List[t.Any]:
+        return [
+            ErrorWrapper(error.exc, loc=self._loc + error.loc_tuple())
+            if isinstance(error, ErrorWrapper)
+            else self._prefix_errors(error)
+            for error in errors
+        ]
+
+    async def resolve_handle(
+        self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
+    ) -> t.Tuple:
+        request_logger.debug(
+            f"Resolving Grouped Parameters - '{self.__class__.__name__}'"
+        )
+        values: t.Dict[str, t.Any] = {}
+        errors: t.List[ErrorWrapper] = []
+        connection = ctx.switch_to_http_connection().get_client()
+        self.resolve_received(self.get_connection_parameter(connection), values, errors)
+        return values, errors
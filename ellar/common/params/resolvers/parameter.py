@@ -1,7 +1,6 @@
-import copy
-import email.message
 import json
 import typing as t
+from pathlib import PurePath
 
 import anyio
 from ellar.common.constants import (
@@ -9,83 +8,137 @@ from ellar.common.constants import (
     sequence_shapes,
     sequence_types,
 )
-from ellar.common.datastructures import UploadFile
 from ellar.common.exceptions import RequestValidationError
+from ellar.common.formparsers import (
+    MultiPartLimits,
+    MultiPartSizeError,
+    get_upload_file_path,
+    parse_multipart_form,
+)
+from ellar.common.helper.json_decoder import decode_json
+from ellar.common.helper.media_type import parse_media_type
 from ellar.common.interfaces import IExecutionContext
 from ellar.common.logger import request_logger
 from pydantic.error_wrappers import ErrorWrapper
 from pydantic.fields import Undefined
 from pydantic.utils import lenient_issubclass
 from starlette.datastructures import FormData, Headers, QueryParams
+from starlette.datastructures import UploadFile as StarletteUploadFile
 from starlette.exceptions import HTTPException
+from starlette.requests import HTTPConnection
+
+from .base import BaseRouteParameterResolver, ReceivedParameterResolver
 
-from .base import BaseRouteParameterResolver
 
+class HeaderParameterResolver(ReceivedParameterResolver):
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._is_sequence = (
+            self.model_field.shape in sequence_shapes
+            or self.model_field.type_ in sequence_types
+        )
+
+    @classmethod
+    def get_connection_parameter(
+        cls, connection: HTTPConnection
+    ) -> t.Union[QueryParams, Headers]:
+        return connection.headers
 
-class HeaderParameterResolver(BaseRouteParameterResolver):
     @classmethod
     def get_received_parameter(
         cls, ctx: IExecutionContext
     ) -> t.Union[QueryParams, Headers]:
         connection = ctx.switch_to_http_connection().get_client()
-        return connection.headers
-
-    async def resolve_handle(
-        self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
-    ) -> t.Tuple:
-        request_logger.debug(
-            f"Resolving Header Parameters - '{self.__class__.__name__}'"
+        return cls.get_connection_parameter(connection)
+
+    def supports_resolve_received(self) -> bool:
+        return not self.overrides(
+            HeaderParameterResolver,
+            "resolve",
+            "resolve_handle",
+            "get_received_parameter",
+            "get_received_value",
+            "resolve_received",
         )
-        received_params = self.get_received_parameter(ctx=ctx)
-        if (
-            self.model_field.shape in sequence_shapes
-            or self.model_field.type_ in sequence_types
-        ):
-            value = (
+
+    def get_received_value(
+        self, received_params: t.Union[QueryParams, Headers]
+    ) -> t.Any:
+        """Returns the raw parameter value, `None` when it was not received"""
+        if self._is_sequence:
+            return (
                 received_params.getlist(self.model_field.alias)
                 or self.model_field.default
             )
-        else:
-            value = received_params.get(self.model_field.alias)
+        return received_params.get(self.model_field.alias)
+
+    def resolve_received(
+        self,
+        received_params: t.Union[QueryParams, Headers],
+        values: t.Dict,
+        errors: t.List,
+    ) -> None:
+        value = self.get_received_value(received_params)
         self.assert_field_info()
-        field_info = self.model_field.field_info
-        values = {}
+        loc = (self.model_field.field_info.in_.value, self.model_field.alias)
         if value is None:
             if self.model_field.required:
-                errors = [
-                    self.create_error(
-                        loc=(field_info.in_.value, self.model_field.alias)
-                    )
-                ]
-                return {}, errors
+                errors.append(self.create_error(loc=loc))
             else:
-                values[self.model_field.name] = copy.deepcopy(self.model_field.default)
-                return values, []
+                values[self.model_field.name] = self.get_default_value()
+            return
 
-        v_, errors_ = self.model_field.validate(
-            value, values, loc=(field_info.in_.value, self.model_field.alias)
+        v_, errors_ = self.model_field.validate(value, {}, loc=loc)
+        if errors_:
+            errors.extend(self.validate_error_sequence(errors_))
+        values[self.model_field.name] = v_
+
+    async def resolve_handle(
+        self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
+    ) -> t.Tuple:
+        request_logger.debug(
+            f"Resolving Header Parameters - '{self.__class__.__name__}'"
         )
-        return {self.model_field.name: v_}, self.validate_error_sequence(errors_)
+        values: t.Dict[str, t.Any] = {}
+        errors: t.List[ErrorWrapper] = []
+        self.resolve_received(self.get_received_parameter(ctx=ctx), values, errors)
+        if errors and self.model_field.name not in values:
+            return {}, errors
+        return values, errors
 
 
 class QueryParameterResolver(HeaderParameterResolver):
     @classmethod
-    def get_received_parameter(
-        cls, ctx: IExecutionContext
+    def get_connection_parameter(
+        cls, connection: HTTPConnection
     ) -> t.Union[QueryParams, Headers]:
-        connection = ctx.switch_to_http_connection().get_client()
         return connection.query_params
 
 
-class PathParameterResolver(BaseRouteParameterResolver):
+class PathParameterResolver(ReceivedParameterResolver):
+    @classmethod
+    def get_connection_parameter(
+        cls, connection: HTTPConnection
+    ) -> t.Mapping[str, t.Any]:
+        return connection.path_params
+
     @classmethod
     def get_received_parameter(cls, ctx: IExecutionContext) -> t.Mapping[str, t.Any]:
         connection = ctx.switch_to_http_connection().get_client()
-        return connection.path_params
+        return cls.get_connection_parameter(connection)
+
+    def supports_resolve_received(self) -> bool:
+        return not self.overrides(
+            PathParameterResolver,
+            "resolve",
+            "resolve_handle",
+            "get_received_parameter",
+            "resolve_received",
+        )
 
-    async def resolve_handle(self, ctx: IExecutionContext, **kwargs: t.Any) -> t.Tuple:
-        request_logger.debug(f"Resolving Path Parameters - '{self.__class__.__name__}'")
-        received_params = self.get_received_parameter(ctx=ctx)
+    def resolve_received(
+        self, received_params: t.Mapping[str, t.Any], values: t.Dict, errors: t.List
+    ) -> None:
         value = received_params.get(str(self.model_field.alias))
         self.assert_field_info()
 
@@ -94,13 +147,23 @@ class PathParameterResolver(BaseRouteParameterResolver):
             {},
             loc=(self.model_field.field_info.in_.value, self.model_field.alias),
         )
-        return {self.model_field.name: v_}, self.validate_error_sequence(errors_)
+        if errors_:
+            errors.extend(self.validate_error_sequence(errors_))
+        values[self.model_field.name] = v_
+
+    async def resolve_handle(self, ctx: IExecutionContext, **kwargs: t.Any) -> t.Tuple:
+        request_logger.debug(f"Resolving Path Parameters - '{self.__class__.__name__}'")
+        values: t.Dict[str, t.Any] = {}
+        errors: t.List[ErrorWrapper] = []
+        self.resolve_received(self.get_received_parameter(ctx=ctx), values, errors)
+        return values, errors
 
 
 class CookieParameterResolver(PathParameterResolver):
     @classmethod
-    def get_received_parameter(cls, ctx: IExecutionContext) -> t.Mapping[str, t.Any]:
-        connection = ctx.switch_to_http_connection().get_client()
+    def get_connection_parameter(
+        cls, connection: HTTPConnection
+    ) -> t.Mapping[str, t.Any]:
         return connection.cookies
 
 
@@ -140,15 +203,13 @@ class BodyParameterResolver(WsBodyParameterResolver):
             if body_bytes:
                 json_body: t.Any = Undefined
                 content_type_value = request.headers.get("content-type")
-                if not content_type_value:
-                    json_body = await request.json()
-                else:
-                    message = email.message.Message()
-                    message["content-type"] = content_type_value
-                    if message.get_content_maintype() == "application":
-                        subtype = message.get_content_subtype()
-                        if subtype == "json" or subtype.endswith("+json"):
-                            json_body = await request.json()
+                if (
+                    not content_type_value
+                    or parse_media_type(content_type_value).is_json()
+                ):
+                    json_body = decode_json(
+                        body_bytes, ctx.get_app().config.JSON_DECODER
+                    )
                 if json_body != Undefined:
                     body_bytes = json_body
             return body_bytes
@@ -188,8 +249,27 @@ class FormParameterResolver(BodyParameterResolver):
         )
         try:
             request = ctx.switch_to_http_connection().get_request()
+            content_type_value = request.headers.get("content-type")
+            if (
+                content_type_value
+                and parse_media_type(content_type_value).content_type
+                == "multipart/form-data"
+            ):
+                config = ctx.get_app().config
+                return await parse_multipart_form(
+                    request,
+                    MultiPartLimits(
+                        max_request_size=config.MULTIPART_MAX_REQUEST_SIZE,
+                        max_file_size=config.MULTIPART_MAX_FILE_SIZE,
+                        max_field_size=config.MULTIPART_MAX_FIELD_SIZE,
+                        spool_max_size=config.MULTIPART_SPOOL_MAX_SIZE,
+                    ),
+                )
             body_bytes = await request.form()
             return body_bytes
+        except MultiPartSizeError as e:
+            request_logger.error(f"Request body rejected: {e.message}")
+            raise HTTPException(status_code=413, detail=e.message) from e
         except Exception as e:
             request_logger.error("Unable to parse the body: ", exc_info=True)
             raise HTTPException(
@@ -232,7 +312,7 @@ class FormParameterResolver(BodyParameterResolver):
                     values=values, value=_body, loc=loc
                 )
             else:
-                values[self.model_field.name] = copy.deepcopy(self.model_field.default)
+                values[self.model_field.name] = self.get_default_value()
             return values, []
 
         return await self.process_and_validate(values=values, value=value, loc=loc)
@@ -243,9 +323,26 @@ class FileParameterResolver(FormParameterResolver):
         self, *, values: t.Dict, value: t.Any, loc: t.Tuple
     ) -> t.Tuple:
         if lenient_issubclass(self.model_field.type_, bytes) and isinstance(
-            value, UploadFile
+            value, StarletteUploadFile
         ):
             value = await value.read()
+        elif lenient_issubclass(self.model_field.type_, PurePath) and isinstance(
+            value, StarletteUploadFile
+        ):
+            value = await get_upload_file_path(value)
+        elif (
+            self.model_field.shape in sequence_shapes
+            and lenient_issubclass(self.model_field.type_, PurePath)
+            and isinstance(value, sequence_types)
+        ):
+            value = sequence_shape_to_type[self.model_field.shape](
+                [
+                    await get_upload_file_path(sub_value)
+                    if isinstance(sub_value, StarletteUploadFile)
+                    else sub_value
+                    for sub_value in value
+                ]
+            )
         elif (
             self.model_field.shape in sequence_shapes
             and lenient_issubclass(self.model_field.type_, bytes)
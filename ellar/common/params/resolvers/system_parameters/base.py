@@ -25,6 +25,9 @@ class SystemParameterResolver(IRouteParameterResolver, ABC):
     >>> @get('/abc')
     >>> def abc(user: User = UserField()):
     >>>     return user
+
+    Resolvers doing I/O, like loading the user from a database, should set `io_bound = True`
+    so that they are resolved concurrently with other I/O bound resolvers of the endpoint.
     """
 
     in_: str = "system_parameter"
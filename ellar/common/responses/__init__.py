@@ -1,4 +1,5 @@
 from .response_types import (
+    FastJSONResponse,
     FileResponse,
     HTMLResponse,
     JSONResponse,
@@ -14,6 +15,7 @@ __all__ = [
     "JSONResponse",
     "UJSONResponse",
     "ORJSONResponse",
+    "FastJSONResponse",
     "StreamingResponse",
     "HTMLResponse",
     "FileResponse",
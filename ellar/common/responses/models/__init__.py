@@ -7,7 +7,11 @@ from .file import (
 )
 from .helper import create_response_model
 from .html import HTMLResponseModel, HTMLResponseModelRuntimeError
-from .json import EmptyAPIResponseModel, JSONResponseModel
+from .json import (
+    EmptyAPIResponseModel,
+    JSONResponseModel,
+    StreamingJSONResponseModel,
+)
 from .route import RouteResponseModel
 from .type_converter import ResponseTypeDefinitionConverter
 
@@ -19,6 +23,7 @@ __all__ = [
     "EmptyAPIResponseModel",
     "FileResponseModel",
     "StreamingResponseModel",
+    "StreamingJSONResponseModel",
     "RouteResponseModel",
     "HTMLResponseModel",
     "create_response_model",
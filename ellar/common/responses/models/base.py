@@ -1,4 +1,5 @@
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
 
 from ellar.common.constants import SERIALIZER_FILTER_KEY
@@ -6,14 +7,48 @@ from ellar.common.exceptions import RequestValidationError
 from ellar.common.helper.modelfield import create_model_field
 from ellar.common.interfaces import IExecutionContext, IResponseModel
 from ellar.common.logger import request_logger
-from ellar.common.serializer import SerializerFilter, serialize_object
+from ellar.common.serializer import (
+    BaseSerializer,
+    SerializerFilter,
+    default_serializer_filter,
+)
+from ellar.common.serializer.compiler import FieldSerializer, compile_field_serializer
 from ellar.reflect import reflect
 from pydantic import BaseModel
-from pydantic.fields import ModelField
+from pydantic.fields import (
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+from pydantic.utils import lenient_issubclass
 from starlette.responses import Response
 
 from .type_converter import ResponseTypeDefinitionConverter
 
+# `serializer_filter` metadata by route handler
+_handler_serializer_filters: "weakref.WeakKeyDictionary[t.Callable, t.Optional[SerializerFilter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_handler_serializer_filter(handler: t.Callable) -> t.Optional[SerializerFilter]:
+    """Returns the `serializer_filter` of a route handler, read from its metadata once"""
+    try:
+        return _handler_serializer_filters[handler]
+    except KeyError:
+        serializer_filter = reflect.get_metadata(SERIALIZER_FILTER_KEY, handler)
+        _handler_serializer_filters[handler] = serializer_filter
+        return t.cast(t.Optional[SerializerFilter], serializer_filter)
+    except TypeError:  # pragma: no cover
+        # handler can not be weakly referenced
+        return t.cast(
+            t.Optional[SerializerFilter],
+            reflect.get_metadata(SERIALIZER_FILTER_KEY, handler),
+        )
+
 
 def serialize_if_pydantic_object(obj: t.Any) -> t.Any:
     if isinstance(obj, BaseModel):
@@ -25,6 +60,64 @@ def serialize_if_pydantic_object(obj: t.Any) -> t.Any:
     return obj
 
 
+def _never_trusted(obj: t.Any) -> bool:
+    return False
+
+
+def compile_trusted_object_check(field: ModelField) -> t.Callable[[t.Any], bool]:
+    """
+    Compiles a check of objects that already are instances of `field` model type,
+    or lists and dicts of them, and so can be serialized without validation.
+    """
+    if field.shape == SHAPE_SINGLETON:
+        if field.sub_fields or not lenient_issubclass(field.type_, BaseModel):
+            return _never_trusted
+
+        # plain dataclasses are serialized with `asdict`, which ignores the serializer filter
+        model_types = (
+            field.type_,
+            *(
+                source_type
+                for source_type in ResponseTypeDefinitionConverter.get_source_types(
+                    field.type_
+                )
+                if issubclass(source_type, (BaseModel, BaseSerializer))
+            ),
+        )
+        allow_none = field.allow_none
+
+        def check_model(obj: t.Any) -> bool:
+            return isinstance(obj, model_types) or (allow_none and obj is None)
+
+        return check_model
+
+    if not field.sub_fields or len(field.sub_fields) != 1:
+        return _never_trusted
+
+    check_item = compile_trusted_object_check(field.sub_fields[0])
+    if check_item is _never_trusted:
+        return _never_trusted
+
+    if field.shape in (SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_TUPLE_ELLIPSIS):
+
+        def check_sequence(obj: t.Any) -> bool:
+            return isinstance(obj, (list, tuple)) and all(
+                check_item(item) for item in obj
+            )
+
+        return check_sequence
+
+    if field.shape == SHAPE_DICT and field.key_field and field.key_field.type_ is str:
+
+        def check_dict(obj: t.Any) -> bool:
+            return isinstance(obj, dict) and all(
+                isinstance(key, str) and check_item(value) for key, value in obj.items()
+            )
+
+        return check_dict
+    return _never_trusted
+
+
 class ResponseModelField(ModelField):
     """
     A representation of response schema defined in route function
@@ -37,6 +130,22 @@ class ResponseModelField(ModelField):
     types for the of validation and OPENAPI documentation
     """
 
+    _serializer: t.Optional[FieldSerializer] = None
+
+    _trusted_object_check: t.Optional[t.Callable[[t.Any], bool]] = None
+
+    def get_serializer(self) -> FieldSerializer:
+        """Returns the serializer compiled for this field's type, compiling it on first use"""
+        if self._serializer is None:
+            self._serializer = compile_field_serializer(self)
+        return self._serializer
+
+    def is_trusted_object(self, obj: t.Any) -> bool:
+        """Checks if `obj` already is an instance of this field's model type, or a list or dict of them"""
+        if self._trusted_object_check is None:
+            self._trusted_object_check = compile_trusted_object_check(self)
+        return self._trusted_object_check(obj)
+
     def validate_object(self, obj: t.Any) -> t.Any:
         request_logger.debug(
             f"Validating Response Object - '{self.__class__.__name__}'"
@@ -47,10 +156,14 @@ class ResponseModelField(ModelField):
             raise RequestValidationError(errors=_errors)
         return values
 
-    def serialize(
-        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
-    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
-        request_logger.debug(f"Serializing Response Data - '{self.__class__.__name__}'")
+    def validate_output(self, obj: t.Any, trust_output: bool = False) -> t.Any:
+        """
+        Validates `obj`.
+        With `trust_output`, objects passing `is_trusted_object` are returned without validation.
+        """
+        if trust_output and self.is_trusted_object(obj):
+            return obj
+
         try:
             values = self.validate_object(obj=obj)
         except RequestValidationError:
@@ -59,7 +172,18 @@ class ResponseModelField(ModelField):
                 values = self.validate_object(obj=new_obj)
             except RequestValidationError as req_val_ex2:
                 raise req_val_ex2
-        return serialize_object(values, serializer_filter=serializer_filter)
+        return values
+
+    def serialize(
+        self,
+        obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+        trust_output: bool = False,
+    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
+        """Validates `obj` with `validate_output` and serializes it"""
+        request_logger.debug(f"Serializing Response Data - '{self.__class__.__name__}'")
+        values = self.validate_output(obj, trust_output=trust_output)
+        return self.get_serializer()(values, serializer_filter)
 
 
 class BaseResponseModel(IResponseModel, ABC):
@@ -159,14 +283,13 @@ class BaseResponseModel(IResponseModel, ABC):
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
         )
-        serializer_filter: t.Optional[SerializerFilter] = reflect.get_metadata(
-            SERIALIZER_FILTER_KEY, context.get_handler()
-        )
+        serializer_filter = get_handler_serializer_filter(context.get_handler())
 
         response = self._response_type(
             **response_args,
             content=self.serialize(
-                response_obj, serializer_filter=serializer_filter or SerializerFilter()
+                response_obj,
+                serializer_filter=serializer_filter or default_serializer_filter,
             ),
             headers=headers,
         )
@@ -0,0 +1,130 @@
+import dataclasses
+import hashlib
+import typing as t
+import weakref
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from ellar.common.constants import ETAG_OPTIONS_KEY
+from ellar.common.interfaces import IExecutionContext
+from ellar.reflect import reflect
+from starlette.datastructures import Headers
+
+__all__ = [
+    "ETagOptions",
+    "ConditionalResponseValidators",
+    "get_handler_etag_options",
+    "make_etag",
+]
+
+
+@dataclasses.dataclass
+class ETagOptions:
+    """
+    Options of the `etag` route function decorator.
+
+    `version` and `last_modified` are called with the execution context and the handler output,
+    before the output is validated and serialized. When `version` is not set or returns None,
+    the ETag is a hash of the rendered response body.
+    """
+
+    version: t.Optional[t.Callable[[IExecutionContext, t.Any], t.Any]] = None
+    last_modified: t.Optional[
+        t.Callable[[IExecutionContext, t.Any], t.Optional[datetime]]
+    ] = None
+    weak: bool = False
+
+    def get_validators(
+        self, context: IExecutionContext, response_obj: t.Any
+    ) -> "ConditionalResponseValidators":
+        etag = None
+        if self.version is not None:
+            version = self.version(context, response_obj)
+            if version is not None:
+                etag = make_etag(str(version).encode(), weak=self.weak)
+
+        last_modified = None
+        if self.last_modified is not None:
+            last_modified = self.last_modified(context, response_obj)
+        return ConditionalResponseValidators(etag=etag, last_modified=last_modified)
+
+
+def make_etag(content: bytes, weak: bool = False) -> str:
+    """Returns a quoted ETag of `content` hash"""
+    etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    return f"W/{etag}" if weak else etag
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _to_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclasses.dataclass
+class ConditionalResponseValidators:
+    etag: t.Optional[str] = None
+    last_modified: t.Optional[datetime] = None
+
+    def get_headers(self) -> t.Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["etag"] = self.etag
+        if self.last_modified:
+            headers["last-modified"] = format_datetime(
+                _to_utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+    def is_not_modified(self, request_headers: Headers) -> bool:
+        """
+        Evaluates `If-None-Match`, or `If-Modified-Since` when there is no `If-None-Match`,
+        with the weak comparison of conditional GET requests.
+        """
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            if self.etag is None:
+                return False
+            if if_none_match.strip() == "*":
+                return True
+            etag = _strip_weak_prefix(self.etag)
+            return any(
+                _strip_weak_prefix(item.strip()) == etag
+                for item in if_none_match.split(",")
+            )
+
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have no fraction of seconds
+        last_modified = _to_utc(self.last_modified).replace(microsecond=0)
+        return last_modified <= _to_utc(modified_since)
+
+
+# `etag` metadata by route handler
+_handler_etag_options: "weakref.WeakKeyDictionary[t.Callable, t.Optional[ETagOptions]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_handler_etag_options(handler: t.Callable) -> t.Optional[ETagOptions]:
+    """Returns the `etag` options of a route handler, read from its metadata once"""
+    try:
+        return _handler_etag_options[handler]
+    except KeyError:
+        options = reflect.get_metadata(ETAG_OPTIONS_KEY, handler)
+        _handler_etag_options[handler] = options
+        return t.cast(t.Optional[ETagOptions], options)
+    except TypeError:  # pragma: no cover
+        # handler can not be weakly referenced
+        return t.cast(
+            t.Optional[ETagOptions], reflect.get_metadata(ETAG_OPTIONS_KEY, handler)
+        )
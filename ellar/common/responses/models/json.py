@@ -1,14 +1,27 @@
+import itertools
+import json
 import typing as t
 
-from ellar.common.constants import SERIALIZER_FILTER_KEY
 from ellar.common.helper.modelfield import create_model_field
 from ellar.common.interfaces import IExecutionContext
 from ellar.common.logger import request_logger
-from ellar.common.serializer import SerializerFilter, serialize_object
-from ellar.reflect import reflect
+from ellar.common.serializer import SerializerFilter, dumps_json, serialize_object
+from pydantic.utils import lenient_issubclass
+from starlette.concurrency import run_in_threadpool
 
-from ..response_types import JSONResponse, Response
-from .base import ResponseModel, ResponseModelField
+from ..response_types import (
+    FastJSONResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
+from .base import ResponseModel, ResponseModelField, get_handler_serializer_filter
+from .conditional import (
+    ConditionalResponseValidators,
+    get_handler_etag_options,
+    make_etag,
+)
+from .file import StreamingResponseModelInvalidContent
 
 DictModelField: ResponseModelField = t.cast(
     ResponseModelField,
@@ -21,40 +34,145 @@ DictModelField: ResponseModelField = t.cast(
 
 
 class JSONResponseModel(ResponseModel):
+    """
+    Handles endpoint models with a schema, serializing the handler output to JSON
+
+        @get('/', response={200: ASchema})
+        def example():
+            pass
+
+    With `trust_output=True`, handler output that already is an instance of the schema,
+    or a list or dict of them, is serialized without being validated again.
+    When `trust_output` is not set, `TRUST_RESPONSE_OUTPUT` configuration is used.
+
+        @get('/', response={200: JSONResponseModel(model_field_or_schema=List[ASchema], trust_output=True)})
+        def example():
+            pass
+    """
+
     response_type: t.Type[Response] = JSONResponse
 
+    def __init__(
+        self,
+        description: t.Optional[str] = None,
+        model_field_or_schema: t.Union[ResponseModelField, t.Any] = None,
+        trust_output: t.Optional[bool] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(
+            description=description,
+            model_field_or_schema=model_field_or_schema,
+            **kwargs,
+        )
+        self.trust_output = trust_output
+
     def create_response(
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         request_logger.debug(
             f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
         )
-        json_response_class = t.cast(
-            t.Type[JSONResponse],
-            context.get_app().config.DEFAULT_JSON_CLASS or self._response_type,
-        )
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
         )
-        serializer_filter = reflect.get_metadata(
-            SERIALIZER_FILTER_KEY, context.get_handler()
+        etag_options = get_handler_etag_options(context.get_handler())
+        if etag_options is None or response_args.get("status_code", 200) != 200:
+            return self.render_response(context, response_obj, response_args, headers)
+
+        request = context.switch_to_http_connection().get_request()
+        if request.method not in ("GET", "HEAD"):
+            return self.render_response(context, response_obj, response_args, headers)
+
+        validators = etag_options.get_validators(context, response_obj)
+        if validators.is_not_modified(request.headers):
+            # answered before the output is validated and serialized
+            return self.create_not_modified_response(response_args, headers, validators)
+
+        response = self.render_response(context, response_obj, response_args, headers)
+        if validators.etag is None:
+            validators.etag = make_etag(response.body, weak=etag_options.weak)
+            if validators.is_not_modified(request.headers):
+                return self.create_not_modified_response(
+                    response_args, headers, validators
+                )
+        response.headers.update(validators.get_headers())
+        return response
+
+    def render_response(
+        self,
+        context: IExecutionContext,
+        response_obj: t.Any,
+        response_args: t.Dict,
+        headers: t.Dict,
+    ) -> Response:
+        config = context.get_app().config
+        json_response_class = t.cast(
+            t.Type[JSONResponse],
+            config.DEFAULT_JSON_CLASS or self._response_type,
+        )
+        trust_output = (
+            self.trust_output
+            if self.trust_output is not None
+            else config.TRUST_RESPONSE_OUTPUT
         )
+        serializer_filter = get_handler_serializer_filter(context.get_handler())
+        if issubclass(json_response_class, FastJSONResponse):
+            # rendered straight from the validated output
+            return json_response_class(
+                **response_args,
+                content=self.validate_output(
+                    response_obj, trust_output=bool(trust_output)
+                ),
+                headers=headers,
+                serializer_filter=serializer_filter,
+            )
+
         response = json_response_class(
             **response_args,
-            content=self.serialize(response_obj, serializer_filter=serializer_filter),
+            content=self.serialize(
+                response_obj,
+                serializer_filter=serializer_filter,
+                trust_output=bool(trust_output),
+            ),
             headers=headers,
         )
         return response
 
+    @classmethod
+    def create_not_modified_response(
+        cls,
+        response_args: t.Dict,
+        headers: t.Dict,
+        validators: ConditionalResponseValidators,
+    ) -> Response:
+        return Response(
+            status_code=304,
+            headers={**headers, **validators.get_headers()},
+            background=response_args.get("background"),
+        )
+
+    def validate_output(self, response_obj: t.Any, trust_output: bool = False) -> t.Any:
+        """Validates `response_obj` against the response schema without serializing it"""
+        _response_model_field = self.get_model_field()
+        assert _response_model_field, "schema must exist for JSONResponseModel"
+        return _response_model_field.validate_output(
+            response_obj, trust_output=trust_output
+        )
+
     def serialize(
         self,
         response_obj: t.Any,
         serializer_filter: t.Optional[SerializerFilter] = None,
+        trust_output: t.Optional[bool] = None,
     ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
         _response_model_field = self.get_model_field()
         assert _response_model_field, "schema must exist for JSONResponseModel"
         return _response_model_field.serialize(
-            response_obj, serializer_filter=serializer_filter
+            response_obj,
+            serializer_filter=serializer_filter,
+            trust_output=bool(
+                self.trust_output if trust_output is None else trust_output
+            ),
         )
 
 
@@ -65,6 +183,7 @@ class EmptyAPIResponseModel(JSONResponseModel):
         self,
         response_obj: t.Any,
         serializer_filter: t.Optional[SerializerFilter] = None,
+        trust_output: t.Optional[bool] = None,
     ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
         try:
             # try a serialize object
@@ -72,3 +191,174 @@ class EmptyAPIResponseModel(JSONResponseModel):
         except Exception:
             """Failed to auto serialize object"""
         return response_obj
+
+    def validate_output(self, response_obj: t.Any, trust_output: bool = False) -> t.Any:
+        return response_obj
+
+
+def _take(iterator: t.Iterator, count: int) -> t.List:
+    return list(itertools.islice(iterator, count))
+
+
+class StreamingJSONResponseModel(ResponseModel):
+    """
+    Streams endpoint output made of items of a schema, as a JSON array or as NDJSON with `ndjson=True`
+
+        @get('/', response={200: StreamingJSONResponseModel(model_field_or_schema=ASchema)})
+        def example():
+            for row in rows():
+                yield row
+
+    The handler may return any sync or async iterable. Items are read, validated and serialized
+    `batch_size` at a time, and each batch is sent as one chunk, so the whole output is never held in memory.
+    Sync iterators, like generators, are read in a threadpool.
+    Since the response has started when an item fails validation, the error ends the stream.
+
+    OPENAPI documentation shows a list of the schema, or the schema itself for NDJSON.
+    """
+
+    response_type: t.Type[Response] = StreamingResponse
+
+    def __init__(
+        self,
+        description: t.Optional[str] = None,
+        model_field_or_schema: t.Union[ResponseModelField, t.Any] = None,
+        ndjson: bool = False,
+        batch_size: int = 100,
+        trust_output: t.Optional[bool] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        assert batch_size > 0, "batch_size must be greater than 0"
+        kwargs.setdefault(
+            "media_type", "application/x-ndjson" if ndjson else "application/json"
+        )
+        super().__init__(
+            description=description,
+            model_field_or_schema=model_field_or_schema,
+            **kwargs,
+        )
+        self.ndjson = ndjson
+        self.batch_size = batch_size
+        self.trust_output = trust_output
+
+        item_model_field = self._model_field
+        assert item_model_field, "schema must exist for StreamingJSONResponseModel"
+        item_model_field.get_serializer()
+        self._item_model_field = item_model_field
+        if not ndjson:
+            self._model_field = self._get_model_field_from_schema(
+                t.List[item_model_field.outer_type_]  # type:ignore[name-defined]
+            )
+
+    def get_item_model_field(self) -> ResponseModelField:
+        return self._item_model_field
+
+    def create_response(
+        self, context: IExecutionContext, response_obj: t.Any, status_code: int
+    ) -> Response:
+        request_logger.debug(
+            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+        )
+        if isinstance(response_obj, (str, bytes, dict)) or not isinstance(
+            response_obj, (t.Iterable, t.AsyncIterable)
+        ):
+            raise StreamingResponseModelInvalidContent(
+                "Content must typing.AsyncIterable OR typing.Iterable"
+            )
+
+        config = context.get_app().config
+        trust_output = (
+            self.trust_output
+            if self.trust_output is not None
+            else config.TRUST_RESPONSE_OUTPUT
+        )
+        serializer_filter = get_handler_serializer_filter(context.get_handler())
+        encode_item = self.get_item_encoder(
+            config.DEFAULT_JSON_CLASS, serializer_filter, bool(trust_output)
+        )
+
+        response_args, headers = self.get_context_response(
+            context=context, status_code=status_code
+        )
+        return self._response_type(
+            **response_args,
+            headers=headers,
+            media_type=self.media_type,
+            content=self.iter_content(response_obj, encode_item),
+        )
+
+    def get_item_encoder(
+        self,
+        json_response_class: t.Optional[t.Type[JSONResponse]],
+        serializer_filter: t.Optional[SerializerFilter],
+        trust_output: bool,
+    ) -> t.Callable[[t.Any], bytes]:
+        """Returns a function validating an item and encoding it to JSON bytes"""
+        item_model_field = self._item_model_field
+
+        if lenient_issubclass(json_response_class, FastJSONResponse):
+
+            def encode_fast(item: t.Any) -> bytes:
+                return dumps_json(
+                    item_model_field.validate_output(item, trust_output=trust_output),
+                    serializer_filter,
+                )
+
+            return encode_fast
+
+        serializer = item_model_field.get_serializer()
+
+        def encode(item: t.Any) -> bytes:
+            # same output as `JSONResponse.render`
+            return json.dumps(
+                serializer(
+                    item_model_field.validate_output(item, trust_output=trust_output),
+                    serializer_filter,
+                ),
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            ).encode("utf-8")
+
+        return encode
+
+    async def iter_batches(
+        self, content: t.Union[t.Iterable, t.AsyncIterable]
+    ) -> t.AsyncIterator[t.List]:
+        batch_size = self.batch_size
+        if isinstance(content, t.AsyncIterable):
+            batch = []
+            async for item in content:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        elif isinstance(content, (list, tuple)):
+            for start in range(0, len(content), batch_size):
+                yield list(content[start : start + batch_size])
+        else:
+            iterator = iter(content)
+            while True:
+                batch = await run_in_threadpool(_take, iterator, batch_size)
+                if not batch:
+                    break
+                yield batch
+
+    async def iter_content(
+        self,
+        content: t.Union[t.Iterable, t.AsyncIterable],
+        encode_item: t.Callable[[t.Any], bytes],
+    ) -> t.AsyncIterator[bytes]:
+        if self.ndjson:
+            async for batch in self.iter_batches(content):
+                yield b"".join(encode_item(item) + b"\n" for item in batch)
+            return
+
+        prefix = b"["
+        async for batch in self.iter_batches(content):
+            yield prefix + b",".join(encode_item(item) for item in batch)
+            prefix = b","
+        yield b"]" if prefix == b"," else b"[]"
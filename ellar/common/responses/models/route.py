@@ -6,20 +6,31 @@ from ellar.common.logger import logger, request_logger
 from pydantic import BaseModel
 
 from ..response_types import Response
-from .base import ResponseModel, ResponseResolver
+from .base import ResponseModel, ResponseModelField, ResponseResolver
 from .exceptions import RouteResponseExecution
 from .helper import create_response_model
 from .json import EmptyAPIResponseModel, JSONResponseModel
 
 
 class RouteResponseModel:
-    __slots__ = ("models",)
+    __slots__ = (
+        "models",
+        "fallback_hits",
+        "_default_status_code",
+        "_fallback_response_model",
+        "_empty_response_model",
+    )
 
     def __init__(
         self,
         route_responses: t.Dict[int, t.Union[t.Type, IResponseModel, t.Type[Response]]],
     ) -> None:
         self.models: t.Dict[int, IResponseModel] = {}
+        # number of responses with a status code that has no response model
+        self.fallback_hits = 0
+        self._default_status_code: int = 200
+        self._fallback_response_model: t.Optional[IResponseModel] = None
+        self._empty_response_model: t.Optional[IResponseModel] = None
         self.convert_route_responses_to_response_models(route_responses)
 
     def convert_route_responses_to_response_models(
@@ -55,6 +66,36 @@ class RouteResponseModel:
                 description=description,
             )
 
+        self.compile_serializers()
+        self.compile_resolver()
+
+    def compile_resolver(self) -> None:
+        """Computes the default status code and catch-all response model used by `response_resolver`"""
+        self._default_status_code = (
+            next(iter(self.models)) if len(self.models) == 1 else 200
+        )
+        self._fallback_response_model = self.models.get(Ellipsis)  # type: ignore[call-overload]
+
+    def get_fallback_response_model(self, status_code: int) -> IResponseModel:
+        """Returns the `...` response model, or `EmptyAPIResponseModel` for an undeclared status code"""
+        if self._fallback_response_model is not None:
+            return self._fallback_response_model
+
+        self.fallback_hits += 1
+        logger.warning(
+            f"No response Schema with status_code={status_code} in response {self.models.keys()}"
+        )
+        if self._empty_response_model is None:
+            self._empty_response_model = create_response_model(EmptyAPIResponseModel)
+        return self._empty_response_model
+
+    def compile_serializers(self) -> None:
+        """Compiles the serializers of response schemas at route creation instead of on first response"""
+        for response_model in self.models.values():
+            model_field = response_model.get_model_field()
+            if isinstance(model_field, ResponseModelField):
+                model_field.get_serializer()
+
     def response_resolver(
         self,
         ctx: IExecutionContext,
@@ -63,30 +104,21 @@ class RouteResponseModel:
         request_logger.debug(
             f"Resolving Response Structure - '{self.__class__.__name__}'"
         )
-        status_code: int = 200
+        status_code: int = self._default_status_code
         response_obj: t.Any = endpoint_response_content
 
-        if len(self.models) == 1:
-            status_code = list(self.models.keys())[0]
         http_connection = ctx.switch_to_http_connection()
-        if (
-            http_connection.has_response
-            and http_connection.get_response().status_code > 0
-        ):
-            status_code = http_connection.get_response().status_code
+        if http_connection.has_response:
+            response_status_code = http_connection.get_response().status_code
+            if response_status_code > 0:
+                status_code = response_status_code
 
         if isinstance(response_obj, tuple) and len(response_obj) == 2:
             status_code, response_obj = endpoint_response_content
 
-        if status_code in self.models:
-            response_model = self.models[status_code]
-        elif Ellipsis in self.models:
-            response_model = self.models[Ellipsis]  # type: ignore
-        else:
-            logger.warning(
-                f"No response Schema with status_code={status_code} in response {self.models.keys()}"
-            )
-            response_model = create_response_model(EmptyAPIResponseModel)
+        response_model = self.models.get(status_code)
+        if response_model is None:
+            response_model = self.get_fallback_response_model(status_code)
 
         response_model = t.cast(ResponseModel, response_model)
         return ResponseResolver(status_code, response_model, response_obj)
@@ -54,3 +54,14 @@ class ResponseTypeDefinitionConverter(TypeDefinitionConverter):
         if outer_type_ not in self._registry:
             self._registry[outer_type_] = self._get_modified_type(outer_type_)
         return self._registry[outer_type_]
+
+    @classmethod
+    def get_source_types(cls, modified_type: t.Type) -> t.List[t.Type]:
+        """Returns the types that were converted to `modified_type`"""
+        return [
+            source_type
+            for source_type, _modified_type in cls._registry.items()
+            if _modified_type is modified_type
+            and source_type is not modified_type
+            and isinstance(source_type, type)
+        ]
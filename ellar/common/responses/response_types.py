@@ -1,5 +1,8 @@
-from typing import Any
+from typing import Any, Mapping, Optional
 
+from ellar.common.serializer import SerializerFilter
+from ellar.common.serializer.encoder import dumps_json
+from starlette.background import BackgroundTask
 from starlette.responses import (  # noqa
     FileResponse as FileResponse,
 )
@@ -46,3 +49,31 @@ class ORJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
         assert orjson is not None, "orjson must be installed to use ORJSONResponse"
         return orjson.dumps(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson straight from handler output.
+
+    Pydantic models, serializers, dataclasses, enums, datetimes, UUIDs and paths are encoded
+    without converting the content with `serialize_object` first.
+    `serializer_filter` and model `json_encoders` are applied like `serialize_object` does.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        serializer_filter: Optional[SerializerFilter] = None,
+    ) -> None:
+        self.serializer_filter = serializer_filter
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        assert orjson is not None, "orjson must be installed to use FastJSONResponse"
+        return dumps_json(content, self.serializer_filter)
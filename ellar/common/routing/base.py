@@ -26,9 +26,57 @@ if t.TYPE_CHECKING:  # pragma: no cover
 __all__ = [
     "RouteOperationBase",
     "WebsocketRouteOperationBase",
+    "RouteExecutionPipeline",
 ]
 
 
+class RouteExecutionPipeline:
+    """
+    Services a route operation runs each request through.
+    Singleton services are resolved once per application injector, others are resolved per request.
+    """
+
+    __slots__ = (
+        "service_provider",
+        "_execution_context_factory",
+        "_interceptor_consumer",
+        "_guard_consumer",
+    )
+
+    def __init__(self, service_provider: "EllarInjector") -> None:
+        self.service_provider = service_provider
+        self._execution_context_factory: t.Optional[
+            IExecutionContextFactory
+        ] = self._get_singleton(IExecutionContextFactory)
+        self._interceptor_consumer: t.Optional[
+            IInterceptorsConsumer
+        ] = self._get_singleton(IInterceptorsConsumer)
+        self._guard_consumer: t.Optional[IGuardsConsumer] = self._get_singleton(
+            IGuardsConsumer
+        )
+
+    def _get_singleton(self, interface: t.Type) -> t.Any:
+        if self.service_provider.is_singleton(interface):
+            return self.service_provider.get(interface)
+        return None
+
+    @property
+    def execution_context_factory(self) -> IExecutionContextFactory:
+        return self._execution_context_factory or self.service_provider.get(
+            IExecutionContextFactory
+        )
+
+    @property
+    def interceptor_consumer(self) -> IInterceptorsConsumer:
+        return self._interceptor_consumer or self.service_provider.get(
+            IInterceptorsConsumer
+        )
+
+    @property
+    def guard_consumer(self) -> IGuardsConsumer:
+        return self._guard_consumer or self.service_provider.get(IGuardsConsumer)
+
+
 class RouteOperationBase:
     methods: t.Set[str]
 
@@ -40,6 +88,8 @@ class RouteOperationBase:
         self._controller_type: t.Union[t.Type, t.Type["ControllerBase"]] = t.cast(
             t.Union[t.Type, t.Type["ControllerBase"]], _controller_type
         )
+        self._allowed_versions: t.Optional[t.Set[t.Union[int, float, str]]] = None
+        self._execution_pipeline: t.Optional[RouteExecutionPipeline] = None
 
     # @t.no_type_check
     # def __call__(
@@ -55,21 +105,27 @@ class RouteOperationBase:
         request_logger.debug(
             f"Started Computing Execution Context - '{self.__class__.__name__}'"
         )
-        service_provider: "EllarInjector" = scope[SCOPE_SERVICE_PROVIDER]
+        pipeline = self.get_execution_pipeline(scope[SCOPE_SERVICE_PROVIDER])
 
-        execution_context_factory = service_provider.get(IExecutionContextFactory)
-        context = execution_context_factory.create_context(
+        context = pipeline.execution_context_factory.create_context(
             operation=self, scope=scope, receive=receive, send=send
         )
 
-        interceptor_consumer = service_provider.get(IInterceptorsConsumer)
-        guard_consumer = service_provider.get(IGuardsConsumer)
-
         request_logger.debug(
             f"Running Guards and Interceptors - '{self.__class__.__name__}'"
         )
-        await guard_consumer.execute(context, self)
-        await interceptor_consumer.execute(context, self)
+        await pipeline.guard_consumer.execute(context, self)
+        await pipeline.interceptor_consumer.execute(context, self)
+
+    def get_execution_pipeline(
+        self, service_provider: "EllarInjector"
+    ) -> RouteExecutionPipeline:
+        # operations can be shared by more than one application, so the pipeline is tied to an injector
+        pipeline = self._execution_pipeline
+        if pipeline is None or pipeline.service_provider is not service_provider:
+            pipeline = RouteExecutionPipeline(service_provider)
+            self._execution_pipeline = pipeline
+        return pipeline
 
     def get_controller_type(self) -> t.Type:
         """
@@ -99,16 +155,18 @@ class RouteOperationBase:
         """returns a any"""
 
     def get_allowed_version(self) -> t.Set[t.Union[int, float, str]]:
-        request_logger.debug(
-            f"Resolving Endpoint Versions - '{self.__class__.__name__}'"
-        )
-        versions = reflect.get_metadata(VERSIONING_KEY, self.endpoint) or set()
-        if not versions:
-            versions = (
-                reflect.get_metadata(VERSIONING_KEY, self.get_controller_type())
-                or set()
+        if self._allowed_versions is None:
+            request_logger.debug(
+                f"Resolving Endpoint Versions - '{self.__class__.__name__}'"
             )
-        return versions
+            versions = reflect.get_metadata(VERSIONING_KEY, self.endpoint) or set()
+            if not versions:
+                versions = (
+                    reflect.get_metadata(VERSIONING_KEY, self.get_controller_type())
+                    or set()
+                )
+            self._allowed_versions = versions
+        return self._allowed_versions
 
     @classmethod
     def get_methods(cls, methods: t.Optional[t.List[str]] = None) -> t.Set[str]:
@@ -127,19 +185,23 @@ class RouteOperationBase:
         )
 
         match = super().matches(scope)  # type: ignore
-        if match[0] is Match.FULL:
-            version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
-                "BaseAPIVersioningResolver", scope[SCOPE_API_VERSIONING_RESOLVER]
-            )
-            if not version_scheme_resolver.can_activate(
-                route_versions=self.get_allowed_version()
-            ):
-                request_logger.debug(
-                    f"URL Matched with invalid Version - '{self.__class__.__name__}'"
-                )
-                return Match.NONE, {}
+        if match[0] is Match.FULL and not self.can_activate_version(scope):
+            return Match.NONE, {}
         return match  # type: ignore
 
+    def can_activate_version(self, scope: TScope) -> bool:
+        version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
+            "BaseAPIVersioningResolver", scope[SCOPE_API_VERSIONING_RESOLVER]
+        )
+        if not version_scheme_resolver.can_activate(
+            route_versions=self.get_allowed_version()
+        ):
+            request_logger.debug(
+                f"URL Matched with invalid Version - '{self.__class__.__name__}'"
+            )
+            return False
+        return True
+
     def __hash__(self) -> int:  # pragma: no cover
         return hash(self.endpoint)
 
@@ -0,0 +1,124 @@
+import typing as t
+import uuid
+
+from ellar.common.types import TReceive, TScope, TSend
+from starlette.datastructures import URLPath
+from starlette.exceptions import HTTPException
+from starlette.responses import PlainTextResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+__all__ = ["RouteMethodGroup"]
+
+
+class RouteMethodGroup(BaseRoute):
+    """
+    Path level node for HTTP routes that share a path but differ in methods.
+
+    Routes are indexed by method, so a request is matched against the route of its method only.
+    When no route handles the request method, the group matches partially
+    and responds `405 Method Not Allowed` with every method available on the path.
+    """
+
+    __slots__ = (
+        "path",
+        "routes",
+        "methods",
+        "_method_routes",
+        "_found_route_key",
+    )
+
+    def __init__(self, routes: t.Sequence[BaseRoute]) -> None:
+        assert routes, "RouteMethodGroup requires at least one route"
+        self.routes = list(routes)
+        self.path: str = getattr(self.routes[0], "path", "")
+
+        self._method_routes: t.Dict[str, t.List[BaseRoute]] = {}
+        for route in self.routes:
+            for method in getattr(route, "methods", ()):
+                self._method_routes.setdefault(method, []).append(route)
+
+        self.methods: t.Set[str] = set(self._method_routes)
+        self._found_route_key = f"{uuid.uuid4().hex:4}_RouteMethodGroup"
+
+    @classmethod
+    def get_group_key(cls, route: BaseRoute) -> t.Optional[t.Hashable]:
+        """
+        Routes with the same key can be grouped.
+        Routes define it through `get_method_group_key`; `None` means the route can not be grouped.
+        """
+        get_method_group_key = getattr(route, "get_method_group_key", None)
+        return get_method_group_key() if get_method_group_key else None
+
+    @classmethod
+    def group_routes(cls, routes: t.Sequence[BaseRoute]) -> t.List[BaseRoute]:
+        """
+        Replaces adjacent routes sharing a group key and having more than one method between them
+        with a `RouteMethodGroup`. Route order is kept.
+        """
+        results: t.List[BaseRoute] = []
+        idx = 0
+        while idx < len(routes):
+            key = cls.get_group_key(routes[idx])
+            end = idx + 1
+            if key is not None:
+                while end < len(routes) and cls.get_group_key(routes[end]) == key:
+                    end += 1
+
+            members = routes[idx:end]
+            methods = {
+                method for route in members for method in getattr(route, "methods", ())
+            }
+            if len(members) > 1 and len(methods) > 1:
+                results.append(cls(members))
+            else:
+                results.extend(members)
+            idx = end
+        return results
+
+    def get_allow_header(self) -> str:
+        return ", ".join(sorted(self.methods))
+
+    def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
+        if scope["type"] != "http":
+            return Match.NONE, {}
+
+        method = scope["method"]
+        for route in self._method_routes.get(method, ()):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                child_scope[self._found_route_key] = route
+                return Match.FULL, child_scope
+
+        for route in self.routes:
+            if method not in getattr(route, "methods", ()):
+                # any route of another method tells if the path matched
+                match, child_scope = route.matches(scope)
+                if match == Match.PARTIAL:
+                    return Match.PARTIAL, child_scope
+                break
+        return Match.NONE, {}
+
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        for route in self.routes:
+            try:
+                return route.url_path_for(__name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(__name, path_params)
+
+    async def handle(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        route = t.cast(t.Optional[BaseRoute], scope.pop(self._found_route_key, None))
+        if route is not None:
+            await route.handle(scope, receive, send)
+            return
+
+        headers = {"Allow": self.get_allow_header()}
+        if "app" in scope:
+            raise HTTPException(status_code=405, headers=headers)
+        response = PlainTextResponse(
+            "Method Not Allowed", status_code=405, headers=headers
+        )
+        await response(scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, methods={sorted(self.methods)!r})"
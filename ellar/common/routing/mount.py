@@ -1,22 +1,41 @@
+import re
 import typing as t
 import uuid
 
-from ellar.common.constants import CONTROLLER_CLASS_KEY, GUARDS_KEY, VERSIONING_KEY
+from ellar.common.constants import (
+    CONTROLLER_CLASS_KEY,
+    GUARDS_KEY,
+    SCOPE_API_VERSIONING_RESOLVER,
+    VERSIONING_KEY,
+)
 from ellar.common.helper import get_unique_control_type
 from ellar.common.logger import request_logger
 from ellar.common.models import GuardCanActivate
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.reflect import reflect
-from starlette.routing import BaseRoute, Match, Route, Router
+from starlette.datastructures import URLPath
+from starlette.routing import (
+    BaseRoute,
+    Match,
+    NoMatchFound,
+    Route,
+    Router,
+    compile_path,
+)
 from starlette.routing import Mount as StarletteMount
 from starlette.types import ASGIApp
 
+from .base import RouteOperationBase, WebsocketRouteOperationBase
+from .method_group import RouteMethodGroup
 from .operation_definitions import OperationDefinitions
+from .path_formatter import get_path_formatter
 from .route import RouteOperation
 from .route_collections import RouteCollection
 from .schema import RouteParameters, WsRouteParameters
 
-__all__ = ["ModuleMount", "ModuleRouter"]
+__all__ = ["ModuleMount", "ModuleRouter", "ModuleMountRoute"]
+
+_MOUNT_PATH_GROUP = "__ellar_mount_path__"
 
 
 class ModuleMount(StarletteMount):
@@ -37,6 +56,21 @@ class ModuleMount(StarletteMount):
     def get_control_type(self) -> t.Type:
         return self._control_type
 
+    def build_flatten_routes(self) -> t.Optional[t.List["ModuleMountRoute"]]:
+        """
+        Lifts child operations into routes that can be matched directly by a parent router.
+        Returns `None` when a child route is not an operation and the mount has to be kept as is.
+        """
+        mount_params = set(self.param_convertors.keys()) - {"path"}
+        results = []
+        for route in self.routes:
+            if not isinstance(route, RouteOperationBase) or mount_params.intersection(
+                getattr(route, "param_convertors", {})
+            ):
+                return None
+            results.append(ModuleMountRoute(mount=self, operation=route))
+        return results
+
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
         request_logger.debug(
             f"Matching URL Handler path={scope['path']} - '{self.__class__.__name__}'"
@@ -45,10 +79,16 @@ class ModuleMount(StarletteMount):
         if match == Match.FULL:
             scope_copy = dict(scope)
             scope_copy.update(_child_scope)
-            partial: t.Optional[RouteOperation] = None
+            partial: t.Optional[BaseRoute] = None
             partial_scope = {}
 
-            for route in self.routes:
+            routes = self.routes
+            if isinstance(routes, RouteCollection):
+                routes = routes.get_match_candidates(
+                    scope_copy["path"], scope.get(SCOPE_API_VERSIONING_RESOLVER)
+                )
+
+            for route in routes:
                 # Determine if any route matches the incoming scope,
                 # and hand over to the matching route if found.
                 match, child_scope = route.matches(scope_copy)
@@ -59,7 +99,7 @@ class ModuleMount(StarletteMount):
                 elif (
                     match == Match.PARTIAL
                     and partial is None
-                    and isinstance(route, RouteOperation)
+                    and isinstance(route, (RouteOperation, RouteMethodGroup))
                 ):
                     partial = route
                     partial_scope = dict(_child_scope)
@@ -71,11 +111,39 @@ class ModuleMount(StarletteMount):
 
         return Match.NONE, {}
 
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        routes = self.routes
+        if not isinstance(routes, RouteCollection) or (
+            self.name is not None and __name == self.name and "path" in path_params
+        ):
+            return super().url_path_for(__name, **path_params)
+
+        if self.name is None or __name.startswith(self.name + ":"):
+            remaining_name = (
+                __name if self.name is None else __name[len(self.name) + 1 :]
+            )
+            path_kwarg = path_params.get("path")
+            path_params["path"] = ""
+            path_prefix, remaining_params = get_path_formatter(
+                self.path_format, self.param_convertors
+            ).format(path_params)
+            if path_kwarg is not None:
+                remaining_params["path"] = path_kwarg
+            try:
+                url = routes.url_path_for(remaining_name, **remaining_params)
+            except NoMatchFound:
+                pass
+            else:
+                return URLPath(
+                    path=path_prefix.rstrip("/") + str(url), protocol=url.protocol
+                )
+        raise NoMatchFound(__name, path_params)
+
     async def handle(self, scope: TScope, receive: TReceive, send: TSend) -> None:
         request_logger.debug(
             f"Executing Matched URL Handler, path={scope['path']} - '{self.__class__.__name__}'"
         )
-        route = t.cast(t.Optional[Route], scope.get(self._current_found_route_key))
+        route = t.cast(t.Optional[BaseRoute], scope.get(self._current_found_route_key))
         if route:
             del scope[self._current_found_route_key]
             await route.handle(scope, receive, send)
@@ -84,6 +152,105 @@ class ModuleMount(StarletteMount):
             await mount_router.default(scope, receive, send)
 
 
+class ModuleMountRoute(BaseRoute):
+    """
+    A `ModuleMount` child operation with the mount path combined into its path regex.
+    Matching it gives the same scope the operation would get when matched through its mount.
+    """
+
+    __slots__ = (
+        "mount",
+        "operation",
+        "path",
+        "path_regex",
+        "param_convertors",
+        "_scope_type",
+    )
+
+    def __init__(self, *, mount: ModuleMount, operation: RouteOperationBase) -> None:
+        self.mount = mount
+        self.operation = operation
+
+        route_operation = t.cast(Route, operation)
+        self.path = mount.path + route_operation.path
+
+        mount_pattern = ""
+        self.param_convertors = {}
+        if mount.path:
+            mount_regex, _, mount_convertors = compile_path(mount.path)
+            mount_pattern = mount_regex.pattern[1:-1]
+            self.param_convertors.update(mount_convertors)
+        self.param_convertors.update(route_operation.param_convertors)
+
+        self.path_regex = re.compile(
+            f"^(?P<{_MOUNT_PATH_GROUP}>{mount_pattern})"
+            f"{route_operation.path_regex.pattern[1:]}"
+        )
+        self._scope_type = (
+            "websocket"
+            if isinstance(operation, WebsocketRouteOperationBase)
+            else "http"
+        )
+
+    def get_control_type(self) -> t.Type:
+        return self.mount.get_control_type()
+
+    def get_allowed_version(self) -> t.Set[t.Union[int, float, str]]:
+        return self.operation.get_allowed_version()
+
+    @property
+    def methods(self) -> t.Set[str]:
+        return self.operation.methods
+
+    def get_method_group_key(self) -> t.Optional[t.Hashable]:
+        if self._scope_type != "http":
+            return None
+        return self.mount, self.path
+
+    def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
+        if scope["type"] != self._scope_type:
+            return Match.NONE, {}
+
+        path = scope["path"]
+        match = self.path_regex.match(path)
+        if not match:
+            return Match.NONE, {}
+
+        matched_params = match.groupdict()
+        matched_path = matched_params.pop(_MOUNT_PATH_GROUP)
+        for key, value in matched_params.items():
+            matched_params[key] = self.param_convertors[key].convert(value)
+
+        path_params = dict(scope.get("path_params", {}))
+        path_params.update(matched_params)
+        root_path = scope.get("root_path", "")
+        child_scope = {
+            "endpoint": self.operation.endpoint,
+            "path_params": path_params,
+            "app_root_path": scope.get("app_root_path", root_path),
+            "root_path": root_path + matched_path,
+            "path": path[len(matched_path) :],
+        }
+
+        methods = self.operation.methods
+        if self._scope_type == "http" and methods and scope["method"] not in methods:
+            return Match.PARTIAL, child_scope
+
+        if not self.operation.can_activate_version(scope):
+            return Match.NONE, {}
+        return Match.FULL, child_scope
+
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        # reverse lookups go through the mount this route was lifted from
+        raise NoMatchFound(__name, path_params)
+
+    async def handle(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        await t.cast(Route, self.operation).handle(scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, operation={self.operation!r})"
+
+
 class ModuleRouter(OperationDefinitions, ModuleMount):
     routes: RouteCollection  # type:ignore
 
@@ -0,0 +1,74 @@
+import functools
+import re
+import typing as t
+
+from starlette.convertors import Convertor
+
+__all__ = ["PathFormatter", "get_path_formatter"]
+
+PARAM_REGEX = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)}")
+
+
+class PathFormatter:
+    """
+    Compiled form of a route `path_format`.
+
+    The path is split once into literal parts and parameter slots, so building
+    a path is a single join instead of a string replace per parameter.
+    It returns the same result as `starlette.routing.replace_params`.
+    """
+
+    __slots__ = ("_parts", "_param_names")
+
+    def __init__(
+        self, path_format: str, param_convertors: t.Dict[str, Convertor]
+    ) -> None:
+        self._parts: t.List[t.Tuple[str, t.Optional[Convertor]]] = []
+        self._param_names: t.Set[str] = set()
+
+        idx = 0
+        for match in PARAM_REGEX.finditer(path_format):
+            param_name = match.group(1)
+            self._parts.append((path_format[idx : match.start()], None))
+            self._parts.append((param_name, param_convertors[param_name]))
+            self._param_names.add(param_name)
+            idx = match.end()
+        self._parts.append((path_format[idx:], None))
+
+    def format(
+        self, path_params: t.Dict[str, t.Any]
+    ) -> t.Tuple[str, t.Dict[str, t.Any]]:
+        """
+        Returns the path with `path_params` filled in,
+        and the parameters that are not part of the path.
+        """
+        path = "".join(
+            value
+            if convertor is None
+            else (
+                convertor.to_string(path_params[value])
+                if value in path_params
+                else "{" + value + "}"
+            )
+            for value, convertor in self._parts
+        )
+        remaining_params = {
+            key: value
+            for key, value in path_params.items()
+            if key not in self._param_names
+        }
+        return path, remaining_params
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path_formatter(
+    path_format: str, param_convertors: t.Tuple[t.Tuple[str, Convertor], ...]
+) -> PathFormatter:
+    return PathFormatter(path_format, dict(param_convertors))
+
+
+def get_path_formatter(
+    path_format: str, param_convertors: t.Dict[str, Convertor]
+) -> PathFormatter:
+    """Returns a cached `PathFormatter` for a route path format"""
+    return _compile_path_formatter(path_format, tuple(param_convertors.items()))
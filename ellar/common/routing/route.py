@@ -15,11 +15,13 @@ from ellar.common.params import ExtraEndpointArg, RequestEndpointArgsModel
 from ellar.common.responses.models import RouteResponseModel
 from ellar.reflect import reflect
 from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import URLPath
 from starlette.responses import Response
+from starlette.routing import NoMatchFound, compile_path
 from starlette.routing import Route as StarletteRoute
-from starlette.routing import compile_path
 
 from .base import RouteOperationBase
+from .path_formatter import get_path_formatter
 
 
 class RouteOperation(RouteOperationBase, StarletteRoute):
@@ -107,6 +109,18 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
             name=self.name, path=self.path_format, methods=_methods
         )
 
+    def get_method_group_key(self) -> t.Hashable:
+        return self.path
+
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        if __name != self.name or path_params.keys() != self.param_convertors.keys():
+            raise NoMatchFound(__name, path_params)
+
+        path, _ = get_path_formatter(self.path_format, self.param_convertors).format(
+            path_params
+        )
+        return URLPath(path=path, protocol="http")
+
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
         request_logger.debug(
             f"Executing Request Endpoint Handler - '{self.__class__.__name__}'"
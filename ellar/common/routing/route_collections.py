@@ -3,16 +3,38 @@ import uuid
 from collections import OrderedDict
 
 from ellar.common.helper import generate_controller_operation_unique_id
+from ellar.common.interfaces import IAPIVersioningResolver
 from ellar.common.logger import logger
-from starlette.routing import BaseRoute, Host, Mount
+from starlette.datastructures import URLPath
+from starlette.routing import BaseRoute, Host, Mount, NoMatchFound
+
+from .method_group import RouteMethodGroup
+from .route_tree import RouteTree
 
 
 class RouteCollection(t.Sequence[BaseRoute]):
-    __slots__ = ("_routes", "_served_routes")
+    __slots__ = (
+        "_routes",
+        "_served_routes",
+        "_matching_routes",
+        "_route_tree",
+        "_version_trees",
+        "_undeclared_version_trees",
+        "_compiled",
+        "_flatten",
+        "_name_index",
+    )
 
     def __init__(self, routes: t.Optional[t.Sequence[BaseRoute]] = None) -> None:
         self._routes: t.Dict[int, BaseRoute] = OrderedDict()
         self._served_routes: t.List[BaseRoute] = []
+        self._matching_routes: t.List[BaseRoute] = []
+        self._route_tree: t.Optional[RouteTree] = None
+        self._version_trees: t.Dict[t.Hashable, RouteTree] = {}
+        self._undeclared_version_trees: t.Dict[bool, RouteTree] = {}
+        self._compiled = False
+        self._flatten = False
+        self._name_index: t.Dict[str, t.List[BaseRoute]] = {}
         self.extend([] if routes is None else list(routes))
 
     @t.no_type_check
@@ -42,12 +64,183 @@ class RouteCollection(t.Sequence[BaseRoute]):
         self.sort_routes()
         return self
 
+    @property
+    def compiled(self) -> bool:
+        return self._compiled
+
+    @property
+    def flattened(self) -> bool:
+        return self._flatten
+
+    def compile(self) -> None:
+        """
+        Indexes routes in a `RouteTree` so that `get_match_candidates`
+        only returns routes that can possibly match a path.
+        A tree is also built for each declared API version, holding only the routes
+        that version can activate.
+        Child route collections of mounted routers are compiled as well.
+        """
+        self._compiled = True
+        self._build_matching_routes()
+
+    def flatten(self) -> None:
+        """
+        Replaces mounts that support `build_flatten_routes` with their child operations
+        in the routes used for matching, so a request is matched in a single pass.
+        Served routes, used for `url_path_for` and documentation, are left untouched.
+        """
+        self._flatten = True
+        self._build_matching_routes()
+
+    def get_match_candidates(
+        self,
+        path: str,
+        version_resolver: t.Optional[IAPIVersioningResolver] = None,
+    ) -> t.Sequence[BaseRoute]:
+        if self._route_tree is None:
+            return self._matching_routes
+
+        table_key = version_resolver.get_route_table_key() if version_resolver else None
+        if table_key is not None:
+            _, is_default_version = t.cast(t.Tuple[t.Any, bool], table_key)
+            tree = self._version_trees.get(table_key)
+            if tree is None:
+                tree = self._undeclared_version_trees[is_default_version]
+            return tree.find(path)
+
+        return self._route_tree.find(path)
+
+    def get_route_names(self) -> t.KeysView[str]:
+        """Names, including mount prefixes, that `url_path_for` can resolve"""
+        return self._name_index.keys()
+
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        """
+        Reverse lookup of a route name through the name index.
+        Only routes that can resolve the name are tried.
+        """
+        routes = self._name_index.get(__name)
+        if routes is None:
+            # routes added to a child collection after this index was built
+            routes = self._served_routes
+
+        for route in routes:
+            try:
+                return route.url_path_for(__name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(__name, path_params)
+
     def sort_routes(self) -> None:
-        # TODO: flatten the routes for faster look up
         self._served_routes = list(self._routes.values())
         self._served_routes.sort(
             key=lambda e: e.host if isinstance(e, Host) else e.path  # type: ignore
         )
+        self._build_name_index()
+        self._build_matching_routes()
+
+    def _build_name_index(self) -> None:
+        name_index: t.Dict[str, t.List[BaseRoute]] = {}
+        for route in self._served_routes:
+            for name in self._get_reverse_names(route):
+                routes = name_index.setdefault(name, [])
+                if not routes or routes[-1] is not route:
+                    routes.append(route)
+        self._name_index = name_index
+
+    @classmethod
+    def _get_reverse_names(cls, route: BaseRoute) -> t.Iterator[str]:
+        """
+        Yields names `route.url_path_for` can resolve,
+        following `starlette.routing.Mount.url_path_for` naming for mounts and hosts.
+        """
+        name = getattr(route, "name", None)
+        if not isinstance(route, (Mount, Host)):
+            if name is not None:
+                yield name
+            return
+
+        if name is not None:
+            yield name
+
+        child_routes = route.routes
+        if isinstance(child_routes, RouteCollection):
+            child_names: t.Iterable[str] = child_routes.get_route_names()
+        else:
+            child_names = (
+                child_name
+                for child_route in child_routes or []
+                for child_name in cls._get_reverse_names(child_route)
+            )
+
+        for child_name in child_names:
+            yield child_name if name is None else f"{name}:{child_name}"
+
+    def _build_matching_routes(self) -> None:
+        matching_routes = self._served_routes
+        if self._flatten:
+            matching_routes = []
+            for route in self._served_routes:
+                build_flatten_routes = getattr(route, "build_flatten_routes", None)
+                flatten_routes = (
+                    build_flatten_routes() if build_flatten_routes else None
+                )
+                if flatten_routes is None:
+                    matching_routes.append(route)
+                else:
+                    matching_routes.extend(flatten_routes)
+        self._matching_routes = RouteMethodGroup.group_routes(matching_routes)
+
+        self._route_tree = None
+        self._version_trees = {}
+        self._undeclared_version_trees = {}
+        if self._compiled:
+            self._route_tree = RouteTree(self._matching_routes)
+            self._build_version_trees()
+            for route in self._matching_routes:
+                child_routes = getattr(route, "routes", None)
+                if (
+                    isinstance(child_routes, RouteCollection)
+                    and not child_routes.compiled
+                ):
+                    child_routes.compile()
+
+    def _build_version_trees(self) -> None:
+        """
+        Mirrors `BaseAPIVersioningResolver.can_activate`: versioned routes are active for their
+        versions, un-versioned routes only for the default version.
+        Routes without versions of their own, like mounts, are kept in every tree.
+        """
+        routes_versions: t.List[t.Tuple[BaseRoute, t.Optional[t.Set]]] = [
+            (
+                route,
+                set(route.get_allowed_version())
+                if hasattr(route, "get_allowed_version")
+                else None,
+            )
+            for route in self._matching_routes
+        ]
+        declared_versions: t.Set[t.Any] = set()
+        for _, versions in routes_versions:
+            declared_versions.update(versions or ())
+
+        for is_default_version in (True, False):
+            for version in declared_versions:
+                self._version_trees[(version, is_default_version)] = RouteTree(
+                    [
+                        route
+                        for route, versions in routes_versions
+                        if versions is None
+                        or (version in versions if versions else is_default_version)
+                    ]
+                )
+            self._undeclared_version_trees[is_default_version] = RouteTree(
+                [
+                    route
+                    for route, versions in routes_versions
+                    if versions is None or (not versions and is_default_version)
+                ]
+            )
 
     def _add_operation(self, operation: t.Union[BaseRoute]) -> None:
         if not isinstance(operation, BaseRoute):
@@ -0,0 +1,72 @@
+import typing as t
+
+from starlette.routing import BaseRoute, Host
+
+__all__ = ["RouteTree"]
+
+
+class RouteTreeNode:
+    __slots__ = ("children", "routes")
+
+    def __init__(self) -> None:
+        self.children: t.Dict[str, "RouteTreeNode"] = {}
+        self.routes: t.List[t.Tuple[int, BaseRoute]] = []
+
+
+class RouteTree:
+    """
+    Prefix tree of route paths keyed by static path segments.
+
+    Each route is stored on the node reached by the static segments of its path,
+    up to the first parameterised segment. A lookup walks the request path through
+    the tree and returns only the routes found along the way, in their original order,
+    leaving the final regex matching to `route.matches`.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, routes: t.Sequence[BaseRoute]) -> None:
+        self._root = RouteTreeNode()
+        for index, route in enumerate(routes):
+            self._insert(index, route)
+
+    @classmethod
+    def get_static_segments(cls, route: BaseRoute) -> t.List[str]:
+        path = getattr(route, "path", None)
+        if isinstance(route, Host) or not isinstance(path, str) or not path:
+            return []
+
+        segments = []
+        for segment in path.split("/")[1:]:
+            if "{" in segment:
+                break
+            segments.append(segment)
+        return segments
+
+    def _insert(self, index: int, route: BaseRoute) -> None:
+        node = self._root
+        for segment in self.get_static_segments(route):
+            node = node.children.setdefault(segment, RouteTreeNode())
+        node.routes.append((index, route))
+
+    def find(self, path: str) -> t.List[BaseRoute]:
+        node = self._root
+        found = [node.routes] if node.routes else []
+
+        for segment in path.split("/")[1:]:
+            _node = node.children.get(segment)
+            if _node is None:
+                break
+            node = _node
+            if node.routes:
+                found.append(node.routes)
+
+        if len(found) == 1:
+            return [route for _, route in found[0]]
+
+        return [
+            route
+            for _, route in sorted(
+                (item for items in found for item in items), key=lambda e: e[0]
+            )
+        ]
@@ -2,6 +2,7 @@ import json
 import typing as t
 
 from ellar.common.exceptions import WebSocketRequestValidationError
+from ellar.common.helper.json_decoder import JSONDecoder, decode_json
 from ellar.common.interfaces import IExecutionContext
 from ellar.common.logger import request_logger
 from ellar.common.params import WebsocketEndpointArgsModel
@@ -132,6 +133,11 @@ class WebSocketExtraHandler:
                 context.switch_to_websocket().get_client(), close_code
             )
 
+    @classmethod
+    def get_json_decoder(cls, websocket: "WebSocket") -> t.Optional[JSONDecoder]:
+        app = websocket.scope.get("app")
+        return app.config.JSON_DECODER if app is not None else None
+
     async def decode(self, websocket: "WebSocket", message: Message) -> t.Any:
         request_logger.debug(
             f"Decoding websocket stream message from '{self.__class__.__name__}'"
@@ -159,7 +165,7 @@ class WebSocketExtraHandler:
                 text = message["bytes"].decode("utf-8")
 
             try:
-                return json.loads(text)
+                return decode_json(text, self.get_json_decoder(websocket))
             except json.decoder.JSONDecodeError as e:
                 raise WebSocketException(
                     code=status.WS_1003_UNSUPPORTED_DATA,
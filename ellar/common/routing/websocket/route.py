@@ -14,12 +14,14 @@ from ellar.common.interfaces import IExecutionContext
 from ellar.common.logger import request_logger
 from ellar.common.params import ExtraEndpointArg, WebsocketEndpointArgsModel
 from ellar.reflect import reflect
+from starlette.datastructures import URLPath
+from starlette.routing import NoMatchFound, compile_path
 from starlette.routing import WebSocketRoute as StarletteWebSocketRoute
-from starlette.routing import compile_path
 from starlette.status import WS_1008_POLICY_VIOLATION
 from starlette.websockets import WebSocketState
 
 from ..base import WebsocketRouteOperationBase
+from ..path_formatter import get_path_formatter
 from .handler import WebSocketExtraHandler
 
 
@@ -74,6 +76,15 @@ class WebsocketRouteOperation(WebsocketRouteOperationBase, StarletteWebSocketRou
             self._handlers_kwargs.update(on_receive=self.endpoint)
         self._load_model()
 
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        if __name != self.name or path_params.keys() != self.param_convertors.keys():
+            raise NoMatchFound(__name, path_params)
+
+        path, _ = get_path_formatter(self.path_format, self.param_convertors).format(
+            path_params
+        )
+        return URLPath(path=path, protocol="websocket")
+
     @classmethod
     def get_websocket_handler(cls) -> t.Type[WebSocketExtraHandler]:
         return WebSocketExtraHandler
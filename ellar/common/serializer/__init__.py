@@ -6,18 +6,26 @@ from .base import (
     SerializerConfig,
     SerializerFilter,
     convert_dataclass_to_pydantic_model,
+    default_serializer_filter,
     get_dataclass_pydantic_model,
     serialize_object,
 )
+from .compiler import FieldSerializer, compile_field_serializer
+from .encoder import ORJSONEncoder, dumps_json
 
 __all__ = [
     "Serializer",
     "SerializerConfig",
     "SerializerFilter",
+    "default_serializer_filter",
     "SerializerBase",
     "DataclassSerializer",
     "BaseSerializer",
     "convert_dataclass_to_pydantic_model",
     "serialize_object",
     "get_dataclass_pydantic_model",
+    "FieldSerializer",
+    "compile_field_serializer",
+    "ORJSONEncoder",
+    "dumps_json",
 ]
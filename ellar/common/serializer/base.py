@@ -1,11 +1,15 @@
 import typing as t
+import uuid
+import weakref
 from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime, time, timedelta
 from enum import Enum
 from pathlib import PurePath
-from types import GeneratorType
+from types import GeneratorType, MappingProxyType
 
 from pydantic import BaseConfig, BaseModel
 from pydantic import dataclasses as PydanticDataclasses
+from pydantic.fields import SHAPE_SINGLETON, ModelField
 from pydantic.json import ENCODERS_BY_TYPE
 
 __pydantic_model__ = "__pydantic_model__"
@@ -43,6 +47,38 @@ class SerializerFilter:
     def dict(self) -> t.Dict:
         return asdict(self)
 
+    def get_kwargs(self) -> t.Mapping[str, t.Any]:
+        """
+        Returns `dict()` as read-only keyword arguments of `BaseModel.dict`.
+        It is computed once and recomputed only when the filter changes.
+        `include` and `exclude` mappings can change in place, so they are not cached.
+        """
+        kwargs = self.__dict__.get("_kwargs")
+        if kwargs is None:
+            kwargs = MappingProxyType(self.dict())
+            if not isinstance(self.include, t.Mapping) and not isinstance(
+                self.exclude, t.Mapping
+            ):
+                self.__dict__["_kwargs"] = kwargs
+        return t.cast(t.Mapping[str, t.Any], kwargs)
+
+    def __post_init_post_parse__(self) -> None:
+        # called once fields are validated, which turns sets into mutable sets
+        self.__dict__["include"] = _freeze_field_set(self.include)
+        self.__dict__["exclude"] = _freeze_field_set(self.exclude)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        if name in ("include", "exclude"):
+            value = _freeze_field_set(value)
+        super().__setattr__(name, value)
+        self.__dict__.pop("_kwargs", None)
+
+
+def _freeze_field_set(value: t.Any) -> t.Any:
+    if isinstance(value, t.AbstractSet):
+        return frozenset(value)
+    return value
+
 
 _serializer_filter = get_dataclass_pydantic_model(SerializerFilter)
 if _serializer_filter and hasattr(_serializer_filter, "update_forward_refs"):
@@ -67,7 +103,7 @@ class SerializerBase(BaseSerializer):
         _filter = serializer_filter or self._filter
         return t.cast(
             dict,
-            self.dict(**_filter.dict()),
+            self.dict(**_filter.get_kwargs()),
         )
 
 
@@ -85,14 +121,146 @@ class DataclassSerializer(BaseSerializer):
             cls._pydantic_model = convert_dataclass_to_pydantic_model(cls)
         return cls._pydantic_model
 
+    @classmethod
+    def get_fields_plan(cls) -> t.Optional[t.Tuple["_DataclassFieldPlan", ...]]:
+        """
+        Returns the fields read by `serialize` without pydantic validation,
+        or None when the pydantic model can change a field value or its key.
+        """
+        if cls not in _dataclass_fields_plans:
+            _dataclass_fields_plans[cls] = _compile_fields_plan(
+                cls.get_pydantic_model()
+            )
+        return _dataclass_fields_plans[cls]
+
+    def _serialize_fields(
+        self, serializer_filter: SerializerFilter
+    ) -> t.Optional[t.Dict]:
+        fields_plan = self.get_fields_plan()
+        include, exclude = serializer_filter.include, serializer_filter.exclude
+        if (
+            fields_plan is None
+            or not isinstance(include, (set, frozenset, type(None)))
+            or not isinstance(exclude, (set, frozenset, type(None)))
+        ):
+            return None
+
+        exclude_none = serializer_filter.exclude_none
+        exclude_defaults = serializer_filter.exclude_defaults
+        data = {}
+        for name, required, default, types, allow_none in fields_plan:
+            value = getattr(self, name, _missing)
+            if value is None:
+                if not allow_none:
+                    return None
+            elif type(value) not in types:
+                # value needs coercion or is invalid
+                return None
+
+            if (
+                (include is not None and name not in include)
+                or (exclude is not None and name in exclude)
+                or (exclude_none and value is None)
+                or (exclude_defaults and not required and value == default)
+            ):
+                continue
+            data[name] = value
+        return data
+
     def serialize(
         self, serializer_filter: t.Optional[SerializerFilter] = None
     ) -> t.Dict:
         _filter = serializer_filter or self._filter
+        data = self._serialize_fields(_filter)
+        if data is not None:
+            return data
         return t.cast(
             dict,
-            self.get_pydantic_model().from_orm(self).dict(**_filter.dict()),
+            self.get_pydantic_model().from_orm(self).dict(**_filter.get_kwargs()),
+        )
+
+
+_missing = object()
+
+# name, required, default, types returned unchanged by validation, allow_none
+_DataclassFieldPlan = t.Tuple[str, bool, t.Any, t.Tuple[t.Type, ...], bool]
+_dataclass_fields_plans: "weakref.WeakKeyDictionary[t.Type[DataclassSerializer], t.Optional[t.Tuple[_DataclassFieldPlan, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# types whose validators return an instance of the exact type as is
+_unchanged_value_types = (
+    bool,
+    int,
+    float,
+    datetime,
+    date,
+    time,
+    timedelta,
+    uuid.UUID,
+)
+
+
+def _get_unchanged_value_type(
+    field: ModelField, config: t.Type[BaseConfig]
+) -> t.Optional[t.Type]:
+    field_type = field.type_
+    if not isinstance(field_type, type):
+        return None
+    if field_type is str:
+        changes_str = (
+            config.anystr_strip_whitespace
+            or config.anystr_upper
+            or config.anystr_lower
+            or config.min_anystr_length
+            or config.max_anystr_length is not None
+        )
+        return None if changes_str else str
+    if field_type is float and not config.allow_inf_nan:
+        return None
+    if issubclass(field_type, Enum):
+        return None if config.use_enum_values else field_type
+    if field_type in _unchanged_value_types:
+        return field_type
+    return None
+
+
+def _compile_fields_plan(
+    model: t.Type[BaseModel],
+) -> t.Optional[t.Tuple[_DataclassFieldPlan, ...]]:
+    config = model.__config__
+    if (
+        not config.orm_mode
+        or model.__pre_root_validators__
+        or model.__post_root_validators__
+        or getattr(model, "__include_fields__", None)
+        or getattr(model, "__exclude_fields__", None)
+    ):
+        return None
+
+    fields_plan = []
+    for name, field in model.__fields__.items():
+        value_type = _get_unchanged_value_type(field, config)
+        if (
+            value_type is None
+            or field.alias != name
+            or field.shape != SHAPE_SINGLETON
+            or field.sub_fields
+            or field.class_validators
+            or field.pre_validators
+            or field.post_validators
+        ):
+            return None
+        fields_plan.append(
+            (
+                name,
+                field.required is True,
+                field.default,
+                (value_type,),
+                field.allow_none,
+            )
         )
+    return tuple(fields_plan)
 
 
 def convert_dataclass_to_pydantic_model(dataclass_type: t.Type) -> t.Type[BaseModel]:
@@ -106,56 +274,208 @@ def convert_dataclass_to_pydantic_model(dataclass_type: t.Type) -> t.Type[BaseMo
     raise Exception(f"{dataclass_type} is not a dataclass")
 
 
-def serialize_object(
+_SerializeHandler = t.Callable[
+    [t.Any, t.Dict[t.Any, t.Callable[[t.Any], t.Any]], t.Optional[SerializerFilter]],
+    t.Any,
+]
+
+# filter applied when none is set by a route handler or a serializer
+default_serializer_filter = SerializerFilter()
+
+# `serialize_object` handlers by concrete type, filled on first sighting of a type.
+# Types can be created at runtime, so they are weakly referenced
+_serialize_handlers: "weakref.WeakKeyDictionary[t.Type, _SerializeHandler]" = (
+    weakref.WeakKeyDictionary()
+)
+# `serialize_object` handlers of builtin types, which live as long as the process
+_builtin_serialize_handlers: t.Dict[t.Type, _SerializeHandler] = {}
+# `ENCODERS_BY_TYPE` merged with model `json_encoders`, by model config
+_config_encoders: "weakref.WeakKeyDictionary[t.Any, t.Dict[t.Any, t.Callable[[t.Any], t.Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+# conversion to dict that worked for types serialized by `dict(obj)` or `vars(obj)`
+_mapping_getters: "weakref.WeakKeyDictionary[t.Type, t.Callable[[t.Any], t.Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_model_encoders(
+    __config__: t.Any, encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]]
+) -> t.Dict[t.Any, t.Callable[[t.Any], t.Any]]:
+    json_encoders = getattr(__config__, "json_encoders", None)
+    if not json_encoders:
+        return encoders
+
+    if encoders is not ENCODERS_BY_TYPE:
+        return {**encoders, **json_encoders}
+
+    model_encoders = _config_encoders.get(__config__)
+    if model_encoders is None:
+        model_encoders = {**encoders, **json_encoders}
+        _config_encoders[__config__] = model_encoders
+    return model_encoders
+
+
+def _serialize_model(
     obj: t.Any,
-    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]] = ENCODERS_BY_TYPE,
-    serializer_filter: t.Optional[SerializerFilter] = None,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
 ) -> t.Any:
-    if isinstance(obj, (BaseModel, BaseSerializer)):
-        __config__ = getattr(obj, __pydantic_config__, {})
-        json_encoders = getattr(__config__, "json_encoders", {})
-
-        _encoders = dict(encoders)
-        if json_encoders:
-            _encoders.update(json_encoders)
-
-        obj_dict = (
-            obj.serialize(serializer_filter)
-            if isinstance(obj, BaseSerializer)
-            else obj.dict(**(serializer_filter or SerializerFilter()).dict())
-        )
+    _encoders = _get_model_encoders(getattr(obj, __pydantic_config__, None), encoders)
+
+    obj_dict = (
+        obj.serialize(serializer_filter)
+        if isinstance(obj, BaseSerializer)
+        else obj.dict(**(serializer_filter or default_serializer_filter).get_kwargs())
+    )
+
+    if __pydantic_root__ in obj_dict:
+        obj_dict = obj_dict[__pydantic_root__]
+
+    return serialize_object(obj_dict, _encoders)
+
+
+def _serialize_dataclass(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return serialize_object(asdict(obj), encoders, serializer_filter)
+
+
+def _serialize_dict(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return {
+        str(k): serialize_object(v, encoders, serializer_filter) for k, v in obj.items()
+    }
+
+
+def _serialize_enum(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return obj.value
 
-        if __pydantic_root__ in obj_dict:
-            obj_dict = obj_dict[__pydantic_root__]
-
-        return serialize_object(obj_dict, _encoders)
-    if is_dataclass(obj):
-        return serialize_object(asdict(obj), encoders, serializer_filter)
-    if isinstance(obj, dict):
-        return {
-            str(k): serialize_object(v, encoders, serializer_filter)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        return [serialize_object(item, encoders, serializer_filter) for item in obj]
-
-    if type(obj) in encoders:
-        return encoders[type(obj)](obj)
+
+def _serialize_path(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return str(obj)
+
+
+def _serialize_primitive(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return obj
+
+
+def _serialize_sequence(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return [serialize_object(item, encoders, serializer_filter) for item in obj]
+
+
+def _serialize_other(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    obj_type = type(obj)
+    encoder = encoders.get(obj_type)
+    if encoder is not None:
+        return encoder(obj)
+
+    mapping_getter = _mapping_getters.get(obj_type)
+    if mapping_getter is not None:
+        try:
+            return serialize_object(mapping_getter(obj), encoders, serializer_filter)
+        except Exception:
+            """conversion does not work for this object, try them all"""
 
     errors = []
     try:
         data = dict(obj)
+        _mapping_getters[obj_type] = dict
     except Exception as e1:
         errors.append(e1)
         try:
             data = vars(obj)
+            _mapping_getters[obj_type] = vars
         except Exception as e2:
             errors.append(e2)
             raise ValueError(errors) from e2
     return serialize_object(data, encoders, serializer_filter)
+
+
+def _get_serialize_handler(obj_type: t.Type) -> _SerializeHandler:
+    # same order as the checks `serialize_object` makes
+    if issubclass(obj_type, (BaseModel, BaseSerializer)):
+        return _serialize_model
+    if is_dataclass(obj_type):
+        return _serialize_dataclass
+    if issubclass(obj_type, dict):
+        return _serialize_dict
+    if issubclass(obj_type, Enum):
+        return _serialize_enum
+    if issubclass(obj_type, PurePath):
+        return _serialize_path
+    if issubclass(obj_type, (str, int, float, type(None))):
+        return _serialize_primitive
+    if issubclass(obj_type, (list, set, frozenset, GeneratorType, tuple)):
+        return _serialize_sequence
+    return _serialize_other
+
+
+_builtin_serialize_handlers.update(
+    (builtin_type, _get_serialize_handler(builtin_type))
+    for builtin_type in (
+        str,
+        int,
+        float,
+        bool,
+        type(None),
+        dict,
+        list,
+        tuple,
+        set,
+        frozenset,
+        GeneratorType,
+    )
+)
+
+
+def serialize_object(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]] = ENCODERS_BY_TYPE,
+    serializer_filter: t.Optional[SerializerFilter] = None,
+) -> t.Any:
+    """
+    Converts `obj` to JSON ready data.
+
+    Pydantic models and serializers are converted to dicts with `serializer_filter`
+    and their `json_encoders` merged to `encoders`.
+    Dataclasses, dicts, enums, paths, sequences and types in `encoders` are converted,
+    and other objects are read with `dict(obj)` or `vars(obj)`.
+    The conversion of each concrete type is looked up once and cached.
+    """
+    obj_type = type(obj)
+    handler = _builtin_serialize_handlers.get(obj_type)
+    if handler is None:
+        handler = _serialize_handlers.get(obj_type)
+    if handler is None:
+        if isinstance(obj, type):
+            # classes are not dispatched by their metaclass, dataclass types are not dataclass instances
+            return _serialize_other(obj, encoders, serializer_filter)
+        handler = _get_serialize_handler(obj_type)
+        _serialize_handlers[obj_type] = handler
+    return handler(obj, encoders, serializer_filter)
@@ -0,0 +1,182 @@
+import typing as t
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic.fields import (
+    SHAPE_DICT,
+    SHAPE_FROZENSET,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+from pydantic.json import ENCODERS_BY_TYPE
+from pydantic.utils import lenient_issubclass
+
+from .base import (
+    BaseSerializer,
+    SerializerBase,
+    SerializerFilter,
+    __pydantic_config__,
+    __pydantic_root__,
+    default_serializer_filter,
+    serialize_object,
+)
+
+__all__ = ["FieldSerializer", "compile_field_serializer"]
+
+# turns a value validated by a `ModelField` into JSON ready data
+FieldSerializer = t.Callable[[t.Any, t.Optional[SerializerFilter]], t.Any]
+
+_PASSTHROUGH_TYPES = (str, int, float, bool)
+_SEQUENCE_SHAPES = {
+    SHAPE_LIST,
+    SHAPE_SET,
+    SHAPE_FROZENSET,
+    SHAPE_TUPLE_ELLIPSIS,
+    SHAPE_SEQUENCE,
+}
+_MAPPING_SHAPES = {SHAPE_DICT, SHAPE_MAPPING}
+
+
+def _serialize_any(
+    obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+) -> t.Any:
+    return serialize_object(obj, serializer_filter=serializer_filter)
+
+
+def _is_passthrough_type(type_: t.Any) -> bool:
+    return lenient_issubclass(type_, _PASSTHROUGH_TYPES) and not lenient_issubclass(
+        type_, Enum
+    )
+
+
+def _is_passthrough_field(field: ModelField) -> bool:
+    return (
+        field.shape == SHAPE_SINGLETON
+        and not field.sub_fields
+        and _is_passthrough_type(field.type_)
+    )
+
+
+def _compile_model_serializer(model: t.Type[t.Any]) -> FieldSerializer:
+    is_serializer = issubclass(model, BaseSerializer)
+    if (is_serializer and model.serialize is not SerializerBase.serialize) or (
+        model.dict is not BaseModel.dict
+    ):
+        # custom serialization may return anything
+        return _serialize_any
+
+    json_encoders = getattr(
+        getattr(model, __pydantic_config__, None), "json_encoders", {}
+    )
+    encoders = dict(ENCODERS_BY_TYPE)
+    if json_encoders:
+        encoders.update(json_encoders)
+
+    # keys of fields whose values are already JSON ready after `model.dict()`
+    passthrough_fields = [
+        field for field in model.__fields__.values() if _is_passthrough_field(field)
+    ]
+    passthrough_by_alias = frozenset(field.alias for field in passthrough_fields)
+    passthrough_by_name = frozenset(field.name for field in passthrough_fields)
+
+    def serialize_model(
+        obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+    ) -> t.Any:
+        if type(obj) is not model:
+            return serialize_object(obj, serializer_filter=serializer_filter)
+
+        if is_serializer:
+            _filter = serializer_filter or obj._filter
+            obj_dict = obj.serialize(serializer_filter)
+        else:
+            _filter = serializer_filter or default_serializer_filter
+            obj_dict = obj.dict(**_filter.get_kwargs())
+
+        if __pydantic_root__ in obj_dict:
+            return serialize_object(obj_dict[__pydantic_root__], encoders)
+
+        passthrough = passthrough_by_alias if _filter.by_alias else passthrough_by_name
+        return {
+            str(key): value if key in passthrough else serialize_object(value, encoders)
+            for key, value in obj_dict.items()
+        }
+
+    return serialize_model
+
+
+def _compile_sequence_serializer(item_serializer: FieldSerializer) -> FieldSerializer:
+    def serialize_sequence(
+        obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+    ) -> t.Any:
+        if not isinstance(obj, (list, tuple, set, frozenset)):
+            return serialize_object(obj, serializer_filter=serializer_filter)
+        return [item_serializer(item, serializer_filter) for item in obj]
+
+    return serialize_sequence
+
+
+def _compile_mapping_serializer(value_serializer: FieldSerializer) -> FieldSerializer:
+    def serialize_mapping(
+        obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+    ) -> t.Any:
+        if not isinstance(obj, dict):
+            return serialize_object(obj, serializer_filter=serializer_filter)
+        return {
+            str(key): value_serializer(value, serializer_filter)
+            for key, value in obj.items()
+        }
+
+    return serialize_mapping
+
+
+def _with_none(serializer: FieldSerializer) -> FieldSerializer:
+    def serialize_optional(
+        obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+    ) -> t.Any:
+        if obj is None:
+            return None
+        return serializer(obj, serializer_filter)
+
+    return serialize_optional
+
+
+def _compile(field: ModelField) -> FieldSerializer:
+    if field.shape == SHAPE_SINGLETON:
+        if field.sub_fields:
+            # unions and generics
+            return _serialize_any
+        if lenient_issubclass(field.type_, BaseModel):
+            model_serializer = _compile_model_serializer(field.type_)
+            if model_serializer is not _serialize_any:
+                return _with_none(model_serializer)
+        return _serialize_any
+
+    if not field.sub_fields or len(field.sub_fields) != 1:
+        return _serialize_any
+
+    item_serializer = _compile(field.sub_fields[0])
+    if item_serializer is _serialize_any:
+        return _serialize_any
+
+    if field.shape in _SEQUENCE_SHAPES:
+        return _with_none(_compile_sequence_serializer(item_serializer))
+    if field.shape in _MAPPING_SHAPES:
+        return _with_none(_compile_mapping_serializer(item_serializer))
+    return _serialize_any
+
+
+def compile_field_serializer(field: ModelField) -> FieldSerializer:
+    """
+    Compiles a serializer for values validated by `field`, returning the same data as `serialize_object`.
+
+    Pydantic models, and lists and dicts of them, are serialized in one pass:
+    values of `str`, `int`, `float` and `bool` model fields are used as they are
+    and the model encoders are merged once. Other types, and models with a custom
+    `dict` or `serialize`, are serialized with `serialize_object`.
+    """
+    return _compile(field)
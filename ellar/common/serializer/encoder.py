@@ -0,0 +1,98 @@
+import dataclasses
+import typing as t
+from enum import Enum
+from pathlib import PurePath
+from types import GeneratorType
+
+from pydantic import BaseModel
+from pydantic.json import ENCODERS_BY_TYPE
+
+from .base import (
+    BaseSerializer,
+    SerializerFilter,
+    __pydantic_config__,
+    __pydantic_root__,
+    _get_model_encoders,
+    default_serializer_filter,
+    serialize_object,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None  # type: ignore
+
+__all__ = ["ORJSONEncoder", "dumps_json"]
+
+
+class ORJSONEncoder:
+    """
+    `default` hook of `orjson.dumps` encoding what orjson does not support natively,
+    the way `serialize_object` does.
+
+    Pydantic models and serializers are turned into dicts with `serializer_filter`,
+    models with `json_encoders` are encoded with `serialize_object` and their encoders.
+    Other values, like datetimes, UUIDs, enums and dataclass fields, are encoded by orjson.
+    """
+
+    __slots__ = ("serializer_filter",)
+
+    def __init__(self, serializer_filter: t.Optional[SerializerFilter] = None) -> None:
+        self.serializer_filter = serializer_filter
+
+    def encode_model(self, obj: t.Union[BaseModel, BaseSerializer]) -> t.Any:
+        obj_dict = (
+            obj.serialize(self.serializer_filter)
+            if isinstance(obj, BaseSerializer)
+            else obj.dict(
+                **(self.serializer_filter or default_serializer_filter).get_kwargs()
+            )
+        )
+        if __pydantic_root__ in obj_dict:
+            obj_dict = obj_dict[__pydantic_root__]
+
+        __config__ = getattr(obj, __pydantic_config__, None)
+        if getattr(__config__, "json_encoders", None):
+            return serialize_object(
+                obj_dict, _get_model_encoders(__config__, ENCODERS_BY_TYPE)
+            )
+        return obj_dict
+
+    def __call__(self, obj: t.Any) -> t.Any:
+        if isinstance(obj, (BaseModel, BaseSerializer)):
+            return self.encode_model(obj)
+        if dataclasses.is_dataclass(obj):
+            # fields are left to orjson instead of `dataclasses.asdict` deep copies
+            return {
+                field.name: getattr(obj, field.name)
+                for field in dataclasses.fields(obj)
+            }
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, PurePath):
+            return str(obj)
+        if isinstance(obj, (set, frozenset, GeneratorType)):
+            return list(obj)
+
+        encoder = ENCODERS_BY_TYPE.get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+
+        try:
+            return dict(obj)
+        except Exception:
+            return vars(obj)
+
+
+def dumps_json(
+    obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
+) -> bytes:
+    """
+    Encodes `obj` to JSON bytes with orjson, without converting it with `serialize_object` first.
+    """
+    assert orjson is not None, "orjson must be installed to use dumps_json"
+    return orjson.dumps(
+        obj,
+        default=ORJSONEncoder(serializer_filter),
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+    )
@@ -7,6 +7,7 @@ from ellar.common.constants import (
 from ellar.common.constants import (
     LOG_LEVELS as log_levels,
 )
+from ellar.common.helper.json_decoder import JSONDecoder
 from ellar.common.interfaces import IAPIVersioning, IEllarMiddleware, IExceptionHandler
 from ellar.common.responses import JSONResponse, PlainTextResponse
 from ellar.common.serializer import Serializer, SerializerFilter
@@ -63,6 +64,10 @@ class ConfigValidationSchema(Serializer, ConfigDefaultTypesMixin):
 
     DEFAULT_JSON_CLASS: t.Type[JSONResponse] = JSONResponse
 
+    # Callable decoding request body, websocket and session JSON, eg `orjson.loads`.
+    # Defaults to `json.loads`
+    JSON_DECODER: t.Optional[JSONDecoder] = None
+
     SECRET_KEY: str = "your-secret-key"
 
     # injector auto_bind = True allows you to resolve types that are not registered on the container
@@ -78,6 +83,31 @@ class ConfigValidationSchema(Serializer, ConfigDefaultTypesMixin):
 
     REDIRECT_SLASHES: bool = False
 
+    # Index application routes in a prefix tree instead of scanning every route on each request
+    COMPILED_ROUTER: bool = False
+
+    # Match controller and ModuleRouter operations directly from the application router
+    FLATTEN_ROUTES: bool = False
+
+    # Number of matched request paths kept by the application router. 0 disables the cache
+    ROUTE_MATCH_CACHE_SIZE: int = 0
+
+    # Serializes handler output that already is an instance of the declared response schema,
+    # or a list or dict of them, without validating it again
+    TRUST_RESPONSE_OUTPUT: bool = False
+
+    # Resolves path, query, header and cookie parameters before the request body,
+    # so invalid requests are rejected without reading the body
+    RESOLVE_BODY_LAST: bool = False
+
+    # Multipart form body size limits in bytes, enforced while the body is received.
+    # None disables a limit
+    MULTIPART_MAX_REQUEST_SIZE: t.Optional[int] = None
+    MULTIPART_MAX_FILE_SIZE: t.Optional[int] = None
+    MULTIPART_MAX_FIELD_SIZE: t.Optional[int] = None
+    # Size in bytes above which uploaded files are written to disk
+    MULTIPART_SPOOL_MAX_SIZE: int = 1024 * 1024
+
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]] = []
 
     STATIC_DIRECTORIES: t.Optional[t.List[t.Union[str, t.Any]]] = []
@@ -96,6 +126,26 @@ class ConfigValidationSchema(Serializer, ConfigDefaultTypesMixin):
     ALLOWED_HOSTS: t.List[str] = ["*"]
     REDIRECT_HOST: bool = True
 
+    # Compresses responses with brotli, when installed, or gzip
+    COMPRESSION_ENABLED: bool = False
+    # Size in bytes below which responses are not compressed
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    # Compressed media types. Items ending with '/' match a type prefix, items starting with '+' a suffix
+    COMPRESSION_MEDIA_TYPES: t.List[str] = [
+        "text/",
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+        "+json",
+        "+xml",
+    ]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # Number of compressed response bodies kept for reuse. 0 disables the cache
+    COMPRESSION_CACHE_SIZE: int = 0
+
     MIDDLEWARE: t.List[IEllarMiddleware] = []
 
     EXCEPTION_HANDLERS: t.List[IExceptionHandler] = []
@@ -1,6 +1,7 @@
 import typing as t
 
 from ellar.common.constants import LOG_LEVELS as log_levels
+from ellar.common.helper.json_decoder import JSONDecoder
 from ellar.common.interfaces import IAPIVersioning, IEllarMiddleware, IExceptionHandler
 from starlette.responses import JSONResponse
 from starlette.types import ASGIApp
@@ -23,6 +24,9 @@ class ConfigDefaultTypesMixin:
     # Default JSON response class
     DEFAULT_JSON_CLASS: t.Type[JSONResponse]
 
+    # JSON decoder for request bodies, websocket messages and sessions, eg `orjson.loads`
+    JSON_DECODER: t.Optional[JSONDecoder]
+
     # jinja Environment options
     # https://jinja.palletsprojects.com/en/3.0.x/api/#high-level-api
     JINJA_TEMPLATES_OPTIONS: t.Dict[str, t.Any]
@@ -33,6 +37,30 @@ class ConfigDefaultTypesMixin:
     # Enable or Disable Application Router route searching by appending backslash
     REDIRECT_SLASHES: bool
 
+    # Index application routes in a prefix tree for faster route look up
+    COMPILED_ROUTER: bool
+
+    # Lift controller and ModuleRouter operations into the application route table
+    FLATTEN_ROUTES: bool
+
+    # Size of the application router LRU cache of matched routes, 0 disables it
+    ROUTE_MATCH_CACHE_SIZE: int
+
+    # Skips validation of handler output that already matches the declared response schema
+    TRUST_RESPONSE_OUTPUT: bool
+
+    # Resolves the request body after the other endpoint parameters
+    RESOLVE_BODY_LAST: bool
+
+    # Multipart form body size limits in bytes: whole body, each file and each field.
+    # None disables a limit
+    MULTIPART_MAX_REQUEST_SIZE: t.Optional[int]
+    MULTIPART_MAX_FILE_SIZE: t.Optional[int]
+    MULTIPART_MAX_FIELD_SIZE: t.Optional[int]
+
+    # Size in bytes above which uploaded files are written to disk instead of kept in memory
+    MULTIPART_SPOOL_MAX_SIZE: int
+
     # Define references to static folders in python packages.
     # eg STATIC_FOLDER_PACKAGES = [('boostrap4', 'statics')]
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]]
@@ -88,4 +116,12 @@ class ConfigDefaultTypesMixin:
     ALLOWED_HOSTS: t.List[str]
     REDIRECT_HOST: bool
 
+    # CompressionMiddleware setup
+    COMPRESSION_ENABLED: bool
+    COMPRESSION_MINIMUM_SIZE: int
+    COMPRESSION_MEDIA_TYPES: t.List[str]
+    COMPRESSION_GZIP_LEVEL: int
+    COMPRESSION_BROTLI_QUALITY: int
+    COMPRESSION_CACHE_SIZE: int
+
     CACHES: t.Dict[str, t.Any]
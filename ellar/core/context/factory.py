@@ -56,7 +56,7 @@ class HostContextFactory(IHostContextFactory):
         return host_context
 
 
-@injectable(scope=request_scope)
+@injectable
 class ExecutionContextFactory(IExecutionContextFactory):
     __slots__ = ("reflector",)
 
@@ -1,4 +1,3 @@
-import functools
 import typing as t
 
 from ellar.common import IExecutionContext, IGuardsConsumer
@@ -8,10 +7,31 @@ from ellar.di import injectable
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.common import GuardCanActivate
     from ellar.common.routing import RouteOperationBase
+    from ellar.core.main import App
+
+TGuard = t.Union[t.Type["GuardCanActivate"], "GuardCanActivate"]
+
+
+def _is_same_items(compiled: t.Sequence[t.Any], current: t.Sequence[t.Any]) -> bool:
+    # compares by identity, so a replaced guard instance is noticed
+    return len(compiled) == len(current) and all(
+        item is current_item for item, current_item in zip(compiled, current)
+    )
+
+
+class CompiledGuards(t.NamedTuple):
+    # application guards compiled in. `None` when handler or class defines its own guards
+    app_guards: t.Optional[t.Tuple[TGuard, ...]]
+    # guard instances and guard types that must be resolved for each request
+    guards: t.Tuple[TGuard, ...]
+    has_unresolved_guards: bool
 
 
 @injectable
 class GuardConsumer(IGuardsConsumer):
+    def __init__(self) -> None:
+        self._compiled_guards: t.Dict[t.Tuple[t.Any, t.Any], CompiledGuards] = {}
+
     async def execute(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
     ) -> None:
@@ -31,14 +51,46 @@ class GuardConsumer(IGuardsConsumer):
 
     def _get_guards(self, context: IExecutionContext) -> t.Iterable["GuardCanActivate"]:
         app = context.get_app()
-        reflector = app.reflector
+        key = (context.get_handler(), context.get_class())
+
+        compiled = self._compiled_guards.get(key)
+        if compiled is None or (
+            compiled.app_guards is not None
+            and not _is_same_items(compiled.app_guards, app.get_guards())
+        ):
+            compiled = self.compile_guards(app, *key)
+            self._compiled_guards[key] = compiled
 
-        targets = [context.get_handler(), context.get_class()]
+        if compiled.has_unresolved_guards:
+            return (
+                self.get_guard_instance(context, guard) for guard in compiled.guards
+            )
+        return t.cast(t.Tuple["GuardCanActivate", ...], compiled.guards)
 
-        return map(
-            functools.partial(self.get_guard_instance, context),
-            reflector.get_all_and_override(GUARDS_KEY, *targets)
-            or context.get_app().get_guards(),
+    def compile_guards(
+        self, app: "App", handler: t.Callable, controller_type: t.Optional[t.Type]
+    ) -> CompiledGuards:
+        """
+        Computes guards of a handler once.
+        Guard types bound as singletons are resolved here, others are resolved per request.
+        """
+        guards = app.reflector.get_all_and_override(
+            GUARDS_KEY, handler, controller_type
+        )
+        app_guards: t.Optional[t.Tuple[TGuard, ...]] = None
+        if not guards:
+            guards = app_guards = tuple(app.get_guards())
+
+        compiled = tuple(
+            t.cast("GuardCanActivate", app.injector.get(guard))
+            if isinstance(guard, type) and app.injector.is_singleton(guard)
+            else guard
+            for guard in guards
+        )
+        return CompiledGuards(
+            app_guards=app_guards,
+            guards=compiled,
+            has_unresolved_guards=any(isinstance(guard, type) for guard in compiled),
         )
 
     def get_guard_instance(
@@ -8,10 +8,32 @@ from ellar.di import injectable
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.common.routing import RouteOperationBase
+    from ellar.core.main import App
+
+TInterceptor = t.Union[t.Type[EllarInterceptor], EllarInterceptor]
+
+
+def _is_same_items(compiled: t.Sequence[t.Any], current: t.Sequence[t.Any]) -> bool:
+    return len(compiled) == len(current) and all(
+        item is current_item for item, current_item in zip(compiled, current)
+    )
+
+
+class CompiledInterceptors(t.NamedTuple):
+    # application interceptors compiled in. `None` when handler or class defines its own interceptors
+    app_interceptors: t.Optional[t.Tuple[TInterceptor, ...]]
+    # interceptor instances and interceptor types that must be resolved for each request
+    interceptors: t.Tuple[TInterceptor, ...]
+    has_unresolved_interceptors: bool
 
 
 @injectable
 class EllarInterceptorConsumer(IInterceptorsConsumer):
+    def __init__(self) -> None:
+        self._compiled_interceptors: t.Dict[
+            t.Tuple[t.Any, t.Any], CompiledInterceptors
+        ] = {}
+
     def get_interceptor(
         self,
         context: IExecutionContext,
@@ -23,22 +45,62 @@ class EllarInterceptorConsumer(IInterceptorsConsumer):
             )
         return interceptor
 
+    def get_interceptors(
+        self, context: IExecutionContext
+    ) -> t.Sequence[EllarInterceptor]:
+        app = context.get_app()
+        key = (context.get_handler(), context.get_class())
+
+        compiled = self._compiled_interceptors.get(key)
+        if compiled is None or (
+            compiled.app_interceptors is not None
+            and not _is_same_items(compiled.app_interceptors, app.get_interceptors())
+        ):
+            compiled = self.compile_interceptors(app, *key)
+            self._compiled_interceptors[key] = compiled
+
+        if compiled.has_unresolved_interceptors:
+            return [
+                self.get_interceptor(context, interceptor)
+                for interceptor in compiled.interceptors
+            ]
+        return t.cast(t.Tuple[EllarInterceptor, ...], compiled.interceptors)
+
+    def compile_interceptors(
+        self, app: "App", handler: t.Callable, controller_type: t.Optional[t.Type]
+    ) -> CompiledInterceptors:
+        """
+        Computes interceptors of a handler once.
+        Interceptor types bound as singletons are resolved here, others are resolved per request.
+        """
+        interceptors = app.reflector.get_all_and_override(
+            ROUTE_INTERCEPTORS, handler, controller_type
+        )
+        app_interceptors: t.Optional[t.Tuple[TInterceptor, ...]] = None
+        if not interceptors:
+            interceptors = app_interceptors = tuple(app.get_interceptors())
+
+        compiled = tuple(
+            t.cast(EllarInterceptor, app.injector.get(interceptor))
+            if isinstance(interceptor, type) and app.injector.is_singleton(interceptor)
+            else interceptor
+            for interceptor in interceptors
+        )
+        return CompiledInterceptors(
+            app_interceptors=app_interceptors,
+            interceptors=compiled,
+            has_unresolved_interceptors=any(
+                isinstance(interceptor, type) for interceptor in compiled
+            ),
+        )
+
     async def execute(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
     ) -> t.Any:
-        reflector = context.get_app().reflector
-        route_interceptors: t.List[EllarInterceptor] = list(
-            map(
-                functools.partial(self.get_interceptor, context),
-                reflector.get_all_and_override(
-                    ROUTE_INTERCEPTORS, *[context.get_handler(), context.get_class()]
-                )
-                or context.get_app().get_interceptors(),
-            )
-        )
-        route_interceptors_length = len(route_interceptors or [])
+        route_interceptors = self.get_interceptors(context)
 
         if route_interceptors:
+            route_interceptors_length = len(route_interceptors)
 
             async def handler(idx: int) -> t.Any:
                 if idx >= route_interceptors_length:
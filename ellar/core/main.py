@@ -14,6 +14,7 @@ from ellar.common.templating import Environment
 from ellar.common.types import ASGIApp, T, TReceive, TScope, TSend
 from ellar.core.lifespan import EllarApplicationLifespan
 from ellar.core.middleware import (
+    CompressionMiddleware,
     CORSMiddleware,
     ExceptionMiddleware,
     Middleware,
@@ -79,6 +80,9 @@ class App(AppTemplating):
             lifespan=EllarApplicationLifespan(
                 self.config.DEFAULT_LIFESPAN_HANDLER  # type: ignore[arg-type]
             ).lifespan,
+            compiled=self.config.COMPILED_ROUTER,
+            flatten=self.config.FLATTEN_ROUTES,
+            match_cache_size=self.config.ROUTE_MATCH_CACHE_SIZE,
         )
         self._finalize_app_initialization()
         self.middleware_stack = self.build_middleware_stack()
@@ -227,6 +231,9 @@ class App(AppTemplating):
                     expose_headers=self.config.CORS_EXPOSE_HEADERS,
                     max_age=self.config.CORS_MAX_AGE,
                 ),
+                Middleware(
+                    CompressionMiddleware,
+                ),
                 Middleware(
                     RequestServiceProviderMiddleware,
                     debug=self.debug,
@@ -10,6 +10,7 @@ from starlette.middleware.trustedhost import (
 from starlette.middleware.wsgi import WSGIMiddleware as WSGIMiddleware
 
 from .authentication import IdentityMiddleware
+from .compression import CompressionMiddleware
 from .di import RequestServiceProviderMiddleware
 from .exceptions import ExceptionMiddleware
 from .function import FunctionBasedMiddleware
@@ -25,6 +26,7 @@ __all__ = [
     "ServerErrorMiddleware",
     "ExceptionMiddleware",
     "GZipMiddleware",
+    "CompressionMiddleware",
     "HTTPSRedirectMiddleware",
     "TrustedHostMiddleware",
     "WSGIMiddleware",
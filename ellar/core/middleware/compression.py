@@ -0,0 +1,322 @@
+import functools
+import hashlib
+import typing as t
+import zlib
+from collections import OrderedDict
+
+from ellar.core.conf import Config
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: nocover
+    brotli = None
+
+__all__ = [
+    "CompressionMiddleware",
+    "CompressedResponseCache",
+    "GZipCompressor",
+    "BrotliCompressor",
+]
+
+# response status codes whose body is not compressed
+_skipped_status_codes = frozenset({204, 206, 304})
+
+
+class GZipCompressor:
+    encoding = "gzip"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def _compressobj(self) -> t.Any:
+        # wbits=31 writes a gzip header and trailer
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+    def compress(self, body: bytes) -> bytes:
+        compressor = self._compressobj()
+        return t.cast(bytes, compressor.compress(body) + compressor.flush())
+
+    def stream(self) -> "_CompressionStream":
+        compressor = self._compressobj()
+        return _CompressionStream(
+            lambda chunk: compressor.compress(chunk)
+            + compressor.flush(zlib.Z_SYNC_FLUSH),
+            compressor.flush,
+        )
+
+
+class BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self, quality: int = 4) -> None:
+        assert brotli is not None, "brotli must be installed to use BrotliCompressor"
+        self.quality = quality
+
+    def compress(self, body: bytes) -> bytes:
+        return t.cast(bytes, brotli.compress(body, quality=self.quality))
+
+    def stream(self) -> "_CompressionStream":
+        compressor = brotli.Compressor(quality=self.quality)
+        return _CompressionStream(
+            lambda chunk: compressor.process(chunk) + compressor.flush(),
+            compressor.finish,
+        )
+
+
+class _CompressionStream(t.NamedTuple):
+    # compresses a chunk and flushes it, so it can be sent right away
+    compress: t.Callable[[bytes], bytes]
+    finish: t.Callable[[], bytes]
+
+
+_Compressor = t.Union[GZipCompressor, BrotliCompressor]
+
+
+class CompressedResponseCache:
+    """
+    Least recently used compressed response bodies, keyed by encoding and either
+    request target and ETag, or body digest.
+    """
+
+    __slots__ = ("max_size", "_bodies")
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._bodies: "OrderedDict[t.Tuple, bytes]" = OrderedDict()
+
+    def get(self, key: t.Tuple) -> t.Optional[bytes]:
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+        return body
+
+    def set(self, key: t.Tuple, body: bytes) -> None:
+        self._bodies[key] = body
+        self._bodies.move_to_end(key)
+        if len(self._bodies) > self.max_size:
+            self._bodies.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+
+@functools.lru_cache(maxsize=256)
+def get_accepted_encodings(
+    accept_encoding: str,
+) -> t.Tuple[t.FrozenSet[str], t.FrozenSet[str]]:
+    """
+    Returns the content codings of an `Accept-Encoding` header value that are accepted,
+    and the ones refused with `q=0`
+    """
+    accepted = set()
+    refused = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    refused.add(coding)
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return frozenset(accepted), frozenset(refused)
+
+
+class CompressionMiddleware:
+    """
+    Compresses response bodies with brotli, when it is installed and accepted, or gzip.
+
+    Only responses with a compressible `Content-Type` and at least `COMPRESSION_MINIMUM_SIZE`
+    bytes long are compressed. Streamed responses are compressed chunk by chunk.
+    With `COMPRESSION_CACHE_SIZE`, compressed bodies are kept and reused for responses
+    with the same URL and ETag, or the same body when they have none.
+    """
+
+    def __init__(self, app: ASGIApp, config: Config) -> None:
+        self.app = app
+        self._is_disabled = not config.COMPRESSION_ENABLED
+        self.minimum_size = config.COMPRESSION_MINIMUM_SIZE
+        self.media_types = tuple(config.COMPRESSION_MEDIA_TYPES)
+
+        self.compressors: t.List[_Compressor] = []
+        if brotli is not None:
+            self.compressors.append(BrotliCompressor(config.COMPRESSION_BROTLI_QUALITY))
+        self.compressors.append(GZipCompressor(config.COMPRESSION_GZIP_LEVEL))
+
+        self.cache: t.Optional[CompressedResponseCache] = (
+            CompressedResponseCache(config.COMPRESSION_CACHE_SIZE)
+            if config.COMPRESSION_CACHE_SIZE > 0
+            else None
+        )
+        self._compressible_media_types: t.Dict[str, bool] = {}
+
+    def get_compressor(self, scope: Scope) -> t.Optional[_Compressor]:
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        if not accept_encoding:
+            return None
+
+        accepted, refused = get_accepted_encodings(accept_encoding)
+        for compressor in self.compressors:
+            if compressor.encoding in refused:
+                continue
+            if compressor.encoding in accepted or "*" in accepted:
+                return compressor
+        return None
+
+    def is_compressible(self, content_type: t.Optional[str]) -> bool:
+        if not content_type:
+            return False
+
+        media_type = content_type.partition(";")[0].strip().lower()
+        compressible = self._compressible_media_types.get(media_type)
+        if compressible is None:
+            compressible = any(
+                media_type.startswith(item)
+                if item.endswith("/")
+                else media_type.endswith(item)
+                if item.startswith("+")
+                else media_type == item
+                for item in self.media_types
+            )
+            self._compressible_media_types[media_type] = compressible
+        return compressible
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._is_disabled or scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        compressor = self.get_compressor(scope)
+        if compressor is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, compressor, scope, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    __slots__ = (
+        "middleware",
+        "compressor",
+        "scope",
+        "_send",
+        "start_message",
+        "stream",
+        "passthrough",
+    )
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        compressor: _Compressor,
+        scope: Scope,
+        send: Send,
+    ) -> None:
+        self.middleware = middleware
+        self.compressor = compressor
+        self.scope = scope
+        self._send = send
+        self.start_message: t.Optional[Message] = None
+        self.stream: t.Optional[_CompressionStream] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # headers are sent with the first body message, once the encoding is known
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in _skipped_status_codes
+                or "content-encoding" in headers
+                or not self.middleware.is_compressible(headers.get("content-type"))
+            )
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send_start_message()
+            await self._send(message)
+            return
+
+        if self.stream is not None:
+            await self._send_stream_body(message)
+            return
+
+        body = message.get("body", b"")
+        if message.get("more_body", False):
+            self.stream = self.compressor.stream()
+            self._set_encoding_headers(content_length=None)
+            await self._send_start_message()
+            await self._send_stream_body(message)
+            return
+
+        if len(body) < self.middleware.minimum_size:
+            await self._send_start_message()
+            await self._send(message)
+            return
+
+        body = self.compress(body)
+        self._set_encoding_headers(content_length=len(body))
+        await self._send_start_message()
+        await self._send({**message, "body": body})
+
+    def compress(self, body: bytes) -> bytes:
+        cache = self.middleware.cache
+        if cache is None:
+            return self.compressor.compress(body)
+
+        assert self.start_message is not None
+        etag = Headers(raw=self.start_message["headers"]).get("etag")
+        # the same ETag may be used by different URLs, so it is scoped to the request target
+        key: t.Tuple = (
+            (
+                self.compressor.encoding,
+                self.scope.get("root_path", ""),
+                self.scope["path"],
+                self.scope.get("query_string", b""),
+                etag,
+            )
+            if etag
+            else (self.compressor.encoding, hashlib.blake2b(body).digest())
+        )
+        compressed = cache.get(key)
+        if compressed is None:
+            compressed = self.compressor.compress(body)
+            cache.set(key, compressed)
+        return compressed
+
+    def _set_encoding_headers(self, content_length: t.Optional[int]) -> None:
+        assert self.start_message is not None
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # the compressed body is a different representation of the resource
+            headers["ETag"] = f"W/{etag}"
+
+    async def _send_start_message(self) -> None:
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            await self._send(start_message)
+
+    async def _send_stream_body(self, message: Message) -> None:
+        assert self.stream is not None
+        body = self.stream.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self.stream.finish()
+        await self._send({**message, "body": body})
@@ -4,10 +4,13 @@ from functools import wraps
 from ellar.common.constants import SCOPE_API_VERSIONING_RESOLVER
 from ellar.common.routing import RouteCollection
 from ellar.common.types import ASGIApp, TReceive, TScope, TSend
-from starlette.routing import BaseRoute
+from starlette.datastructures import URL, URLPath
+from starlette.responses import RedirectResponse
+from starlette.routing import BaseRoute, Host, Match
 from starlette.routing import Router as StarletteRouter
 
 from .helper import build_route_handler
+from .match_cache import RouteMatchCache, TMatchCacheKey
 
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.core.versioning.resolver import BaseAPIVersioningResolver
@@ -40,6 +43,9 @@ class ApplicationRouter(StarletteRouter):
         on_startup: t.Optional[t.Sequence[t.Callable]] = None,
         on_shutdown: t.Optional[t.Sequence[t.Callable]] = None,
         lifespan: t.Optional[t.Callable[[t.Any], t.AsyncContextManager]] = None,
+        compiled: bool = False,
+        flatten: bool = False,
+        match_cache_size: int = 0,
     ):
         super().__init__(
             routes=None,
@@ -51,10 +57,137 @@ class ApplicationRouter(StarletteRouter):
         )
         self.default = router_default_decorator(self.default)
         self.routes: RouteCollection = RouteCollection(routes)
+        if flatten:
+            self.routes.flatten()
+        if compiled:
+            self.routes.compile()
+
+        self.match_cache: t.Optional[RouteMatchCache] = (
+            RouteMatchCache(maxsize=match_cache_size) if match_cache_size > 0 else None
+        )
+        self._match_cache_enabled = False
+        self.clear_match_cache()
+
+    def clear_match_cache(self) -> None:
+        """
+        Drops cached route matches.
+        Must be called whenever the application route set changes.
+        """
+        if self.match_cache is None:
+            return
+        self.match_cache.clear()
+        # Host routes are matched against request headers, so path based keys can not be trusted
+        self._match_cache_enabled = not any(
+            isinstance(route, Host) for route in self.routes
+        )
+
+    def _get_match_cache_key(self, scope: TScope) -> TMatchCacheKey:
+        version_scheme_resolver: t.Optional["BaseAPIVersioningResolver"] = scope.get(
+            SCOPE_API_VERSIONING_RESOLVER
+        )
+        return (
+            scope["type"],
+            scope.get("method"),
+            scope["path"],
+            scope.get("root_path", ""),
+            version_scheme_resolver.resolve() if version_scheme_resolver else None,
+        )
+
+    async def __call__(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        assert scope["type"] in ("http", "websocket", "lifespan")
+
+        if "router" not in scope:
+            scope["router"] = self
+
+        if scope["type"] == "lifespan":
+            await self.lifespan(scope, receive, send)
+            return
+
+        cache_key: t.Optional[TMatchCacheKey] = None
+        if self._match_cache_enabled:
+            cache_key = self._get_match_cache_key(scope)
+            cached_match = self.match_cache.get(cache_key)  # type: ignore[union-attr]
+            if cached_match is not None:
+                route, child_scope = cached_match
+                scope.update(child_scope)
+                await route.handle(scope, receive, send)
+                return
+
+        version_scheme_resolver: t.Optional["BaseAPIVersioningResolver"] = scope.get(
+            SCOPE_API_VERSIONING_RESOLVER
+        )
+        match, route, child_scope = self._match_route(scope, version_scheme_resolver)
+        if (
+            match == Match.NONE
+            and version_scheme_resolver
+            and version_scheme_resolver.get_route_table_key() is not None
+        ):
+            # Routes left out of compiled version route tables may still match the path.
+            # They decide between a version error, `405` and `404` as they would without route tables.
+            version_scheme_resolver.match_all_versions = True
+            match, route, child_scope = self._match_route(
+                scope, version_scheme_resolver
+            )
+
+        if route is not None:
+            if match == Match.FULL and cache_key is not None:
+                self.match_cache.set(cache_key, route, child_scope)  # type: ignore[union-attr]
+            scope.update(child_scope)
+            await route.handle(scope, receive, send)
+            return
+
+        if scope["type"] == "http" and self.redirect_slashes and scope["path"] != "/":
+            redirect_scope = dict(scope)
+            if scope["path"].endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+
+            for route in self.routes.get_match_candidates(
+                redirect_scope["path"], version_scheme_resolver
+            ):
+                match, child_scope = route.matches(redirect_scope)
+                if match != Match.NONE:
+                    redirect_url = URL(scope=redirect_scope)
+                    response = RedirectResponse(url=str(redirect_url))
+                    await response(scope, receive, send)
+                    return
+
+        await self.default(scope, receive, send)
+
+    def _match_route(
+        self,
+        scope: TScope,
+        version_scheme_resolver: t.Optional["BaseAPIVersioningResolver"],
+    ) -> t.Tuple[Match, t.Optional[BaseRoute], TScope]:
+        """
+        Returns the first route that fully matches the scope,
+        else the first route that partially matches it.
+        """
+        partial: t.Optional[BaseRoute] = None
+        partial_scope: TScope = {}
+
+        for route in self.routes.get_match_candidates(
+            scope["path"], version_scheme_resolver
+        ):
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return match, route, child_scope
+            elif match == Match.PARTIAL and partial is None:
+                partial = route
+                partial_scope = child_scope
+
+        if partial is not None:
+            return Match.PARTIAL, partial, partial_scope
+        return Match.NONE, None, {}
+
+    def url_path_for(self, __name: str, **path_params: t.Any) -> URLPath:
+        return self.routes.url_path_for(__name, **path_params)
 
     def append(self, item: t.Union[BaseRoute, t.Callable]) -> None:
         _item: t.Any = build_route_handler(item)
         self.routes.append(_item)
+        self.clear_match_cache()
 
     def extend(self, routes: t.Sequence[t.Union[BaseRoute, t.Callable]]) -> None:
         for route in routes:
@@ -0,0 +1,75 @@
+import typing as t
+from collections import OrderedDict
+
+from ellar.common.types import TScope
+from starlette.routing import BaseRoute
+
+__all__ = ["RouteMatchCache", "RouteMatchCacheInfo"]
+
+TMatchCacheKey = t.Tuple[t.Any, ...]
+
+
+class RouteMatchCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RouteMatchCache:
+    """
+    Bounded LRU mapping of a request key to the route that fully matched it
+    and the child scope computed during matching.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_data")
+
+    def __init__(self, maxsize: int) -> None:
+        assert maxsize > 0, "RouteMatchCache maxsize must be greater than 0"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[TMatchCacheKey, t.Tuple[BaseRoute, TScope]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: TMatchCacheKey) -> t.Optional[t.Tuple[BaseRoute, TScope]]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        route, child_scope = item
+        return route, self._copy_scope(child_scope)
+
+    def set(self, key: TMatchCacheKey, route: BaseRoute, child_scope: TScope) -> None:
+        self._data[key] = (route, self._copy_scope(child_scope))
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    @classmethod
+    def _copy_scope(cls, child_scope: TScope) -> TScope:
+        child_scope = dict(child_scope)
+        if "path_params" in child_scope:
+            # path_params are mutable and must not be shared between requests
+            child_scope["path_params"] = dict(child_scope["path_params"])
+        return child_scope
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> RouteMatchCacheInfo:
+        return RouteMatchCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._data),
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,10 +1,11 @@
-import email
 import re
 import typing as t
 from abc import abstractmethod
 
+from ellar.common.compatible import cached_property
 from ellar.common.constants import NOT_SET
 from ellar.common.exceptions import NotAcceptable, NotFound
+from ellar.common.helper.media_type import parse_media_type
 from ellar.common.interfaces import IAPIVersioningResolver
 from ellar.common.types import TScope
 from ellar.core.connection import HTTPConnection
@@ -17,9 +18,15 @@ class BaseAPIVersioningResolver(IAPIVersioningResolver):
     ) -> None:
         self.version_parameter = version_parameter
         self.default_version = default_version
-        self.connection = HTTPConnection(scope)
+        self.scope = scope
         self._resolved_version: t.Optional[str] = None
         self.matched_any_route = False
+        # when set, routers match against all routes instead of a version route table
+        self.match_all_versions = False
+
+    @cached_property
+    def connection(self) -> HTTPConnection:
+        return HTTPConnection(self.scope)
 
     def resolve(self) -> t.Optional[str]:
         if not self._resolved_version:
@@ -51,6 +58,17 @@ class BaseAPIVersioningResolver(IAPIVersioningResolver):
             or version in route_versions
         )
 
+    def get_route_table_key(self) -> t.Optional[t.Tuple[str, bool]]:
+        if self.match_all_versions:
+            return None
+
+        version = self.resolve()
+        if str(version) == str(NOT_SET):
+            return None
+        return t.cast(str, version), (
+            version is not None and version == str(self.default_version)
+        )
+
 
 class DefaultAPIVersionResolver(BaseAPIVersioningResolver):
     invalid_version_message = "Invalid API version"
@@ -80,7 +98,7 @@ class UrlPathVersionResolver(DefaultAPIVersionResolver):
         """Since we expect a extra parameter that is not path any router routes,
         there is need to fix the path in order to avoid some unnecessary `Not Found`"""
 
-        scope = self.connection.scope
+        scope = self.scope
         path = scope["path"]
 
         match = self.path_regex.match(path)
@@ -122,12 +140,12 @@ class HeaderVersionResolver(BaseAPIVersioningResolver):
         )
 
     def resolve_version(self) -> str:
-        message = email.message.Message()
-        message[self.header_parameter] = self.connection.headers.get(
-            self.header_parameter
-        )
-        accept = dict(message.get_params(header=self.header_parameter))  # type: ignore[arg-type]
-        version = accept.get(self.version_parameter, self.default_version)
+        header_value = self.connection.headers.get(self.header_parameter)
+        version = self.default_version
+        if header_value is not None:
+            version = parse_media_type(header_value).get_param(
+                self.version_parameter, self.default_version
+            )
         return str(version)
 
 
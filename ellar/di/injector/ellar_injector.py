@@ -3,7 +3,7 @@ from collections import OrderedDict, defaultdict
 
 from ellar.di.logger import log
 from ellar.reflect import asynccontextmanager
-from injector import Injector
+from injector import Injector, SingletonScope
 
 from ..asgi_args import RequestScopeContext
 from ..constants import MODULE_REF_TYPES, SCOPED_CONTEXT_VAR
@@ -136,6 +136,18 @@ class EllarInjector(Injector):
         log.debug(f"{self._log_prefix} -> {result}")
         return t.cast(T, result)
 
+    def is_singleton(self, interface: t.Type) -> bool:
+        """
+        Checks if `interface` resolves to the same instance throughout the injector lifetime.
+        Such instances can be resolved once and kept by the caller.
+        """
+        binding, _ = self.container.get_binding(interface)
+        scope = binding.scope
+
+        if isinstance(scope, ScopeDecorator):  # pragma: no cover
+            scope = scope.scope
+        return isinstance(scope, type) and issubclass(scope, SingletonScope)
+
     def update_scoped_context(self, interface: t.Type[T], value: T) -> None:
         # Sets RequestScope contexts so that they can be available when needed
         #
@@ -1,5 +1,6 @@
 import re
 
+import orjson
 from ellar.auth.session import ISessionStrategy
 from ellar.auth.session.strategy import SessionClientStrategy
 from ellar.common import Controller, Inject, delete, get, post
@@ -185,3 +186,23 @@ def test_session_cookie():
     client.cookies.delete("session")
     response = client.get("/")
     assert response.json() == {"session": {}}
+
+
+def test_session_is_decoded_with_configured_json_decoder():
+    decoded = []
+
+    def json_decoder(data):
+        decoded.append(data)
+        return orjson.loads(data)
+
+    test_module = Test.create_test_module(
+        controllers=[SessionSampleController],
+        config_module={"SECRET_KEY": "secret", "JSON_DECODER": json_decoder},
+    )
+    test_module.override_provider(ISessionStrategy, use_class=SessionClientStrategy)
+    client = test_module.get_test_client()
+
+    client.post("/", json={"some": "data"})
+    response = client.get("/")
+    assert response.json() == {"session": {"some": "data"}}
+    assert decoded == [b'{"some": "data"}']
@@ -0,0 +1,55 @@
+import email.message
+
+import pytest
+from ellar.common.helper.media_type import parse_media_type
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "application/json",
+        "application/json; version=1.0",
+        ' APPLICATION/JSON ;Charset="utf-8"',
+        'text/html;  Version="2" ; q=0.9',
+        'multipart/form-data; boundary="a;b"',
+        "application/json; version",
+        "application/vnd.api+json",
+        "*/*",
+        "bad",
+        "version=1;",
+        "",
+    ],
+)
+def test_parse_media_type_matches_email_message(value):
+    message = email.message.Message()
+    message["content-type"] = value
+    media_type = parse_media_type(value)
+
+    assert media_type.maintype == message.get_content_maintype()
+    assert media_type.subtype == message.get_content_subtype()
+    email_params = [
+        param for param in message.get_params(header="content-type") if param[0]
+    ]
+    if "=" not in value.partition(";")[0]:
+        email_params = email_params[1:]
+    assert list(media_type.params) == email_params
+
+
+@pytest.mark.parametrize(
+    "value, is_json",
+    [
+        ("application/json", True),
+        ("application/geo+json; charset=utf-8", True),
+        ("application/jsonx", False),
+        ("text/json", False),
+    ],
+)
+def test_media_type_is_json(value, is_json):
+    assert parse_media_type(value).is_json() is is_json
+
+
+def test_parse_media_type_is_cached():
+    media_type = parse_media_type("application/json; version=2")
+    assert parse_media_type("application/json; version=2") is media_type
+    assert media_type.get_param("version") == "2"
+    assert media_type.get_param("charset", "utf-8") == "utf-8"
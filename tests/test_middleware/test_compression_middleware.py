@@ -0,0 +1,191 @@
+import gzip
+import zlib
+
+import anyio
+import pytest
+from ellar.common import ModuleRouter
+from ellar.core import Config
+from ellar.core.middleware import CompressionMiddleware
+from ellar.core.middleware.compression import get_accepted_encodings
+from ellar.testing import Test, TestClient
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+body = "x" * 1000
+
+
+def create_client(app, **config):
+    config.setdefault("COMPRESSION_ENABLED", True)
+    middleware = CompressionMiddleware(app, config=Config(**config))
+    return TestClient(middleware), middleware
+
+
+async def text_app(scope, receive, send):
+    await PlainTextResponse(body, headers={"ETag": '"v1"'})(scope, receive, send)
+
+
+async def stream_app(scope, receive, send):
+    async def chunks():
+        for idx in range(3):
+            yield f"{idx}-{body}\n"
+
+    response = StreamingResponse(chunks(), media_type="application/x-ndjson")
+    await response(scope, receive, send)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, accepted, refused",
+    [
+        ("gzip, deflate", {"gzip", "deflate"}, set()),
+        ("br;q=1.0, gzip;q=0", {"br"}, {"gzip"}),
+        ("GZIP; q=0.5, *;q=0.1", {"gzip", "*"}, set()),
+        ("identity;q=invalid", set(), set()),
+    ],
+)
+def test_get_accepted_encodings(accept_encoding, accepted, refused):
+    assert get_accepted_encodings(accept_encoding) == (accepted, refused)
+
+
+def test_compresses_with_gzip():
+    client, _ = create_client(text_app)
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert response.text == body
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(body)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, config",
+    [
+        ("identity", {}),
+        ("gzip;q=0", {}),
+        ("gzip;q=0, br;q=0, *", {}),
+        ("gzip", {"COMPRESSION_ENABLED": False}),
+        ("gzip", {"COMPRESSION_MINIMUM_SIZE": 2000}),
+        ("gzip", {"COMPRESSION_MEDIA_TYPES": ["application/json"]}),
+    ],
+)
+def test_does_not_compress(accept_encoding, config):
+    client, _ = create_client(text_app, **config)
+    response = client.get("/", headers={"accept-encoding": accept_encoding})
+    assert response.text == body
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+
+
+def test_compresses_media_type_suffix():
+    async def app(scope, receive, send):
+        response = JSONResponse({"body": body}, media_type="application/vnd.api+json")
+        await response(scope, receive, send)
+
+    client, _ = create_client(app)
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"body": body}
+
+
+def test_compresses_streaming_response():
+    client, _ = create_client(stream_app)
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text.splitlines() == [f"{idx}-{body}" for idx in range(3)]
+
+
+def test_streaming_response_chunks_are_flushed():
+    sent = []
+
+    async def receive():
+        # the client stays connected while the response is streamed
+        await anyio.sleep_forever()
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    _, middleware = create_client(stream_app)
+    anyio.run(middleware, scope, receive, send)
+
+    chunks = [message["body"] for message in sent[1:]]
+    assert len(chunks) == 4
+    decompressor = zlib.decompressobj(31)
+    assert decompressor.decompress(chunks[0]).decode() == f"0-{body}\n"
+    assert gzip.decompress(b"".join(chunks)).decode().count("\n") == 3
+
+
+def test_compressed_body_cache():
+    client, middleware = create_client(text_app, COMPRESSION_CACHE_SIZE=1)
+    cache_key = ("gzip", "", "/", b"", '"v1"')
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert len(middleware.cache) == 1
+    cached_body = middleware.cache.get(cache_key)
+    assert gzip.decompress(cached_body).decode() == body
+
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert response.text == body
+    assert middleware.cache.get(cache_key) is cached_body
+
+    client.get("/other", headers={"accept-encoding": "gzip"})
+    assert len(middleware.cache) == 1
+    assert middleware.cache.get(cache_key) is None
+
+
+def test_compressed_body_cache_is_keyed_by_request_target():
+    async def app(scope, receive, send):
+        # every page shares the same ETag, e.g. a table wide version
+        page = scope["query_string"].decode()
+        response = PlainTextResponse(f"{page}-{body}", headers={"ETag": '"v1"'})
+        await response(scope, receive, send)
+
+    client, middleware = create_client(app, COMPRESSION_CACHE_SIZE=10)
+    first = client.get("/items?page=1", headers={"accept-encoding": "gzip"})
+    second = client.get("/items?page=2", headers={"accept-encoding": "gzip"})
+    assert first.text == f"page=1-{body}"
+    assert second.text == f"page=2-{body}"
+    assert len(middleware.cache) == 2
+
+
+def test_compressed_body_cache_without_etag():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await PlainTextResponse(body)(scope, receive, send)
+
+    client, middleware = create_client(app, COMPRESSION_CACHE_SIZE=10)
+    client.get("/a", headers={"accept-encoding": "gzip"})
+    client.get("/b", headers={"accept-encoding": "gzip"})
+    assert calls == ["/a", "/b"]
+    # same body, compressed once
+    assert len(middleware.cache) == 1
+
+
+def test_brotli_is_preferred():
+    pytest.importorskip("brotli")
+    client, _ = create_client(text_app)
+    response = client.get("/", headers={"accept-encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert response.text == body
+
+
+router = ModuleRouter("/compression")
+
+
+@router.get("/items")
+def get_items():
+    return [{"id": idx, "name": f"item-{idx}"} for idx in range(100)]
+
+
+def test_application_compresses_responses():
+    client = Test.create_test_module(
+        routers=(router,), config_module={"COMPRESSION_ENABLED": True}
+    ).get_test_client()
+    response = client.get("/compression/items", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()) == 100
@@ -0,0 +1,135 @@
+import typing as t
+from datetime import datetime
+from enum import Enum
+
+import pytest
+from ellar.common import Serializer
+from ellar.common.responses.models import (
+    JSONResponseModel,
+    ResponseModelField,
+    RouteResponseModel,
+)
+from ellar.common.serializer import (
+    SerializerFilter,
+    compile_field_serializer,
+    serialize_object,
+)
+from ellar.common.serializer.compiler import _serialize_any
+from pydantic import BaseModel, Field
+
+from ..schema import BlogObjectDTO, NoteSchemaDC
+
+
+class Color(str, Enum):
+    red = "red"
+
+
+class Item(BaseModel):
+    name: str = Field(alias="itemName")
+    price: float
+    color: Color = Color.red
+    created: datetime = datetime(2020, 1, 1)
+    tags: t.List[str] = []
+    extra: t.Optional[dict] = None
+
+    class Config:
+        allow_population_by_field_name = True
+        json_encoders = {datetime: lambda v: v.strftime("%Y")}
+
+
+class Root(BaseModel):
+    __root__: t.List[Item]
+
+
+class CustomSerialize(Serializer):
+    name: str
+
+    def serialize(self, serializer_filter=None):
+        return {"name": datetime(2021, 1, 1)}
+
+
+def get_field(schema):
+    return t.cast(
+        ResponseModelField,
+        JSONResponseModel(model_field_or_schema=schema).get_model_field(),
+    )
+
+
+class Child(get_field(Item).type_):
+    updated: datetime = datetime(2021, 1, 1)
+
+
+item = {"name": "book", "price": 3, "extra": {"at": datetime(2022, 1, 1)}}
+
+
+@pytest.mark.parametrize(
+    "schema, value",
+    [
+        (Item, item),
+        (Item, Child(name="book", price=1)),
+        (t.Optional[Item], None),
+        (t.List[Item], [item, item]),
+        (t.Set[int], {1, 2}),
+        (t.Dict[str, Item], {"a": item}),
+        (t.Dict[str, t.List[Item]], {"a": [item]}),
+        (Root, [item]),
+        (
+            t.List[t.Union[NoteSchemaDC, BlogObjectDTO]],
+            [{"id": 1, "text": "a", "completed": True}],
+        ),
+        (CustomSerialize, {"name": "a"}),
+        (dict, {"at": datetime(2022, 1, 1)}),
+    ],
+)
+@pytest.mark.parametrize(
+    "serializer_filter",
+    [
+        None,
+        SerializerFilter(by_alias=False),
+        SerializerFilter(exclude={"extra"}, exclude_none=True),
+    ],
+)
+def test_compiled_serializer_matches_serialize_object(schema, value, serializer_filter):
+    field = get_field(schema)
+    values = field.validate_object(value)
+    assert compile_field_serializer(field)(
+        values, serializer_filter
+    ) == serialize_object(values, serializer_filter=serializer_filter)
+
+
+@pytest.mark.parametrize(
+    "schema, compiled",
+    [
+        (Item, True),
+        (t.List[Item], True),
+        (t.Dict[str, Item], True),
+        (CustomSerialize, False),
+        (t.List[t.Union[NoteSchemaDC, BlogObjectDTO]], False),
+        (dict, False),
+    ],
+)
+def test_compiled_serializer_falls_back_to_serialize_object(schema, compiled):
+    assert (
+        compile_field_serializer(get_field(schema)) is not _serialize_any
+    ) is compiled
+
+
+def test_route_response_model_compiles_serializers():
+    route_response_model = RouteResponseModel(route_responses={200: t.List[Item]})
+    response_model = route_response_model.models[200]
+    assert isinstance(response_model, JSONResponseModel)
+
+    model_field = response_model.get_model_field()
+    serializer = model_field._serializer
+    assert serializer is not None
+    assert model_field.get_serializer() is serializer
+    assert model_field.serialize([item]) == [
+        {
+            "itemName": "book",
+            "price": 3.0,
+            "color": "red",
+            "created": "2020",
+            "tags": [],
+            "extra": {"at": "2022"},
+        }
+    ]
@@ -0,0 +1,199 @@
+import typing as t
+from datetime import datetime, timezone
+
+import pytest
+from ellar.common import FastJSONResponse, ModuleRouter, etag
+from ellar.common.responses.models.conditional import (
+    ConditionalResponseValidators,
+    make_etag,
+)
+from ellar.testing import Test
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+
+
+class Note(BaseModel):
+    id: int
+    text: str
+
+
+class NotesVersion:
+    version = 1
+    modified = datetime(2023, 5, 1, 10, 30, 15, 500, tzinfo=timezone.utc)
+    validated = 0
+
+
+def list_notes_version(context, notes):
+    return NotesVersion.version
+
+
+def list_notes_modified(context, notes):
+    return NotesVersion.modified
+
+
+class TrackedNote(Note):
+    def __init__(self, **data: t.Any) -> None:
+        NotesVersion.validated += 1
+        super().__init__(**data)
+
+
+router = ModuleRouter("/notes")
+
+
+@router.get("/", response={200: t.List[TrackedNote]})
+@etag(list_notes_version, last_modified=list_notes_modified)
+def list_notes():
+    return [{"id": 1, "text": "note"}]
+
+
+@router.get("/hashed", response={200: t.List[Note]})
+@etag()
+def list_hashed_notes(text: str = "note"):
+    return [{"id": 1, "text": text}]
+
+
+@router.get("/pages", response={200: t.List[Note]})
+@etag(list_notes_version)
+def list_note_pages(page: int = 1):
+    # every page shares the version of the notes table
+    return [{"id": page, "text": "note" * 500}]
+
+
+@router.post("/", response={200: t.List[Note]})
+@etag()
+def create_notes():
+    return [{"id": 1, "text": "note"}]
+
+
+@router.get("/created", response={201: t.List[Note]})
+@etag()
+def created_notes():
+    return [{"id": 1, "text": "note"}]
+
+
+@pytest.fixture(params=[None, FastJSONResponse], ids=["json", "fast-json"])
+def client(request):
+    NotesVersion.validated = 0
+    config_module = {}
+    if request.param:
+        config_module["DEFAULT_JSON_CLASS"] = request.param
+    return Test.create_test_module(
+        routers=(router,), config_module=config_module
+    ).get_test_client()
+
+
+def test_version_etag_and_last_modified(client):
+    response = client.get("/notes/")
+    assert response.status_code == 200
+    assert response.headers["etag"] == make_etag(b"1")
+    assert response.headers["last-modified"] == "Mon, 01 May 2023 10:30:15 GMT"
+    assert NotesVersion.validated == 1
+
+    response = client.get(
+        "/notes/", headers={"if-none-match": f'"other", {response.headers["etag"]}'}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == make_etag(b"1")
+    # answered without validating the handler output
+    assert NotesVersion.validated == 1
+
+    response = client.get(
+        "/notes/", headers={"if-modified-since": "Mon, 01 May 2023 10:30:15 GMT"}
+    )
+    assert response.status_code == 304
+    response = client.get(
+        "/notes/", headers={"if-modified-since": "Mon, 01 May 2023 10:30:14 GMT"}
+    )
+    assert response.status_code == 200
+
+
+def test_version_change_returns_content(client):
+    etag_value = client.get("/notes/").headers["etag"]
+    NotesVersion.version = 2
+    try:
+        response = client.get("/notes/", headers={"if-none-match": etag_value})
+    finally:
+        NotesVersion.version = 1
+    assert response.status_code == 200
+    assert response.json() == [{"id": 1, "text": "note"}]
+
+
+def test_content_hash_etag(client):
+    response = client.get("/notes/hashed")
+    assert response.headers["etag"] == make_etag(response.content)
+    assert "last-modified" not in response.headers
+
+    not_modified = client.get(
+        "/notes/hashed", headers={"if-none-match": f"W/{response.headers['etag']}"}
+    )
+    assert not_modified.status_code == 304
+
+    changed = client.get(
+        "/notes/hashed",
+        params={"text": "changed"},
+        headers={"if-none-match": response.headers["etag"]},
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != response.headers["etag"]
+
+
+@pytest.mark.parametrize(
+    "method, path", [("post", "/notes/"), ("get", "/notes/created")]
+)
+def test_etag_is_only_for_successful_get(client, method, path):
+    response = client.request(method, path, headers={"if-none-match": "*"})
+    assert response.status_code in (200, 201)
+    assert "etag" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "headers, not_modified",
+    [
+        ({}, False),
+        ({"if-none-match": "*"}, True),
+        ({"if-none-match": '"a"'}, True),
+        ({"if-none-match": 'W/"a"'}, True),
+        (
+            {
+                "if-none-match": '"b"',
+                "if-modified-since": "Mon, 01 May 2023 10:30:15 GMT",
+            },
+            False,
+        ),
+        ({"if-modified-since": "Mon, 01 May 2023 10:30:15 GMT"}, True),
+        ({"if-modified-since": "invalid"}, False),
+    ],
+)
+def test_conditional_response_validators(headers, not_modified):
+    validators = ConditionalResponseValidators(
+        etag='"a"', last_modified=datetime(2023, 5, 1, 10, 30, 15)
+    )
+    assert validators.is_not_modified(Headers(headers)) is not_modified
+
+
+def test_version_etag_with_compression_cache():
+    client = Test.create_test_module(
+        routers=(router,),
+        config_module={"COMPRESSION_ENABLED": True, "COMPRESSION_CACHE_SIZE": 10},
+    ).get_test_client()
+    headers = {"accept-encoding": "gzip"}
+
+    first = client.get("/notes/pages", params={"page": 1}, headers=headers)
+    second = client.get("/notes/pages", params={"page": 2}, headers=headers)
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"] == second.headers["etag"] == f"W/{make_etag(b'1')}"
+    assert first.json()[0]["id"] == 1
+    assert second.json()[0]["id"] == 2
+
+    # served from the compressed body cache
+    assert client.get("/notes/pages", params={"page": 2}, headers=headers).json() == (
+        second.json()
+    )
+
+    not_modified = client.get(
+        "/notes/pages",
+        params={"page": 2},
+        headers={**headers, "if-none-match": second.headers["etag"]},
+    )
+    assert not_modified.status_code == 304
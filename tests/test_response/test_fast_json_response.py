@@ -0,0 +1,141 @@
+import json
+import typing as t
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+
+import pytest
+from ellar.common import (
+    DataclassSerializer,
+    FastJSONResponse,
+    ModuleRouter,
+    Serializer,
+    serializer_filter,
+)
+from ellar.common.serializer import SerializerFilter, dumps_json, serialize_object
+from ellar.testing import Test
+from pydantic import BaseModel
+
+
+class Color(Enum):
+    red = "red"
+
+
+class Note(BaseModel):
+    id: int
+    text: t.Optional[str] = None
+    created: datetime = datetime(2020, 1, 2, 3, 4, 5)
+    color: Color = Color.red
+    key: uuid.UUID = uuid.UUID(int=1)
+    price: Decimal = Decimal("1.5")
+    tags: t.Set[str] = set()
+
+
+class YearNote(Serializer):
+    id: int
+    day: date = date(2021, 5, 6)
+
+    class Config:
+        json_encoders = {date: lambda v: v.year}
+
+
+@dataclass
+class Point:
+    x: int
+    path: PurePath
+
+
+@dataclass
+class PointSerializer(DataclassSerializer):
+    x: int
+    y: t.Optional[int] = None
+
+
+class Root(BaseModel):
+    __root__: t.List[Note]
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Note(id=1, tags={"a"}),
+        [Note(id=1), YearNote(id=2)],
+        {"notes": [Note(id=1)], 1: Point(x=1, path=PurePath("/a/b"))},
+        (PointSerializer(x=1), Color.red, uuid.UUID(int=2)),
+        Root(__root__=[Note(id=3)]),
+        frozenset({1}),
+    ],
+)
+@pytest.mark.parametrize(
+    "_serializer_filter",
+    [None, SerializerFilter(exclude_none=True), SerializerFilter(include={"id"})],
+)
+def test_dumps_json_matches_serialize_object(obj, _serializer_filter):
+    assert json.loads(dumps_json(obj, _serializer_filter)) == serialize_object(
+        obj, serializer_filter=_serializer_filter
+    )
+
+
+router = ModuleRouter("/fast")
+
+
+@router.get("/notes", response={200: t.List[Note]})
+def list_notes():
+    return [Note(id=1, text="a"), {"id": "2"}]
+
+
+@router.get("/year", response={200: YearNote})
+@serializer_filter(exclude={"id"})
+def year_note():
+    return YearNote(id=1)
+
+
+@router.get("/any")
+def any_content():
+    return {"point": Point(x=1, path=PurePath("/a")), "color": Color.red}
+
+
+@pytest.fixture
+def client():
+    return Test.create_test_module(
+        routers=(router,), config_module={"DEFAULT_JSON_CLASS": FastJSONResponse}
+    ).get_test_client()
+
+
+def test_fast_json_response_validates_output(client):
+    response = client.get("/fast/notes")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == [
+        {
+            "id": 1,
+            "text": "a",
+            "created": "2020-01-02T03:04:05",
+            "color": "red",
+            "key": "00000000-0000-0000-0000-000000000001",
+            "price": 1.5,
+            "tags": [],
+        },
+        {
+            "id": 2,
+            "text": None,
+            "created": "2020-01-02T03:04:05",
+            "color": "red",
+            "key": "00000000-0000-0000-0000-000000000001",
+            "price": 1.5,
+            "tags": [],
+        },
+    ]
+
+
+def test_fast_json_response_honours_serializer_filter_and_json_encoders(client):
+    response = client.get("/fast/year")
+    assert response.json() == {"day": 2021}
+
+
+def test_fast_json_response_without_response_schema(client):
+    response = client.get("/fast/any")
+    assert response.json() == {"point": {"x": 1, "path": "/a"}, "color": "red"}
@@ -122,3 +122,77 @@ def test_invalid_response_override_definition():
             response={200: EmptyAPIResponseModel()},
         )
     assert "`RESPONSE_OVERRIDE` is must be of type `Dict`" in str(ex)
+
+
+def test_handler_serializer_filter_is_read_once(monkeypatch):
+    from ellar.common import serializer_filter
+    from ellar.common.responses.models import base as response_models_base
+    from ellar.common.responses.models.base import get_handler_serializer_filter
+
+    @serializer_filter(exclude_none=True)
+    def handler():
+        pass  # pragma: no cover
+
+    calls = []
+
+    class RecordingReflect:
+        def get_metadata(self, *args):
+            calls.append(args)
+            return reflect.get_metadata(*args)
+
+    monkeypatch.setattr(response_models_base, "reflect", RecordingReflect())
+
+    handler_filter = get_handler_serializer_filter(handler)
+    assert handler_filter.exclude_none is True
+    assert get_handler_serializer_filter(handler) is handler_filter
+    assert get_handler_serializer_filter(endpoint_sample) is None
+    assert get_handler_serializer_filter(endpoint_sample) is None
+    assert len(calls) == 2
+
+
+class _HTTPConnectionContext:
+    def __init__(self, status_code=None):
+        self.has_response = status_code is not None
+        self.status_code = status_code
+
+    def get_response(self):
+        return JSONResponse(None, status_code=self.status_code)
+
+
+class _ExecutionContext:
+    def __init__(self, status_code=None):
+        self.http_connection = _HTTPConnectionContext(status_code)
+
+    def switch_to_http_connection(self):
+        return self.http_connection
+
+
+def test_response_resolver_status_code_and_fallback():
+    route_response_model = RouteResponseModel(route_responses={201: NoteSchemaDC})
+    resolver = route_response_model.response_resolver(_ExecutionContext(), {"a": 1})
+    assert resolver.status_code == 201
+    assert resolver.response_model is route_response_model.models[201]
+    assert route_response_model.fallback_hits == 0
+
+    resolver = route_response_model.response_resolver(_ExecutionContext(-100), None)
+    assert resolver.status_code == 201
+
+    resolver = route_response_model.response_resolver(_ExecutionContext(404), None)
+    assert resolver.status_code == 404
+    assert isinstance(resolver.response_model, EmptyAPIResponseModel)
+
+    other_resolver = route_response_model.response_resolver(
+        _ExecutionContext(), (400, None)
+    )
+    assert other_resolver.status_code == 400
+    assert other_resolver.response_model is resolver.response_model
+    assert route_response_model.fallback_hits == 2
+
+
+def test_response_resolver_catch_all_is_not_a_fallback_hit():
+    route_response_model = RouteResponseModel(
+        route_responses={200: NoteSchemaDC, Ellipsis: BlogObjectDTO}
+    )
+    resolver = route_response_model.response_resolver(_ExecutionContext(), (404, None))
+    assert resolver.response_model is route_response_model.models[Ellipsis]
+    assert route_response_model.fallback_hits == 0
@@ -0,0 +1,134 @@
+import json
+
+import pytest
+from ellar.common import ModuleRouter, Serializer, serialize_object
+from ellar.common.responses.models import (
+    StreamingJSONResponseModel,
+    StreamingResponseModelInvalidContent,
+)
+from ellar.openapi import OpenAPIDocumentBuilder
+from ellar.testing import Test
+from pydantic import BaseModel
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+
+
+class RowSerializer(Serializer):
+    id: int
+    name: str
+
+
+def rows(count):
+    for idx in range(count):
+        yield {"id": str(idx), "name": f"row-{idx}"}
+
+
+async def async_rows(count):
+    for idx in range(count):
+        yield Row(id=idx, name=f"row-{idx}")
+
+
+router = ModuleRouter("/export")
+
+
+@router.get(
+    "/array", response={200: StreamingJSONResponseModel(model_field_or_schema=Row)}
+)
+def export_array(count: int = 5):
+    return rows(count)
+
+
+@router.get(
+    "/async",
+    response={200: StreamingJSONResponseModel(model_field_or_schema=Row, batch_size=2)},
+)
+def export_async(count: int = 5):
+    return async_rows(count)
+
+
+@router.get(
+    "/ndjson",
+    response={
+        200: StreamingJSONResponseModel(
+            model_field_or_schema=RowSerializer, ndjson=True, batch_size=2
+        )
+    },
+)
+def export_ndjson(count: int = 5):
+    return [RowSerializer(id=idx, name=f"row-{idx}") for idx in range(count)]
+
+
+@router.get(
+    "/invalid", response={200: StreamingJSONResponseModel(model_field_or_schema=Row)}
+)
+def export_invalid():
+    return {"id": 1, "name": "row"}
+
+
+test_module = Test.create_test_module(routers=(router,))
+app = test_module.create_application()
+client = test_module.get_test_client()
+
+
+def expected_rows(count):
+    return [{"id": idx, "name": f"row-{idx}"} for idx in range(count)]
+
+
+@pytest.mark.parametrize("path", ["/export/array", "/export/async"])
+@pytest.mark.parametrize("count", [0, 1, 5])
+def test_streams_json_array(path, count):
+    response = client.get(path, params={"count": count})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected_rows(count)
+
+
+def test_streams_ndjson():
+    response = client.get("/export/ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == expected_rows(5)
+    assert response.text.endswith("\n")
+
+
+@pytest.mark.parametrize(
+    "content", [list(rows(5)), rows(5), async_rows(5)], ids=["list", "sync", "async"]
+)
+@pytest.mark.asyncio
+async def test_streams_items_in_batches(content):
+    response_model = StreamingJSONResponseModel(model_field_or_schema=Row, batch_size=2)
+    encode_item = response_model.get_item_encoder(None, None, False)
+    chunks = [
+        chunk async for chunk in response_model.iter_content(content, encode_item)
+    ]
+    assert len(chunks) == 4
+    assert json.loads(b"".join(chunks)) == expected_rows(5)
+
+
+def test_invalid_content():
+    with pytest.raises(StreamingResponseModelInvalidContent):
+        client.get("/export/invalid")
+
+
+def test_openapi_shows_item_schema():
+    document = serialize_object(OpenAPIDocumentBuilder().build_document(app))
+    array_response = document["paths"]["/export/array"]["get"]["responses"]["200"]
+    assert array_response["content"] == {
+        "application/json": {
+            "schema": {
+                "title": "Response Model",
+                "type": "array",
+                "items": {"$ref": "#/components/schemas/Row"},
+            }
+        }
+    }
+    ndjson_response = document["paths"]["/export/ndjson"]["get"]["responses"]["200"]
+    assert ndjson_response["content"] == {
+        "application/x-ndjson": {
+            "schema": {"$ref": "#/components/schemas/RowSerializer"}
+        }
+    }
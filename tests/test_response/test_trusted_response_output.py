@@ -0,0 +1,188 @@
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+from ellar.common import (
+    DataclassSerializer,
+    ModuleRouter,
+    Serializer,
+    serializer_filter,
+)
+from ellar.common.responses.models import (
+    JSONResponseModel,
+    ResponseModelField,
+)
+from ellar.testing import Test
+from pydantic import BaseModel
+
+
+class Note(BaseModel):
+    id: int
+    text: str
+
+
+class NoteSerializer(Serializer):
+    id: int
+    text: str
+
+
+@dataclass
+class NoteDataclass:
+    id: int
+    note: t.Optional[str] = None
+
+
+@dataclass
+class NoteDataclassSerializer(DataclassSerializer):
+    id: int
+    note: t.Optional[str] = None
+
+
+router = ModuleRouter("/notes")
+
+
+@router.get("/list", response={200: t.List[Note]})
+def list_notes():
+    return [Note(id=1, text="a"), Note(id=2, text="b")]
+
+
+@router.get("/dicts", response={200: t.List[Note]})
+def list_note_dicts():
+    return [{"id": "1", "text": "a"}]
+
+
+@router.get("/mapping", response={200: t.Dict[str, NoteSerializer]})
+def note_mapping():
+    return {"a": NoteSerializer(id=1, text="a")}
+
+
+@router.get(
+    "/untrusted",
+    response={
+        200: JSONResponseModel(model_field_or_schema=t.List[Note], trust_output=False)
+    },
+)
+def untrusted_notes():
+    return [Note(id=1, text="a")]
+
+
+@router.get(
+    "/trusted",
+    response={
+        200: JSONResponseModel(model_field_or_schema=t.List[Note], trust_output=True)
+    },
+)
+def trusted_notes():
+    return [Note(id=1, text="a")]
+
+
+@router.get(
+    "/dataclass",
+    response={
+        200: JSONResponseModel(
+            model_field_or_schema=t.List[NoteDataclass], trust_output=True
+        )
+    },
+)
+@serializer_filter(exclude_none=True)
+def dataclass_notes():
+    return [NoteDataclass(id=1)]
+
+
+@router.get(
+    "/dataclass-serializer",
+    response={
+        200: JSONResponseModel(
+            model_field_or_schema=t.List[NoteDataclassSerializer], trust_output=True
+        )
+    },
+)
+@serializer_filter(exclude_none=True)
+def dataclass_serializer_notes():
+    return [NoteDataclassSerializer(id=1)]
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    calls = []
+    validate_object = ResponseModelField.validate_object
+
+    def recording_validate_object(self, obj):
+        calls.append(obj)
+        return validate_object(self, obj)
+
+    monkeypatch.setattr(
+        ResponseModelField, "validate_object", recording_validate_object
+    )
+    return calls
+
+
+def get_client(trust_response_output):
+    return Test.create_test_module(
+        routers=(router,),
+        config_module={"TRUST_RESPONSE_OUTPUT": trust_response_output},
+    ).get_test_client()
+
+
+@pytest.mark.parametrize(
+    "path, content",
+    [
+        ("/notes/list", [{"id": 1, "text": "a"}, {"id": 2, "text": "b"}]),
+        ("/notes/mapping", {"a": {"id": 1, "text": "a"}}),
+        ("/notes/trusted", [{"id": 1, "text": "a"}]),
+    ],
+)
+def test_trusted_output_is_not_validated(validations, path, content):
+    response = get_client(True).get(path)
+    assert response.status_code == 200
+    assert response.json() == content
+    assert validations == []
+
+
+@pytest.mark.parametrize(
+    "path, trust_response_output, content",
+    [
+        ("/notes/dicts", True, [{"id": 1, "text": "a"}]),
+        ("/notes/untrusted", True, [{"id": 1, "text": "a"}]),
+        ("/notes/list", False, [{"id": 1, "text": "a"}, {"id": 2, "text": "b"}]),
+    ],
+)
+def test_output_is_validated(validations, path, trust_response_output, content):
+    response = get_client(trust_response_output).get(path)
+    assert response.status_code == 200
+    assert response.json() == content
+    assert len(validations) == 1
+
+
+def test_trusted_route_without_trust_response_output(validations):
+    response = get_client(False).get("/notes/trusted")
+    assert response.json() == [{"id": 1, "text": "a"}]
+    assert validations == []
+
+
+def test_is_trusted_object():
+    model_field = JSONResponseModel(
+        model_field_or_schema=t.List[Note]
+    ).get_model_field()
+    assert model_field.is_trusted_object([Note(id=1, text="a")])
+    assert model_field.is_trusted_object(())
+    assert not model_field.is_trusted_object([Note(id=1, text="a"), {"id": 1}])
+    assert not model_field.is_trusted_object(Note(id=1, text="a"))
+
+    assert (
+        not JSONResponseModel(model_field_or_schema=t.List[int])
+        .get_model_field()
+        .is_trusted_object([1])
+    )
+
+
+def test_trusted_dataclass_output_honours_serializer_filter(validations):
+    client = get_client(False)
+    response = client.get("/notes/dataclass")
+    assert response.json() == [{"id": 1}]
+    # plain dataclasses are validated to the converted model
+    assert len(validations) == 1
+
+    response = client.get("/notes/dataclass-serializer")
+    assert response.json() == [{"id": 1}]
+    assert len(validations) == 1
@@ -0,0 +1,221 @@
+import pytest
+from ellar.common import Controller, ModuleRouter, get, post
+from ellar.common.routing import RouteCollection
+from ellar.common.routing.route_tree import RouteTree
+from ellar.core.versioning import VersioningSchemes as VERSIONING
+from ellar.testing import Test
+from starlette.routing import Mount
+
+from ..test_versioning.operations import mr
+
+items_router = ModuleRouter("/items", name="items")
+
+
+@items_router.get("/")
+def list_items():
+    return ["item"]
+
+
+@items_router.get("/special")
+def special_item():
+    return {"item": "special"}
+
+
+@items_router.get("/{item_id:int}")
+def get_item(item_id: int):
+    return {"item_id": item_id}
+
+
+@items_router.post("/{item_id:int}")
+def update_item(item_id: int):
+    return {"updated": item_id}
+
+
+@Controller("/users")
+class UserController:
+    @get("/me")
+    def me(self):
+        return {"user": "me"}
+
+    @get("/{user_id}")
+    def get_user(self, user_id: str):
+        return {"user": user_id}
+
+    @post("/")
+    def create_user(self):
+        return {"created": True}
+
+
+tm = Test.create_test_module(
+    controllers=(UserController,),
+    routers=(items_router, mr),
+    config_module={"COMPILED_ROUTER": True, "REDIRECT_SLASHES": True},
+)
+
+
+def test_route_tree_returns_routes_sharing_static_prefix_in_order():
+    dummy_app = Mount("/dummy", routes=[])
+    routes = [
+        Mount("", app=dummy_app),
+        Mount("/items", app=dummy_app),
+        Mount("/items/special", app=dummy_app),
+        Mount("/{name}", app=dummy_app),
+        Mount("/users", app=dummy_app),
+    ]
+    tree = RouteTree(routes)
+
+    assert tree.find("/items/special/1") == [routes[0], routes[1], routes[2], routes[3]]
+    assert tree.find("/items/1") == [routes[0], routes[1], routes[3]]
+    assert tree.find("/users") == [routes[0], routes[3], routes[4]]
+    assert tree.find("/unknown") == [routes[0], routes[3]]
+
+
+def test_application_routes_are_compiled():
+    app = tm.create_application()
+    assert app.router.routes.compiled
+
+    for route in app.router.routes:
+        child_routes = getattr(route, "routes", None)
+        if isinstance(child_routes, RouteCollection):
+            assert child_routes.compiled
+
+
+def test_route_collection_is_not_compiled_by_default():
+    app = Test.create_test_module(routers=(mr,)).create_application()
+    assert not app.router.routes.compiled
+
+
+@pytest.mark.parametrize(
+    "path, expected_result",
+    [
+        ("/items/", ["item"]),
+        ("/items/special", {"item": "special"}),
+        ("/items/12", {"item_id": 12}),
+        ("/users/me", {"user": "me"}),
+        ("/users/john", {"user": "john"}),
+        ("/version", {"version": "default"}),
+    ],
+)
+def test_compiled_router_matches_routes(path, expected_result):
+    client = tm.get_test_client()
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.json() == expected_result
+
+
+def test_compiled_router_method_not_allowed():
+    client = tm.get_test_client()
+    response = client.put("/items/12")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET, POST"
+
+
+def test_compiled_router_not_found_and_redirect_slashes():
+    client = tm.get_test_client()
+    assert client.get("/unknown/path").status_code == 404
+
+    response = client.get("/items", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://testserver/items/"
+
+
+@pytest.mark.parametrize(
+    "path, expected_result",
+    [
+        ("/version", {"version": "default"}),
+        ("/v1/version", {"version": "v1"}),
+        ("/v2/version", {"version": "v2"}),
+        ("/v3/version", {"version": "v3"}),
+    ],
+)
+def test_compiled_router_url_versioning(path, expected_result):
+    _tm = Test.create_test_module(
+        routers=(mr,), config_module={"COMPILED_ROUTER": True}
+    )
+    app = _tm.create_application()
+    app.enable_versioning(VERSIONING.URL, version_parameter="v")
+
+    response = _tm.get_test_client().get(path)
+    assert response.status_code == 200
+    assert response.json() == expected_result
+
+
+def test_compiled_router_url_path_for():
+    app = tm.create_application()
+    assert app.url_path_for("items:get_item", item_id=3) == "/items/3"
+    assert app.url_path_for("user:get_user", user_id="john") == "/users/john"
+
+
+def test_compiled_router_is_updated_on_install_module():
+    app = tm.create_application()
+    new_router = ModuleRouter("/installed")
+
+    @new_router.get("/")
+    def installed():
+        return "installed"
+
+    new_module = Test.create_test_module(routers=(new_router,))
+    app.install_module(new_module._testing_module)
+
+    response = tm.get_test_client().get("/installed/")
+    assert response.status_code == 200
+    assert response.json() == "installed"
+
+
+class _VersionResolver:
+    def __init__(self, table_key):
+        self.table_key = table_key
+
+    def get_route_table_key(self):
+        return self.table_key
+
+
+def test_compiled_router_builds_version_route_tables():
+    app = tm.create_application()
+    version_mount = next(
+        route for route in app.router.routes if getattr(route, "path", None) == ""
+    )
+    routes = version_mount.routes
+
+    def _versions(table_key):
+        return [
+            route.endpoint.__name__
+            for route in routes.get_match_candidates(
+                "/version", _VersionResolver(table_key)
+            )
+        ]
+
+    assert _versions(None) == [
+        "default_version",
+        "default_version_1",
+        "default_version_2",
+        "default_version_3",
+    ]
+    assert _versions(("1", False)) == ["default_version_1"]
+    assert _versions(("2", True)) == ["default_version", "default_version_2"]
+    assert _versions(("4", True)) == ["default_version"]
+    assert _versions(("4", False)) == []
+
+
+@pytest.mark.parametrize(
+    "headers, status_code, expected_result",
+    [
+        ({"accept": "application/json; v=1"}, 200, {"version": "v1"}),
+        ({"accept": "application/json; v=3"}, 200, {"version": "v3"}),
+        (
+            {"accept": "application/json; v=4"},
+            406,
+            {"detail": 'Invalid version in "accept" header.'},
+        ),
+    ],
+)
+def test_compiled_router_header_versioning(headers, status_code, expected_result):
+    _tm = Test.create_test_module(
+        routers=(mr,), config_module={"COMPILED_ROUTER": True}
+    )
+    app = _tm.create_application()
+    app.enable_versioning(VERSIONING.HEADER, version_parameter="v")
+
+    response = _tm.get_test_client().get("/version", headers=headers)
+    assert response.status_code == status_code
+    assert response.json() == expected_result
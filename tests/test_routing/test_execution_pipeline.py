@@ -0,0 +1,193 @@
+import typing as t
+
+from ellar.common import (
+    EllarInterceptor,
+    GuardCanActivate,
+    IExecutionContext,
+    IGuardsConsumer,
+    IInterceptorsConsumer,
+    ModuleRouter,
+    UseGuards,
+    UseInterceptors,
+)
+from ellar.core.guards import GuardConsumer
+from ellar.di import injectable, request_scope, transient_scope
+from ellar.testing import Test
+
+instances: t.Dict[str, int] = {}
+
+
+class _CountingGuard(GuardCanActivate):
+    def __init__(self) -> None:
+        instances[self.__class__.__name__] = (
+            instances.get(self.__class__.__name__, 0) + 1
+        )
+
+    async def can_activate(self, context: IExecutionContext) -> bool:
+        return (
+            context.switch_to_http_connection().get_client().query_params.get("deny")
+            != self.__class__.__name__
+        )
+
+
+@injectable
+class SingletonGuard(_CountingGuard):
+    pass
+
+
+@injectable(scope=transient_scope)
+class TransientGuard(_CountingGuard):
+    pass
+
+
+@injectable(scope=request_scope)
+class RequestGuard(_CountingGuard):
+    pass
+
+
+@injectable
+class SingletonInterceptor(EllarInterceptor):
+    def __init__(self) -> None:
+        instances["SingletonInterceptor"] = instances.get("SingletonInterceptor", 0) + 1
+
+    async def intercept(
+        self, context: IExecutionContext, next_interceptor: t.Callable[..., t.Coroutine]
+    ) -> t.Any:
+        data = await next_interceptor()
+        data.append("SingletonInterceptor")
+        return data
+
+
+@injectable(scope=transient_scope)
+class TransientInterceptor(EllarInterceptor):
+    def __init__(self) -> None:
+        instances["TransientInterceptor"] = instances.get("TransientInterceptor", 0) + 1
+
+    async def intercept(
+        self, context: IExecutionContext, next_interceptor: t.Callable[..., t.Coroutine]
+    ) -> t.Any:
+        data = await next_interceptor()
+        data.append("TransientInterceptor")
+        return data
+
+
+router = ModuleRouter("/pipeline")
+
+
+@router.get("/guarded")
+@UseGuards(SingletonGuard, TransientGuard, RequestGuard)
+@UseInterceptors(SingletonInterceptor, TransientInterceptor)
+def guarded():
+    return ["handler"]
+
+
+@router.get("/open")
+def open_route():
+    return ["handler"]
+
+
+def setup_function():
+    instances.clear()
+
+
+def test_singleton_guards_and_interceptors_are_resolved_once():
+    client = Test.create_test_module(routers=(router,)).get_test_client()
+
+    for _ in range(3):
+        response = client.get("/pipeline/guarded")
+        assert response.status_code == 200
+        assert response.json() == [
+            "handler",
+            "TransientInterceptor",
+            "SingletonInterceptor",
+        ]
+
+    assert instances == {
+        "SingletonGuard": 1,
+        "TransientGuard": 3,
+        "RequestGuard": 3,
+        "SingletonInterceptor": 1,
+        "TransientInterceptor": 3,
+    }
+
+
+def test_compiled_guards_deny_requests():
+    client = Test.create_test_module(routers=(router,)).get_test_client()
+
+    for guard in ("SingletonGuard", "TransientGuard", "RequestGuard"):
+        response = client.get("/pipeline/guarded", params={"deny": guard})
+        assert response.status_code == 403
+    assert client.get("/pipeline/guarded").status_code == 200
+
+
+def test_app_guards_added_after_first_request_are_applied():
+    tm = Test.create_test_module(routers=(router,))
+    client = tm.get_test_client()
+    assert client.get("/pipeline/open", params={"deny": "SingletonGuard"}).json() == [
+        "handler"
+    ]
+
+    app = tm.create_application()
+    app.use_global_guards(SingletonGuard)
+    app.use_global_interceptors(SingletonInterceptor())
+
+    response = client.get("/pipeline/open", params={"deny": "SingletonGuard"})
+    assert response.status_code == 403
+
+    response = client.get("/pipeline/open")
+    assert response.json() == ["handler", "SingletonInterceptor"]
+
+
+def test_replaced_app_guards_and_interceptors_are_applied():
+    tm = Test.create_test_module(routers=(router,))
+    client = tm.get_test_client()
+    app = tm.create_application()
+    app.use_global_guards(TransientGuard)
+    app.use_global_interceptors(SingletonInterceptor())
+    response = client.get("/pipeline/open", params={"deny": "SingletonGuard"})
+    assert response.json() == ["handler", "SingletonInterceptor"]
+
+    # same number of guards and interceptors, different items
+    app.get_guards()[:] = [SingletonGuard]
+    app.get_interceptors()[:] = [TransientInterceptor]
+
+    response = client.get("/pipeline/open", params={"deny": "SingletonGuard"})
+    assert response.status_code == 403
+    response = client.get("/pipeline/open")
+    assert response.json() == ["handler", "TransientInterceptor"]
+
+
+def test_execution_pipeline_is_bound_to_application_injector():
+    for _ in range(2):
+        tm = Test.create_test_module(routers=(router,))
+        client = tm.get_test_client()
+        assert client.get("/pipeline/open").json() == ["handler"]
+
+        app = tm.create_application()
+        mount = next(route for route in app.routes if route.path == "/pipeline")
+        operation = next(route for route in mount.routes if route.name == "open_route")
+
+        injector = app.injector
+        pipeline = operation.get_execution_pipeline(injector)
+        assert pipeline.service_provider is injector
+        assert operation.get_execution_pipeline(injector) is pipeline
+        assert pipeline.guard_consumer is injector.get(IGuardsConsumer)
+        assert pipeline.interceptor_consumer is injector.get(IInterceptorsConsumer)
+
+
+def test_custom_request_scoped_guard_consumer_is_resolved_per_request():
+    consumers: t.List[GuardConsumer] = []
+
+    @injectable(scope=request_scope)
+    class RequestGuardConsumer(GuardConsumer):
+        def __init__(self) -> None:
+            super().__init__()
+            consumers.append(self)
+
+    tm = Test.create_test_module(routers=(router,)).override_provider(
+        IGuardsConsumer, use_class=RequestGuardConsumer
+    )
+    client = tm.get_test_client()
+    client.get("/pipeline/open")
+    client.get("/pipeline/open")
+    assert len(consumers) == 2
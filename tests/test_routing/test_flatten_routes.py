@@ -0,0 +1,131 @@
+import pytest
+from ellar.common import Controller, Inject, ModuleRouter, Path, get
+from ellar.common.routing import ModuleMount
+from ellar.common.routing.method_group import RouteMethodGroup
+from ellar.common.routing.mount import ModuleMountRoute
+from ellar.core.versioning import VersioningSchemes as VERSIONING
+from ellar.testing import Test
+from starlette.requests import Request
+from starlette.websockets import WebSocket
+
+from ..test_versioning.operations import ControllerVersioning, mr
+
+org_router = ModuleRouter("/org/{org_id:int}", name="org")
+
+
+@org_router.get("/members/{member_id}")
+def get_member(member_id: str, org_id: int = Path()):
+    return {"org_id": org_id, "member_id": member_id}
+
+
+@org_router.post("/members/{member_id}")
+def update_member(org_id: int, member_id: str):
+    return {"updated": member_id}
+
+
+@org_router.ws_route("/ws")
+async def org_ws(websocket: Inject[WebSocket], org_id: int = Path()):
+    await websocket.accept()
+    await websocket.send_json({"org_id": org_id})
+    await websocket.close()
+
+
+@Controller("/info")
+class InfoController:
+    @get("/")
+    def info(self, request: Inject[Request]):
+        return {"root_path": request.scope["root_path"]}
+
+
+def _get_matching_routes(app):
+    for route in app.router.routes.get_match_candidates("/"):
+        if isinstance(route, RouteMethodGroup):
+            yield from route.routes
+        else:
+            yield route
+
+
+tm = Test.create_test_module(
+    controllers=(InfoController, ControllerVersioning),
+    routers=(org_router, mr),
+    config_module={"FLATTEN_ROUTES": True},
+)
+
+
+def test_flatten_routes_keep_served_routes_intact():
+    app = tm.create_application()
+    assert app.router.routes.flattened
+    assert any(isinstance(route, ModuleMount) for route in app.routes)
+
+    matching_routes = list(_get_matching_routes(app))
+    assert matching_routes
+    assert all(isinstance(route, ModuleMountRoute) for route in matching_routes)
+
+
+def test_flatten_route_combines_mount_and_operation_paths():
+    app = tm.create_application()
+    routes = {
+        route.path: route
+        for route in _get_matching_routes(app)
+        if isinstance(route, ModuleMountRoute)
+    }
+    route = routes["/org/{org_id:int}/members/{member_id}"]
+    assert route.get_control_type() is org_router.get_control_type()
+    assert set(route.param_convertors) == {"org_id", "member_id"}
+
+
+def test_flatten_routes_match_operations():
+    client = tm.get_test_client()
+    response = client.get("/org/3/members/john")
+    assert response.status_code == 200
+    assert response.json() == {"org_id": 3, "member_id": "john"}
+
+    response = client.get("/info/")
+    assert response.status_code == 200
+    assert response.json() == {"root_path": "/info"}
+
+
+def test_flatten_routes_method_not_allowed_and_not_found():
+    client = tm.get_test_client()
+    response = client.put("/org/3/members/john")
+    assert response.status_code == 405
+
+    assert client.get("/org/not-an-int/members/john").status_code == 404
+
+
+def test_flatten_routes_websocket():
+    client = tm.get_test_client()
+    with client.websocket_connect("/org/5/ws") as session:
+        assert session.receive_json() == {"org_id": 5}
+
+
+@pytest.mark.parametrize(
+    "path, expected_result",
+    [
+        ("/version", {"version": "default"}),
+        ("/v1/version", {"version": "v1"}),
+        ("/v2/version", {"version": "v2"}),
+        ("/v1/controller-versioning/version", {"version": "default"}),
+        ("/v2/controller-versioning/version", {"version": "v2"}),
+    ],
+)
+def test_flatten_routes_url_versioning(path, expected_result):
+    _tm = Test.create_test_module(
+        controllers=(ControllerVersioning,),
+        routers=(mr,),
+        config_module={"FLATTEN_ROUTES": True, "COMPILED_ROUTER": True},
+    )
+    app = _tm.create_application()
+    app.enable_versioning(VERSIONING.URL, version_parameter="v")
+
+    response = _tm.get_test_client().get(path)
+    assert response.status_code == 200
+    assert response.json() == expected_result
+
+
+def test_flatten_routes_url_path_for():
+    app = tm.create_application()
+    assert (
+        app.url_path_for("org:get_member", org_id=1, member_id="john")
+        == "/org/1/members/john"
+    )
@@ -0,0 +1,80 @@
+import json
+
+import orjson
+import pytest
+import ujson
+from ellar.common import Inject, ModuleRouter, WsBody
+from ellar.common.helper.json_decoder import decode_json
+from ellar.testing import Test
+from starlette.websockets import WebSocket
+
+router = ModuleRouter("/decoder")
+decoded = []
+
+
+def recording_decoder(data):
+    decoded.append(data)
+    return orjson.loads(data)
+
+
+@router.post("/items")
+def create_item(item: dict):
+    return item
+
+
+@router.ws_route("/ws", use_extra_handler=True, encoding="json")
+async def ws_echo(websocket: Inject[WebSocket], data: dict = WsBody()):
+    await websocket.send_json(data)
+    await websocket.close()
+
+
+@pytest.mark.parametrize("decoder", [None, json.loads, orjson.loads, ujson.loads])
+def test_decode_json(decoder):
+    assert decode_json(b'{"a": [1, 2]}', decoder) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("decoder", [None, orjson.loads, ujson.loads])
+def test_decode_json_errors_have_positions(decoder):
+    with pytest.raises(json.JSONDecodeError) as ex:
+        decode_json(b'{"a": tru}', decoder)
+    assert ex.value.pos == 6
+
+
+def test_decode_json_when_only_the_decoder_fails():
+    def strict_decoder(data):
+        raise ValueError("decoder rejects data")
+
+    with pytest.raises(json.JSONDecodeError, match="decoder rejects data"):
+        decode_json("[1]", strict_decoder)
+
+
+@pytest.fixture
+def client():
+    decoded.clear()
+    return Test.create_test_module(
+        routers=(router,), config_module={"JSON_DECODER": recording_decoder}
+    ).get_test_client()
+
+
+def test_body_is_decoded_with_configured_decoder(client):
+    response = client.post("/decoder/items", json={"name": "book"})
+    assert response.status_code == 200
+    assert response.json() == {"name": "book"}
+    assert decoded == [b'{"name": "book"}']
+
+
+def test_configured_decoder_errors_map_to_validation_errors(client):
+    response = client.post(
+        "/decoder/items",
+        content=b'{"name": book}',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 9]
+
+
+def test_websocket_messages_are_decoded_with_configured_decoder(client):
+    with client.websocket_connect("/decoder/ws") as session:
+        session.send_json({"name": "book"})
+        assert session.receive_json() == {"name": "book"}
+    assert decoded == ['{"name":"book"}']
@@ -0,0 +1,113 @@
+import pytest
+from ellar.common import Controller, ModuleRouter, delete, get, post
+from ellar.common.routing.method_group import RouteMethodGroup
+from ellar.testing import Test
+from starlette.routing import Route
+
+router = ModuleRouter("/books", name="books")
+
+
+@router.get("/{book_id:int}")
+def get_book(book_id: int):
+    return {"action": "get", "book_id": book_id}
+
+
+@router.post("/{book_id:int}")
+def update_book(book_id: int):
+    return {"action": "update", "book_id": book_id}
+
+
+@router.delete("/{book_id:int}")
+def delete_book(book_id: int):
+    return {"action": "delete", "book_id": book_id}
+
+
+@router.get("/recent")
+def recent_books():
+    return {"action": "recent"}
+
+
+@Controller("/authors")
+class AuthorController:
+    @get("/")
+    def list_authors(self):
+        return {"action": "list"}
+
+    @post("/")
+    def create_author(self):
+        return {"action": "create"}
+
+    @delete("/")
+    def clear_authors(self):
+        return {"action": "clear"}
+
+
+@pytest.fixture(
+    params=[
+        {},
+        {"COMPILED_ROUTER": True},
+        {"FLATTEN_ROUTES": True},
+        {"FLATTEN_ROUTES": True, "COMPILED_ROUTER": True},
+    ]
+)
+def client(request):
+    return Test.create_test_module(
+        controllers=(AuthorController,),
+        routers=(router,),
+        config_module=request.param,
+    ).get_test_client()
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("get", "/books/1", {"action": "get", "book_id": 1}),
+        ("post", "/books/2", {"action": "update", "book_id": 2}),
+        ("delete", "/books/3", {"action": "delete", "book_id": 3}),
+        ("get", "/books/recent", {"action": "recent"}),
+        ("get", "/authors/", {"action": "list"}),
+        ("post", "/authors/", {"action": "create"}),
+        ("delete", "/authors/", {"action": "clear"}),
+    ],
+)
+def test_method_group_dispatches_by_method(client, method, path, expected):
+    response = client.request(method, path)
+    assert response.status_code == 200
+    assert response.json() == expected
+
+
+@pytest.mark.parametrize("path", ["/books/1", "/authors/"])
+def test_method_group_method_not_allowed_lists_every_method(client, path):
+    response = client.put(path)
+    assert response.status_code == 405
+    assert response.headers["allow"] == "DELETE, GET, POST"
+
+
+def test_method_group_not_found(client):
+    assert client.get("/books/not-a-number").status_code == 404
+
+
+def endpoint():
+    pass  # pragma: no cover
+
+
+def test_group_routes_groups_adjacent_operations_with_different_methods():
+    app = Test.create_test_module(routers=(router,)).create_application()
+    books_mount = next(route for route in app.routes if route.path == "/books")
+
+    grouped = RouteMethodGroup.group_routes(list(books_mount.routes))
+    assert len(grouped) == 2
+
+    group = next(route for route in grouped if isinstance(route, RouteMethodGroup))
+    assert group.path == "/{book_id:int}"
+    assert group.methods == {"GET", "POST", "DELETE"}
+    assert group.get_allow_header() == "DELETE, GET, POST"
+
+
+def test_group_routes_ignores_routes_without_group_key():
+    routes = [
+        Route("/a", endpoint, methods=["GET"]),
+        Route("/a", endpoint, methods=["POST"]),
+    ]
+    assert RouteMethodGroup.get_group_key(routes[0]) is None
+    assert RouteMethodGroup.group_routes(routes) == routes
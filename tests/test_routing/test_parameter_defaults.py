@@ -0,0 +1,85 @@
+import dataclasses
+import typing as t
+from enum import Enum
+
+import pytest
+from ellar.common import Header, ModuleRouter, Query, Serializer
+from ellar.common.params.helpers import get_default_value_factory, is_immutable_value
+from ellar.testing import Test
+
+
+class Color(Enum):
+    red = "red"
+
+
+class FrozenFilter(Serializer):
+    limit: int = 10
+
+    class Config:
+        frozen = True
+
+
+class MutableFilter(Serializer):
+    limit: int = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class FrozenPoint:
+    x: int = 0
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        1,
+        1.5,
+        "a",
+        b"a",
+        True,
+        Color.red,
+        (1, "a", (None,)),
+        frozenset({1, 2}),
+        FrozenFilter(),
+        FrozenPoint(),
+    ],
+)
+def test_immutable_defaults_are_not_copied(value):
+    assert is_immutable_value(value)
+    assert get_default_value_factory(value)() is value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [[1, 2], {"a": 1}, {1, 2}, ([],), MutableFilter(), [[1]], {"a": [1]}],
+)
+def test_mutable_defaults_are_copied(value):
+    assert not is_immutable_value(value)
+    copied = get_default_value_factory(value)()
+    assert copied == value
+    assert copied is not value
+
+
+def test_nested_mutable_defaults_are_deep_copied():
+    value = {"a": [1]}
+    copied = get_default_value_factory(value)()
+    assert copied["a"] is not value["a"]
+
+
+router = ModuleRouter("/defaults")
+
+
+@router.get("/")
+def get_defaults(
+    tags: t.List[str] = Query(["a"]),
+    x_limit: int = Header(5),
+):
+    tags.append("b")
+    return {"tags": tags, "x_limit": x_limit}
+
+
+def test_mutable_parameter_defaults_are_not_shared_between_requests():
+    client = Test.create_test_module(routers=(router,)).get_test_client()
+    for _ in range(2):
+        response = client.get("/defaults/")
+        assert response.json() == {"tags": ["a", "b"], "x_limit": 5}
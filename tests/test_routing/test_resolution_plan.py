@@ -0,0 +1,315 @@
+import typing as t
+
+import anyio
+from ellar.common import (
+    Cookie,
+    Header,
+    HTTPException,
+    Inject,
+    ModuleRouter,
+    Path,
+    Query,
+    Serializer,
+)
+from ellar.common.params import RequestEndpointArgsModel
+from ellar.common.params.args.resolution_plan import ParameterResolutionPlan
+from ellar.common.params.resolvers import (
+    BodyParameterResolver,
+    BulkBodyParameterResolver,
+    GroupedParameterResolver,
+    QueryParameterResolver,
+    ReceivedParameterResolver,
+    SystemParameterResolver,
+)
+from ellar.testing import Test
+from pydantic.error_wrappers import ErrorWrapper
+from starlette.requests import Request
+from starlette.testclient import TestClient
+
+router = ModuleRouter("/plan")
+
+
+class Filter(Serializer):
+    limit: int = 10
+    tags: t.List[str] = []
+
+
+@router.get("/{item_id:int}")
+def get_item(
+    request: Inject[Request],
+    item_id: int = Path(),
+    q: str = Query(None),
+    x_token: str = Header(),
+    session: str = Cookie(None),
+    filters: Filter = Query(),
+):
+    return {
+        "item_id": item_id,
+        "q": q,
+        "x_token": x_token,
+        "session": session,
+        "filters": filters.dict(),
+        "path": request.url.path,
+    }
+
+
+@router.get("/grouped/search")
+def search(
+    q: str = Query(),
+    page: int = Query(1),
+    ids: t.List[int] = Query(None),
+    x_a: str = Header(),
+    x_b: int = Header(0),
+):
+    return {"q": q, "page": page, "ids": ids, "x_a": x_a, "x_b": x_b}
+
+
+class WaitingResolver(SystemParameterResolver):
+    """Waits until `sets` resolver ran, which only works when both run concurrently"""
+
+    io_bound = True
+
+    def __init__(
+        self,
+        wait_for: str,
+        sets: str,
+        fail: bool = False,
+        raises: t.Optional[Exception] = None,
+    ) -> None:
+        super().__init__()
+        self.wait_for = wait_for
+        self.sets = sets
+        self.fail = fail
+        self.raises = raises
+
+    async def resolve(self, ctx, **kwargs):
+        events = ctx.switch_to_http_connection().get_client().state.events
+        events[self.sets].set()
+        with anyio.fail_after(1):
+            await events[self.wait_for].wait()
+        if self.raises:
+            raise self.raises
+        if self.fail:
+            return {}, [ErrorWrapper(ValueError("failed"), loc=self.parameter_name)]
+        return {self.parameter_name: self.sets}, []
+
+
+@router.get("/concurrent")
+def concurrent(
+    first: str = WaitingResolver("b", "a", fail=True),
+    q: int = Query(),
+    second: str = WaitingResolver("a", "b", fail=True),
+):
+    return {"first": first, "q": q, "second": second}  # pragma: no cover
+
+
+@router.get("/concurrent/raises")
+def concurrent_raises(
+    first: str = WaitingResolver("b", "a", raises=HTTPException(status_code=403)),
+    second: str = WaitingResolver("a", "b", raises=HTTPException(status_code=404)),
+):
+    return {"first": first, "second": second}  # pragma: no cover
+
+
+@router.get("/concurrent/ok")
+def concurrent_ok(
+    first: str = WaitingResolver("b", "a"),
+    second: str = WaitingResolver("a", "b"),
+):
+    return {"first": first, "second": second}
+
+
+tm = Test.create_test_module(routers=(router,))
+client = tm.get_test_client()
+
+
+def test_resolution_plan_resolves_every_location():
+    client.cookies["session"] = "abc"
+    response = client.get(
+        "/plan/3?q=search&limit=2&tags=a&tags=b", headers={"x-token": "token"}
+    )
+    client.cookies.clear()
+    assert response.status_code == 200
+    assert response.json() == {
+        "item_id": 3,
+        "q": "search",
+        "x_token": "token",
+        "session": "abc",
+        "filters": {"limit": 2, "tags": ["a", "b"]},
+        "path": "/plan/3",
+    }
+
+
+def test_resolution_plan_reports_errors():
+    response = client.get("/plan/3?limit=invalid")
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["header", "x-token"],
+        ["query", "limit"],
+    ]
+
+
+def test_resolution_plan_only_awaits_system_parameters():
+    model = RequestEndpointArgsModel(
+        path="/{item_id:int}",
+        endpoint=get_item,
+        operation_unique_id="get_item",
+        param_converters={},
+    )
+    model.build_model()
+    plan = model.get_resolution_plan()
+
+    # item_id, q, x_token, session and bulk filters are resolved synchronously
+    assert plan.resolve_received_count == 5
+    assert len(model.get_route_models()) == 6
+
+
+class CustomQueryParameterResolver(QueryParameterResolver):
+    async def resolve_handle(self, *args: t.Any, **kwargs: t.Any) -> t.Tuple:
+        return await super().resolve_handle(*args, **kwargs)  # pragma: no cover
+
+
+def test_resolvers_overriding_resolve_handle_are_awaited():
+    model = RequestEndpointArgsModel(
+        path="/",
+        endpoint=get_item,
+        operation_unique_id="get_item",
+        param_converters={},
+    )
+    model.build_model()
+    query_resolver = next(
+        resolver
+        for resolver in model.get_route_models()
+        if type(resolver) is QueryParameterResolver
+    )
+    custom_resolver = CustomQueryParameterResolver(query_resolver.model_field)
+
+    assert query_resolver.supports_resolve_received()
+    assert not custom_resolver.supports_resolve_received()
+    assert ParameterResolutionPlan([custom_resolver]).resolve_received_count == 0
+
+
+def test_only_received_parameter_resolvers_are_resolved_synchronously():
+    model = RequestEndpointArgsModel(
+        path="/",
+        endpoint=get_item,
+        operation_unique_id="get_item",
+        param_converters={},
+    )
+    model.build_model()
+    query_resolver = next(
+        resolver
+        for resolver in model.get_route_models()
+        if type(resolver) is QueryParameterResolver
+    )
+    body_resolver = BodyParameterResolver(query_resolver.model_field)
+    bulk_body_resolver = BulkBodyParameterResolver(
+        query_resolver.model_field, resolvers=[body_resolver]
+    )
+
+    assert not isinstance(body_resolver, ReceivedParameterResolver)
+    assert not bulk_body_resolver.supports_resolve_received()
+    plan = ParameterResolutionPlan([body_resolver, bulk_body_resolver])
+    assert plan.resolve_received_count == 0
+
+
+def test_grouped_parameters_are_validated_per_location():
+    model = RequestEndpointArgsModel(
+        path="/grouped/search",
+        endpoint=search,
+        operation_unique_id="search",
+        param_converters={},
+    )
+    model.build_model()
+    resolution_models = model.compute_resolution_models()
+
+    assert len(model.get_route_models()) == 5
+    assert [type(resolver) for resolver in resolution_models] == [
+        GroupedParameterResolver,
+        GroupedParameterResolver,
+    ]
+    assert [
+        [resolver.model_field.name for resolver in grouped.resolvers]
+        for grouped in resolution_models
+    ] == [["x_a", "x_b"], ["q", "page", "ids"]]
+
+
+def test_grouped_parameters_resolve():
+    response = client.get(
+        "/plan/grouped/search?q=book&ids=1&ids=2", headers={"x-a": "a", "x-b": "4"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "q": "book",
+        "page": 1,
+        "ids": [1, 2],
+        "x_a": "a",
+        "x_b": 4,
+    }
+
+
+def test_grouped_parameters_error_locations():
+    response = client.get(
+        "/plan/grouped/search?page=first&ids=1&ids=two", headers={"x-b": "b"}
+    )
+    assert response.status_code == 422
+    assert [
+        (tuple(error["loc"]), error["type"]) for error in response.json()["detail"]
+    ] == [
+        (("header", "x-a"), "value_error.missing"),
+        (("header", "x-b"), "type_error.integer"),
+        (("query", "q"), "value_error.missing"),
+        (("query", "page"), "type_error.integer"),
+        (("query", "ids", 1), "type_error.integer"),
+    ]
+
+
+def _set_events_middleware(app):
+    async def middleware(scope, receive, send):
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["events"] = {
+                "a": anyio.Event(),
+                "b": anyio.Event(),
+            }
+        await app(scope, receive, send)
+
+    return middleware
+
+
+def test_io_bound_resolvers_are_resolved_concurrently():
+    app = tm.create_application()
+    test_client = TestClient(_set_events_middleware(app))
+    response = test_client.get("/plan/concurrent/ok")
+    assert response.status_code == 200
+    assert response.json() == {"first": "a", "second": "b"}
+
+
+def test_concurrent_resolution_keeps_error_order():
+    app = tm.create_application()
+    test_client = TestClient(_set_events_middleware(app))
+    response = test_client.get("/plan/concurrent")
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["query", "q"],
+        ["first"],
+        ["second"],
+    ]
+
+
+def test_concurrent_resolution_raises_first_exception():
+    app = tm.create_application()
+    test_client = TestClient(_set_events_middleware(app))
+    response = test_client.get("/plan/concurrent/raises")
+    assert response.status_code == 403
+
+
+def test_single_io_bound_resolver_is_awaited_inline():
+    model = RequestEndpointArgsModel(
+        path="/concurrent/ok",
+        endpoint=concurrent_ok,
+        operation_unique_id="concurrent_ok",
+        param_converters={},
+    )
+    model.build_model()
+    assert model.get_resolution_plan().concurrent
+    assert not ParameterResolutionPlan(model.get_route_models()[:1]).concurrent
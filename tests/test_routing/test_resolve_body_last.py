@@ -0,0 +1,73 @@
+import orjson
+import pytest
+from ellar.common import Body, Header, ModuleRouter, Query
+from ellar.testing import Test
+
+router = ModuleRouter("/lazy")
+decoded = []
+
+
+def recording_decoder(data):
+    decoded.append(data)
+    return orjson.loads(data)
+
+
+@router.post("/items")
+def create_item(
+    item: dict = Body(),
+    limit: int = Query(),
+    x_token: str = Header(),
+):
+    return {"item": item, "limit": limit, "x_token": x_token}
+
+
+def get_client(resolve_body_last):
+    decoded.clear()
+    return Test.create_test_module(
+        routers=(router,),
+        config_module={
+            "JSON_DECODER": recording_decoder,
+            "RESOLVE_BODY_LAST": resolve_body_last,
+        },
+    ).get_test_client()
+
+
+@pytest.mark.parametrize("resolve_body_last", [True, False])
+def test_valid_request(resolve_body_last):
+    client = get_client(resolve_body_last)
+    response = client.post(
+        "/lazy/items?limit=3", json={"name": "book"}, headers={"x-token": "abc"}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"item": {"name": "book"}, "limit": 3, "x_token": "abc"}
+    assert len(decoded) == 1
+
+
+def test_invalid_parameters_skip_body_decoding():
+    client = get_client(True)
+    response = client.post("/lazy/items?limit=abc", json={"name": "book"})
+    assert response.status_code == 422
+    assert sorted(error["loc"] for error in response.json()["detail"]) == [
+        ["header", "x-token"],
+        ["query", "limit"],
+    ]
+    assert decoded == []
+
+
+def test_invalid_body_is_reported_after_valid_parameters():
+    client = get_client(True)
+    response = client.post(
+        "/lazy/items?limit=3",
+        content=b'{"name": ',
+        headers={"x-token": "abc", "content-type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 9]
+    assert len(decoded) == 1
+
+
+def test_body_is_resolved_first_by_default():
+    client = get_client(False)
+    response = client.post("/lazy/items?limit=abc", json={"name": "book"})
+    assert response.status_code == 422
+    assert len(decoded) == 1
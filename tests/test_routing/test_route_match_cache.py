@@ -0,0 +1,124 @@
+from ellar.common import ModuleRouter
+from ellar.core.routing import RouteMatchCache
+from ellar.core.versioning import VersioningSchemes as VERSIONING
+from ellar.testing import Test
+from starlette.routing import Host, Router
+
+from ..test_versioning.operations import mr
+
+items_router = ModuleRouter("/items")
+
+
+@items_router.get("/{item_id:int}")
+def get_item(item_id: int):
+    return {"item_id": item_id}
+
+
+def _create_test_module(cache_size=2, **config):
+    return Test.create_test_module(
+        routers=(items_router, mr),
+        config_module={"ROUTE_MATCH_CACHE_SIZE": cache_size, **config},
+    )
+
+
+def test_route_match_cache_is_disabled_by_default():
+    app = Test.create_test_module(routers=(items_router,)).create_application()
+    assert app.router.match_cache is None
+
+
+def test_route_match_cache_hits_and_misses():
+    tm = _create_test_module()
+    client = tm.get_test_client()
+    match_cache = tm.create_application().router.match_cache
+
+    for _ in range(3):
+        response = client.get("/items/1")
+        assert response.json() == {"item_id": 1}
+
+    response = client.get("/items/2")
+    assert response.json() == {"item_id": 2}
+
+    info = match_cache.cache_info()
+    assert info.hits == 2
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+def test_route_match_cache_is_bounded():
+    tm = _create_test_module(cache_size=2)
+    client = tm.get_test_client()
+    match_cache = tm.create_application().router.match_cache
+
+    for item_id in range(5):
+        assert client.get(f"/items/{item_id}").json() == {"item_id": item_id}
+    assert len(match_cache) == 2
+
+    client.get("/items/0")
+    assert match_cache.cache_info().hits == 0
+
+
+def test_route_match_cache_does_not_cache_partial_and_not_found():
+    tm = _create_test_module()
+    client = tm.get_test_client()
+    match_cache = tm.create_application().router.match_cache
+
+    assert client.post("/items/1").status_code == 405
+    assert client.get("/not-found").status_code == 404
+    assert len(match_cache) == 0
+
+
+def test_route_match_cache_key_includes_version():
+    tm = _create_test_module(cache_size=10)
+    app = tm.create_application()
+    app.enable_versioning(VERSIONING.HEADER, version_parameter="v")
+    client = tm.get_test_client()
+
+    for _ in range(2):
+        for version, expected in [("1", "v1"), ("2", "v2")]:
+            response = client.get(
+                "/version", headers={"accept": f"application/json; v={version}"}
+            )
+            assert response.json() == {"version": expected}
+    assert app.router.match_cache.cache_info().hits == 2
+
+
+def test_route_match_cache_is_cleared_on_install_module():
+    tm = _create_test_module()
+    app = tm.create_application()
+    client = tm.get_test_client()
+
+    client.get("/items/1")
+    assert len(app.router.match_cache) == 1
+
+    new_router = ModuleRouter("/new")
+
+    @new_router.get("/")
+    def new_route():
+        return "new"
+
+    app.install_module(Test.create_test_module(routers=(new_router,))._testing_module)
+    assert len(app.router.match_cache) == 0
+    assert client.get("/new/").json() == "new"
+
+
+def test_route_match_cache_is_not_used_with_host_routes():
+    tm = Test.create_test_module(
+        routers=(items_router, Host("api.example.com", app=Router())),
+        config_module={"ROUTE_MATCH_CACHE_SIZE": 2},
+    )
+    client = tm.get_test_client()
+    client.get("/items/1")
+    client.get("/items/1")
+    assert tm.create_application().router.match_cache.cache_info().hits == 0
+
+
+def test_route_match_cache_copies_path_params():
+    route = object()
+    match_cache = RouteMatchCache(maxsize=1)
+    match_cache.set(("http", "GET", "/"), route, {"path_params": {"a": 1}})
+
+    _, child_scope = match_cache.get(("http", "GET", "/"))
+    child_scope["path_params"]["a"] = 2
+
+    _, child_scope = match_cache.get(("http", "GET", "/"))
+    assert child_scope["path_params"] == {"a": 1}
@@ -0,0 +1,138 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+from ellar.common import File, Form, ModuleRouter, UploadFile, UploadFileChunks
+from ellar.common.formparsers import (
+    MultiPartLimits,
+    MultiPartSizeError,
+    StreamingMultiPartParser,
+)
+from ellar.testing import Test
+from starlette.datastructures import Headers
+
+router = ModuleRouter("/upload")
+paths = []
+
+
+@router.post("/bytes")
+def upload_bytes(file: bytes = File(), note: str = Form("")):
+    return {"size": len(file), "note": note}
+
+
+@router.post("/path")
+def upload_path(file: Path = File()):
+    paths.append(file)
+    return {"exists": file.exists(), "content": file.read_bytes().decode()}
+
+
+@router.post("/paths")
+def upload_paths(files: t.List[Path] = File()):
+    return {"contents": [file.read_bytes().decode() for file in files]}
+
+
+@router.post("/chunks")
+async def upload_chunks(file: UploadFileChunks = File()):
+    file.chunk_size = 4
+    chunks = [chunk async for chunk in file]
+    return {"filename": file.filename, "chunks": [chunk.decode() for chunk in chunks]}
+
+
+@router.post("/spooled")
+def upload_spooled(file: UploadFile = File()):
+    return {"rolled": file.file._rolled}
+
+
+def get_client(**config):
+    return Test.create_test_module(
+        routers=(router,), config_module=config
+    ).get_test_client()
+
+
+def test_upload_without_limits():
+    client = get_client()
+    response = client.post(
+        "/upload/bytes", files={"file": ("a.txt", b"x" * 2048)}, data={"note": "n"}
+    )
+    assert response.json() == {"size": 2048, "note": "n"}
+
+
+@pytest.mark.parametrize(
+    "config, files, data, detail",
+    [
+        (
+            {"MULTIPART_MAX_FILE_SIZE": 10},
+            {"file": ("a.txt", b"x" * 11)},
+            {},
+            "File 'file' exceeds the maximum size of 10 bytes.",
+        ),
+        (
+            {"MULTIPART_MAX_FIELD_SIZE": 3},
+            {"file": ("a.txt", b"x")},
+            {"note": "long note"},
+            "Field 'note' exceeds the maximum size of 3 bytes.",
+        ),
+        (
+            {"MULTIPART_MAX_REQUEST_SIZE": 100},
+            {"file": ("a.txt", b"x" * 200)},
+            {},
+            "Request body exceeds the maximum size of 100 bytes.",
+        ),
+    ],
+)
+def test_upload_limits(config, files, data, detail):
+    client = get_client(**config)
+    response = client.post("/upload/bytes", files=files, data=data)
+    assert response.status_code == 413
+    assert response.json()["detail"] == detail
+
+
+def test_upload_within_limits():
+    client = get_client(
+        MULTIPART_MAX_FILE_SIZE=10,
+        MULTIPART_MAX_FIELD_SIZE=10,
+        MULTIPART_MAX_REQUEST_SIZE=1000,
+    )
+    response = client.post(
+        "/upload/bytes", files={"file": ("a.txt", b"x" * 10)}, data={"note": "n"}
+    )
+    assert response.json() == {"size": 10, "note": "n"}
+
+
+def test_request_size_is_checked_from_content_length():
+    headers = Headers(
+        {"content-type": "multipart/form-data; boundary=x", "content-length": "101"}
+    )
+    limits = MultiPartLimits(max_request_size=100)
+    with pytest.raises(MultiPartSizeError):
+        StreamingMultiPartParser.check_content_length(headers, limits)
+
+
+@pytest.mark.parametrize("spool_max_size, rolled", [(1024, False), (10, True)])
+def test_spool_max_size(spool_max_size, rolled):
+    client = get_client(MULTIPART_SPOOL_MAX_SIZE=spool_max_size)
+    response = client.post("/upload/spooled", files={"file": ("a.txt", b"x" * 100)})
+    assert response.json() == {"rolled": rolled}
+
+
+def test_upload_as_file_path():
+    paths.clear()
+    client = get_client()
+    response = client.post("/upload/path", files={"file": ("a.txt", b"content")})
+    assert response.json() == {"exists": True, "content": "content"}
+    assert isinstance(paths[0], Path)
+
+
+def test_uploads_as_file_paths():
+    client = get_client()
+    response = client.post(
+        "/upload/paths",
+        files=[("files", ("a.txt", b"first")), ("files", ("b.txt", b"second"))],
+    )
+    assert response.json() == {"contents": ["first", "second"]}
+
+
+def test_upload_as_async_chunks():
+    client = get_client()
+    response = client.post("/upload/chunks", files={"file": ("a.txt", b"0123456789")})
+    assert response.json() == {"filename": "a.txt", "chunks": ["0123", "4567", "89"]}
@@ -0,0 +1,147 @@
+import pytest
+from ellar.common import Controller, ModuleRouter, Path, get, ws_route
+from ellar.common.routing import RouteCollection
+from ellar.common.routing.path_formatter import PathFormatter, get_path_formatter
+from ellar.testing import Test
+from starlette.routing import Mount, NoMatchFound, Route, compile_path, replace_params
+
+named_router = ModuleRouter("/org/{org_id:int}", name="org")
+
+
+@named_router.get("/members/{member_id}")
+def get_member(member_id: str, org_id: int = Path()):
+    return {"org_id": org_id, "member_id": member_id}
+
+
+@named_router.ws_route("/ws")
+async def org_ws(org_id: int = Path()):
+    pass  # pragma: no cover
+
+
+unnamed_router = ModuleRouter("/unnamed")
+
+
+@unnamed_router.get("/items/{item_id:int}")
+def get_item(item_id: int):
+    return item_id  # pragma: no cover
+
+
+@Controller("/users", name="users")
+class UserController:
+    @get("/{user_id:uuid}")
+    def get_user(self, user_id: str):
+        return user_id  # pragma: no cover
+
+    @ws_route("/live")
+    async def live(self):
+        pass  # pragma: no cover
+
+
+def homepage():
+    pass  # pragma: no cover
+
+
+static_mount = Mount(
+    "/static",
+    name="static",
+    routes=[Route("/{file_path:path}", homepage, name="file")],
+)
+
+tm = Test.create_test_module(
+    controllers=(UserController,),
+    routers=(named_router, unnamed_router, static_mount),
+)
+
+
+@pytest.mark.parametrize(
+    "path, path_params",
+    [
+        ("/", {}),
+        ("/items/{item_id:int}", {"item_id": 3}),
+        ("/org/{org_id:int}/members/{member_id}", {"org_id": 1, "member_id": "a"}),
+        ("/org/{org_id:int}/members/{member_id}", {"org_id": 1, "extra": "b"}),
+        ("/files/{file_path:path}.{ext}", {"file_path": "a/b", "ext": "txt"}),
+    ],
+)
+def test_path_formatter_matches_starlette_replace_params(path, path_params):
+    _, path_format, param_convertors = compile_path(path)
+    formatter = PathFormatter(path_format, param_convertors)
+
+    assert formatter.format(dict(path_params)) == replace_params(
+        path_format, param_convertors, dict(path_params)
+    )
+
+
+def test_path_formatters_are_cached():
+    _, path_format, param_convertors = compile_path("/items/{item_id:int}")
+    assert get_path_formatter(path_format, param_convertors) is get_path_formatter(
+        path_format, dict(param_convertors)
+    )
+
+
+def test_route_collection_indexes_mount_prefixed_names():
+    app = tm.create_application()
+    names = set(app.router.routes.get_route_names())
+    assert {
+        "org",
+        "org:get_member",
+        "org:org_ws",
+        "get_item",
+        "users",
+        "users:get_user",
+        "users:live",
+        "static",
+        "static:file",
+    }.issubset(names)
+
+
+@pytest.mark.parametrize(
+    "name, path_params, expected",
+    [
+        ("org:get_member", {"org_id": 1, "member_id": "john"}, "/org/1/members/john"),
+        ("get_item", {"item_id": 5}, "/unnamed/items/5"),
+        (
+            "users:get_user",
+            {"user_id": "0b0b0b0b-0b0b-0b0b-0b0b-0b0b0b0b0b0b"},
+            "/users/0b0b0b0b-0b0b-0b0b-0b0b-0b0b0b0b0b0b",
+        ),
+        ("static", {"path": "/css/app.css"}, "/static/css/app.css"),
+        ("static:file", {"file_path": "css/app.css"}, "/static/css/app.css"),
+    ],
+)
+def test_url_path_for(name, path_params, expected):
+    app = tm.create_application()
+    assert app.url_path_for(name, **path_params) == expected
+
+
+def test_url_path_for_websocket_routes():
+    app = tm.create_application()
+    url = app.url_path_for("org:org_ws", org_id=2)
+    assert url == "/org/2/ws"
+    assert url.protocol == "websocket"
+    assert app.url_path_for("users:live").protocol == "websocket"
+
+
+@pytest.mark.parametrize(
+    "name, path_params",
+    [
+        ("org:unknown", {"org_id": 1}),
+        ("unknown", {}),
+        ("org:get_member", {"org_id": 1}),
+        ("get_item", {"item_id": 5, "extra": 1}),
+    ],
+)
+def test_url_path_for_raises_no_match_found(name, path_params):
+    app = tm.create_application()
+    with pytest.raises(NoMatchFound):
+        app.url_path_for(name, **path_params)
+
+
+def test_url_path_for_routes_added_after_index_was_built():
+    routes = RouteCollection([Route("/a", homepage, name="a")])
+    mount = Mount("/mount", routes=[])
+    routes.append(mount)
+
+    mount.routes.append(Route("/late", homepage, name="late"))
+    assert "late" not in routes.get_route_names()
+    assert routes.url_path_for("late") == "/mount/late"
@@ -1,4 +1,6 @@
+import gc
 import typing as t
+import weakref
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -13,7 +15,7 @@ from ellar.common.serializer import (
     get_dataclass_pydantic_model,
     serialize_object,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, create_model
 from pydantic import dataclasses as pydantic_dataclasses
 
 
@@ -248,3 +250,166 @@ def test_encode_model_with_path(model_with_path):
 def test_encode_root():
     model = ModelWithRoot(__root__="Foo")
     assert serialize_object(model) == "Foo"
+
+
+def test_serialize_handlers_are_cached_per_type():
+    from ellar.common.serializer.base import _serialize_handlers, _serialize_other
+
+    class StrEnum(str, Enum):
+        a = "a"
+
+    assert serialize_object([StrEnum.a, DictablePerson(name="Foo")]) == [
+        "a",
+        {"name": "Foo"},
+    ]
+    assert StrEnum in _serialize_handlers
+    assert _serialize_handlers[DictablePerson] is _serialize_other
+    # same type, different encoders
+    assert (
+        serialize_object(DictablePerson(name="Foo"), {DictablePerson: lambda o: o.name})
+        == "Foo"
+    )
+
+
+def test_model_encoders_are_merged_once_per_config():
+    from ellar.common.serializer.base import _config_encoders
+
+    serialize_object(ModelWithCustomEncoder(dt_field=datetime(2019, 1, 1, 8)))
+    encoders = _config_encoders[ModelWithCustomEncoder.__config__]
+    serialize_object(ModelWithCustomEncoder(dt_field=datetime(2020, 1, 1, 8)))
+    assert _config_encoders[ModelWithCustomEncoder.__config__] is encoders
+    assert datetime in encoders
+
+
+def test_encode_falls_back_when_cached_conversion_fails():
+    class MaybeDictable(Person):
+        def __iter__(self):
+            if self.name == "vars":
+                raise TypeError()
+            return iter([("name", self.name)])
+
+    assert serialize_object(MaybeDictable(name="Foo")) == {"name": "Foo"}
+    assert serialize_object(MaybeDictable(name="vars")) == {"name": "vars"}
+
+
+def test_serialize_caches_do_not_keep_runtime_types_alive():
+    from ellar.common.serializer.base import (
+        _config_encoders,
+        _mapping_getters,
+        _serialize_handlers,
+    )
+
+    def serialize_runtime_types():
+        model_type = create_model(
+            "RuntimeModel",
+            created=(datetime, ...),
+            __config__=type("Config", (), {"json_encoders": {datetime: str}}),
+        )
+        person_type = type("RuntimePerson", (DictablePerson,), {})
+        assert serialize_object(
+            [model_type(created=datetime(2023, 1, 1)), person_type(name="Foo")]
+        ) == [{"created": "2023-01-01 00:00:00"}, {"name": "Foo"}]
+        assert model_type in _serialize_handlers
+        assert model_type.__config__ in _config_encoders
+        assert person_type in _mapping_getters
+        return weakref.ref(model_type), weakref.ref(person_type)
+
+    model_ref, person_ref = serialize_runtime_types()
+    gc.collect()
+    assert model_ref() is None
+    assert person_ref() is None
+
+
+def test_serializer_filter_kwargs_are_cached():
+    serializer_filter = SerializerFilter(exclude={"cat"})
+    kwargs = serializer_filter.get_kwargs()
+    assert kwargs == serializer_filter.dict()
+    assert serializer_filter.get_kwargs() is kwargs
+    with pytest.raises(TypeError):
+        kwargs["exclude_none"] = True  # type: ignore[index]
+
+    serializer_filter.exclude_none = True
+    assert serializer_filter.get_kwargs()["exclude_none"] is True
+    assert serialize_object(
+        [ModelWithDefault(foo="foo")], serializer_filter=serializer_filter
+    ) == [{"foo": "foo", "bar": "bar", "bla": "bla"}]
+
+
+def test_serializer_filter_kwargs_follow_include_and_exclude_changes():
+    serializer_filter = SerializerFilter(exclude={"bar"})
+    assert serializer_filter.exclude == frozenset({"bar"})
+    with pytest.raises(AttributeError):
+        serializer_filter.exclude.add("bla")  # type: ignore[union-attr]
+
+    serializer_filter.exclude = {"bla"}
+    assert serializer_filter.get_kwargs()["exclude"] == frozenset({"bla"})
+
+    nested_filter = SerializerFilter(exclude={"foo": ..., "cat": ...})
+    assert ModelWithDefault(foo="foo").dict(**nested_filter.get_kwargs()) == {
+        "bar": "bar",
+        "bla": "bla",
+    }
+    nested_filter.exclude["bar"] = ...  # type: ignore[index]
+    assert ModelWithDefault(foo="foo").dict(**nested_filter.get_kwargs()) == {
+        "bla": "bla"
+    }
+
+
+class Color(Enum):
+    red = "red"
+
+
+@dataclass
+class DataclassEvent(DataclassSerializer):
+    id: int
+    name: str
+    color: Color = Color.red
+    created: datetime = datetime(2020, 1, 1)
+    score: t.Optional[float] = None
+
+
+@dataclass
+class DataclassTags(DataclassSerializer):
+    id: int
+    tags: t.List[str]
+
+
+@pytest.mark.parametrize(
+    "serializer_filter",
+    [
+        SerializerFilter(),
+        SerializerFilter(include={"id", "score"}),
+        SerializerFilter(exclude={"name"}),
+        SerializerFilter(exclude_none=True),
+        SerializerFilter(exclude_defaults=True),
+        SerializerFilter(exclude_unset=True, by_alias=False),
+    ],
+)
+def test_dataclass_serializer_fields_plan(serializer_filter):
+    event = DataclassEvent(id=1, name="Event", score=2.5)
+    assert DataclassEvent.get_fields_plan() is not None
+    assert event.serialize(
+        serializer_filter
+    ) == DataclassEvent.get_pydantic_model().from_orm(event).dict(
+        **serializer_filter.get_kwargs()
+    )
+
+
+def test_dataclass_serializer_validates_when_coercion_is_needed():
+    event = DataclassEvent(id="1", name="Event", score=2)  # type: ignore[arg-type]
+    assert event.serialize() == {
+        "id": 1,
+        "name": "Event",
+        "color": Color.red,
+        "created": datetime(2020, 1, 1),
+        "score": 2.0,
+    }
+    assert type(event.serialize()["score"]) is float
+
+    with pytest.raises(ValidationError):
+        DataclassEvent(id=None, name="Event").serialize()  # type: ignore[arg-type]
+
+    assert DataclassTags.get_fields_plan() is None
+    assert DataclassTags(id=1, tags=["a"]).serialize(
+        SerializerFilter(exclude={"id"})
+    ) == {"tags": ["a"]}